@@ -18,6 +18,44 @@ async function request<T>(
   return data as T;
 }
 
+// POST that answers with Server-Sent Events; calls onEvent per frame until the
+// stream closes. (EventSource only supports GET, so the body is read by hand.)
+async function streamRequest(
+  path: string,
+  body: unknown,
+  onEvent: (event: CampaignStreamEvent) => void
+): Promise<void> {
+  const res = await fetch(`${API_BASE}${path}`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json', Accept: 'text/event-stream' },
+    body: JSON.stringify(body),
+  });
+  if (!res.ok || !res.body) {
+    const data = await res.json().catch(() => ({}));
+    throw new Error(data.detail || res.statusText || 'Request failed');
+  }
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    let sep: number;
+    while ((sep = buffer.indexOf('\n\n')) !== -1) {
+      const frame = buffer.slice(0, sep);
+      buffer = buffer.slice(sep + 2);
+      let event = 'message';
+      let data = '';
+      for (const line of frame.split('\n')) {
+        if (line.startsWith('event:')) event = line.slice(6).trim();
+        else if (line.startsWith('data:')) data += line.slice(5).trim();
+      }
+      if (data) onEvent({ event, data: JSON.parse(data) } as CampaignStreamEvent);
+    }
+  }
+}
+
 export const api = {
   health: () => request<{ status: string }>('/health'),
 
@@ -33,15 +71,29 @@ export const api = {
   },
 
   campaigns: {
-    list: (brandId: string) =>
-      request<Campaign[]>(`/brands/${brandId}/campaigns`),
+    list: (brandId: string, cursor?: string | null) =>
+      request<CampaignPage>(
+        `/brands/${brandId}/campaigns${cursor ? `?cursor=${encodeURIComponent(cursor)}` : ''}`
+      ),
     get: (brandId: string, campaignId: string) =>
       request<Campaign>(`/brands/${brandId}/campaigns/${campaignId}`),
+    status: (brandId: string, campaignId: string) =>
+      request<CampaignStatus>(`/brands/${brandId}/campaigns/${campaignId}/status`),
     create: (brandId: string, body: { goal: string; target_audience: string; budget: number }) =>
       request<CampaignCreateResponse>(`/brands/${brandId}/campaigns/`, {
         method: 'POST',
         body: JSON.stringify({ brand_id: brandId, ...body }),
       }),
+    resume: (brandId: string, campaignId: string) =>
+      request<CampaignCreateResponse>(`/brands/${brandId}/campaigns/${campaignId}/resume`, {
+        method: 'POST',
+      }),
+    stream: (
+      brandId: string,
+      body: { goal: string; target_audience: string; budget: number },
+      onEvent: (event: CampaignStreamEvent) => void
+    ) =>
+      streamRequest(`/brands/${brandId}/campaigns/stream`, { brand_id: brandId, ...body }, onEvent),
     delete: (brandId: string, campaignId: string) =>
       request<void>(`/brands/${brandId}/campaigns/${campaignId}`, { method: 'DELETE' }),
   },
@@ -95,16 +147,50 @@ export interface Campaign {
   target_audience: string;
   budget: number;
   research?: unknown;
+  research_reused?: boolean;
   strategy?: unknown;
   content?: unknown;
   qa_report?: unknown;
   analytics?: unknown;
+  failed_channels?: string[];
   created_at?: string;
   updated_at?: string;
 }
 
+// List rows carry summary fields only; result blobs come from campaigns.get.
+export interface CampaignPage {
+  items: Campaign[];
+  next_cursor: string | null;
+}
+
 export interface CampaignCreateResponse {
   id: string;
   status: string;
-  research?: unknown;
+}
+
+export type CampaignStreamEvent =
+  | { event: 'campaign'; data: { id: string; status: string } }
+  | { event: 'node_start'; data: { node: string } }
+  | { event: 'content_asset'; data: { node: string; asset: ContentAsset } }
+  | {
+      event: 'node_end';
+      data: { node: string; update: Record<string, unknown>; completed_nodes: string[] };
+    }
+  | { event: 'done'; data: { id: string; status: string; failed_channels: string[] } }
+  | { event: 'error'; data: { id: string; status: string; error: string } };
+
+export interface ContentAsset {
+  headline: string;
+  body: string;
+  call_to_action: string;
+  channel: string;
+}
+
+export interface CampaignStatus {
+  id: string;
+  status: string;
+  completed_nodes: string[];
+  failed_channels?: string[];
+  error?: string | null;
+  updated_at: string;
 }
@@ -1,8 +1,14 @@
 import { useState, useEffect, useCallback } from 'react'
-import { api, BrandSummary, Campaign, CampaignCreateResponse } from '../api'
+import { api, BrandSummary, Campaign, CampaignStatus, CampaignStreamEvent, ContentAsset } from '../api'
 
 type Toast = { id: number; type: 'success' | 'error'; text: string }
 
+const ACTIVE_STATUSES = ['queued', 'running']
+const STATUS_POLL_MS = 3000
+const GRAPH_NODES = ['research', 'strategy', 'content', 'qa', 'analytics', 'publish']
+
+type NodeProgress = Record<string, 'running' | 'done'>
+
 function useToast() {
   const [toasts, setToasts] = useState<Toast[]>([])
   const add = useCallback((type: 'success' | 'error', text: string) => {
@@ -20,10 +26,15 @@ export default function CampaignsTab() {
   const [selectedBrandId, setSelectedBrandId] = useState<string>('')
   const [campaigns, setCampaigns] = useState<Campaign[]>([])
   const [campaignsLoading, setCampaignsLoading] = useState(false)
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
+  const [moreLoading, setMoreLoading] = useState(false)
   const [selectedCampaign, setSelectedCampaign] = useState<Campaign | null>(null)
   const [detailLoading, setDetailLoading] = useState(false)
   const [createForm, setCreateForm] = useState({ goal: '', target_audience: '', budget: '' })
   const [createLoading, setCreateLoading] = useState(false)
+  const [streamingId, setStreamingId] = useState<string | null>(null)
+  const [nodeProgress, setNodeProgress] = useState<NodeProgress>({})
+  const [streamedAssets, setStreamedAssets] = useState<ContentAsset[]>([])
   const [deleteLoading, setDeleteLoading] = useState<string | null>(null)
   const [expandedId, setExpandedId] = useState<string | null>(null)
   const [deleteConfirm, setDeleteConfirm] = useState<string | null>(null)
@@ -40,26 +51,70 @@ export default function CampaignsTab() {
     (brandId: string) => {
       if (!brandId) {
         setCampaigns([])
+        setNextCursor(null)
         return
       }
       setCampaignsLoading(true)
       setCampaigns([])
+      setNextCursor(null)
       setSelectedCampaign(null)
       setExpandedId(null)
       api.campaigns
         .list(brandId)
-        .then(setCampaigns)
+        .then((page) => {
+          setCampaigns(page.items)
+          setNextCursor(page.next_cursor)
+        })
         .catch(() => addToast('error', 'Failed to load campaigns'))
         .finally(() => setCampaignsLoading(false))
     },
     [addToast]
   )
 
+  const loadMoreCampaigns = async () => {
+    if (!selectedBrandId || !nextCursor) return
+    setMoreLoading(true)
+    try {
+      const page = await api.campaigns.list(selectedBrandId, nextCursor)
+      setCampaigns((list) => [...list, ...page.items])
+      setNextCursor(page.next_cursor)
+    } catch {
+      addToast('error', 'Failed to load more campaigns')
+    } finally {
+      setMoreLoading(false)
+    }
+  }
+
   useEffect(() => {
     if (selectedBrandId) loadCampaigns(selectedBrandId)
     else setCampaigns([])
   }, [selectedBrandId, loadCampaigns])
 
+  // Campaign runs are queued in the background — poll the lightweight status
+  // endpoint for queued/running rows and patch them in place until they finish.
+  useEffect(() => {
+    if (!selectedBrandId) return
+    // The campaign being streamed reports its own progress — don't poll it.
+    const active = campaigns.filter((c) => ACTIVE_STATUSES.includes(c.status) && c.id !== streamingId)
+    if (active.length === 0) return
+    const timer = setTimeout(async () => {
+      const updates = await Promise.all(
+        active.map((c) => api.campaigns.status(selectedBrandId, c.id).catch(() => null))
+      )
+      const byId = new Map<string, CampaignStatus>()
+      for (const s of updates) if (s) byId.set(s.id, s)
+      if (byId.size === 0) return
+      if ([...byId.values()].some((s) => !ACTIVE_STATUSES.includes(s.status))) {
+        loadCampaigns(selectedBrandId)
+        return
+      }
+      setCampaigns((list) =>
+        list.map((c) => (byId.has(c.id) ? { ...c, status: byId.get(c.id)!.status } : c))
+      )
+    }, STATUS_POLL_MS)
+    return () => clearTimeout(timer)
+  }, [campaigns, selectedBrandId, loadCampaigns, streamingId])
+
   const loadCampaignDetail = async (brandId: string, campaignId: string) => {
     setDetailLoading(true)
     setSelectedCampaign(null)
@@ -86,19 +141,61 @@ export default function CampaignsTab() {
       return
     }
     setCreateLoading(true)
+    setNodeProgress({})
+    setStreamedAssets([])
+    const brandId = selectedBrandId
+    // Stream the run: the row appears as soon as it is persisted, and each
+    // graph node reports start/finish instead of the form blocking for minutes.
+    const onEvent = (ev: CampaignStreamEvent) => {
+      switch (ev.event) {
+        case 'campaign':
+          setStreamingId(ev.data.id)
+          setCreateForm({ goal: '', target_audience: '', budget: '' })
+          loadCampaigns(brandId)
+          break
+        case 'node_start': {
+          // Per-channel content tasks report as the content step
+          const node = ev.data.node === 'content_channel' ? 'content' : ev.data.node
+          setNodeProgress((p) => ({ ...p, [node]: 'running' }))
+          break
+        }
+        case 'content_asset':
+          setStreamedAssets((a) => [...a, ev.data.asset])
+          break
+        case 'node_end':
+          setNodeProgress((p) => ({ ...p, [ev.data.node]: 'done' }))
+          break
+        case 'done':
+          addToast('success', `Campaign ${ev.data.id} ${ev.data.status}`)
+          break
+        case 'error':
+          addToast('error', `Campaign ${ev.data.id} failed: ${ev.data.error}`)
+          break
+      }
+    }
     try {
-      const res: CampaignCreateResponse = await api.campaigns.create(selectedBrandId, {
-        goal: createForm.goal,
-        target_audience: createForm.target_audience,
-        budget,
-      })
-      addToast('success', `Campaign created: ${res.id} (${res.status})`)
-      setCreateForm({ goal: '', target_audience: '', budget: '' })
-      loadCampaigns(selectedBrandId)
+      await api.campaigns.stream(
+        brandId,
+        { goal: createForm.goal, target_audience: createForm.target_audience, budget },
+        onEvent
+      )
     } catch (err) {
       addToast('error', err instanceof Error ? err.message : 'Create campaign failed')
     } finally {
       setCreateLoading(false)
+      setStreamingId(null)
+      loadCampaigns(brandId)
+    }
+  }
+
+  const handleResume = async (brandId: string, campaignId: string) => {
+    try {
+      const res = await api.campaigns.resume(brandId, campaignId)
+      addToast('success', `Campaign resumed: ${res.id} (${res.status})`)
+      setExpandedId(null)
+      loadCampaigns(brandId)
+    } catch (err) {
+      addToast('error', err instanceof Error ? err.message : 'Failed to resume campaign')
     }
   }
 
@@ -228,6 +325,12 @@ export default function CampaignsTab() {
                                   <span className="campaign-detail-label">Budget</span>
                                   <span>{formatCurrency(Number(selectedCampaign.budget))}</span>
                                 </div>
+                                {selectedCampaign.research_reused && (
+                                  <div className="campaign-detail-field">
+                                    <span className="campaign-detail-label">Research</span>
+                                    <span>Reused from a recent campaign</span>
+                                  </div>
+                                )}
                                 {selectedCampaign.created_at && (
                                   <div className="campaign-detail-field">
                                     <span className="campaign-detail-label">Created</span>
@@ -259,6 +362,15 @@ export default function CampaignsTab() {
                                 >
                                   Close
                                 </button>
+                                {selectedCampaign.status === 'error' && (
+                                  <button
+                                    type="button"
+                                    className="btn btn-primary btn-sm"
+                                    onClick={() => handleResume(selectedBrandId, c.id)}
+                                  >
+                                    Resume
+                                  </button>
+                                )}
                                 {deleteConfirm === c.id ? (
                                   <>
                                     <span className="campaign-delete-confirm">Delete this campaign?</span>
@@ -299,6 +411,16 @@ export default function CampaignsTab() {
                   ))}
                 </ul>
               )}
+              {!campaignsLoading && nextCursor && (
+                <button
+                  type="button"
+                  className="btn btn-ghost btn-sm"
+                  onClick={loadMoreCampaigns}
+                  disabled={moreLoading}
+                >
+                  {moreLoading ? 'Loading…' : 'Load more'}
+                </button>
+              )}
 
               <div className="card campaigns-create-section">
                 <h2 className="campaigns-section-head">Create campaign</h2>
@@ -337,10 +459,30 @@ export default function CampaignsTab() {
                   </div>
                   <div className="form-actions">
                     <button type="submit" className="btn btn-primary" disabled={createLoading}>
-                      {createLoading ? 'Creating…' : 'Create campaign'}
+                      {createLoading ? 'Running…' : 'Create campaign'}
                     </button>
                   </div>
                 </form>
+                {Object.keys(nodeProgress).length > 0 && (
+                  <ol className="campaign-progress">
+                    {GRAPH_NODES.map((node) => (
+                      <li key={node} className={`campaign-progress-step ${nodeProgress[node] ?? 'pending'}`}>
+                        {node}
+                      </li>
+                    ))}
+                  </ol>
+                )}
+                {streamedAssets.length > 0 && (
+                  <ul className="campaign-stream-assets">
+                    {streamedAssets.map((a, i) => (
+                      <li key={i} className="campaign-stream-asset">
+                        <span className="campaign-detail-label">{a.channel}</span>
+                        <strong>{a.headline}</strong>
+                        <span>{a.call_to_action}</span>
+                      </li>
+                    ))}
+                  </ul>
+                )}
               </div>
             </>
           )}
@@ -1,10 +1,16 @@
 # app/agents/analytics_agent.py
 import json
-from typing import Any, Dict
+import logging
+from typing import Any, Dict, List
 
-from app.schemas.analytics import AnalyticsReport
+from app.agents.prompt_payload import to_prompt_json
+from app.core.settings import settings
+from app.schemas.analytics import AnalyticsReport, BudgetSplit
+from app.services import analytics_service
 from app.services.llm.llm_factory import LLMFactory
 
+logger = logging.getLogger("agents.analytics")
+
 SYSTEM_PROMPT = """You are a digital marketing analytics expert specialising in pre-launch campaign projection modelling.
 
 Given a campaign's budget, channels, content, and goal, produce a realistic pre-launch forecast.
@@ -22,6 +28,14 @@ Conversion rate reflects goal completions (e.g. installs, sign-ups) as a percent
 
 Output valid JSON only — no markdown, no code fences, no commentary. Return exactly one JSON object."""
 
+SPLIT_SYSTEM_PROMPT = """You are a digital marketing media planner.
+
+Given a campaign's budget, channels, content, and goal, decide how to split the budget across the channels.
+Weigh each channel's expected return for the stated goal and audience — not just its reach.
+Impressions, clicks and totals are computed separately from benchmarks; only return the split.
+
+Output valid JSON only — no markdown, no code fences, no commentary. Return exactly one JSON object."""
+
 
 def _build_user_prompt(
     content: Dict[str, Any],
@@ -39,7 +53,7 @@ TOTAL BUDGET (USD): ${budget:,.2f}
 CHANNELS IN USE: {json.dumps(strategy.get("channels", []))}
 
 CONTENT ASSETS:
-{json.dumps(content.get("assets", []), indent=2)}
+{to_prompt_json(content.get("assets", []))}
 
 Forecast the expected performance if this campaign launches today.
 Distribute the budget intelligently across the channels based on what will most efficiently achieve the goal.
@@ -48,10 +62,79 @@ Ensure aggregated totals are arithmetically consistent with the channel-level br
 Produce your forecast as a single JSON object.""".strip()
 
 
+def _build_split_prompt(
+    content: Dict[str, Any],
+    channels: List[str],
+    goal: str,
+    target_audience: str,
+    budget: float,
+) -> str:
+    return f"""Split this campaign's budget across its channels.
+
+CAMPAIGN GOAL: {goal}
+TARGET AUDIENCE: {target_audience}
+TOTAL BUDGET (USD): ${budget:,.2f}
+
+CHANNELS IN USE: {json.dumps(channels)}
+
+CONTENT ASSETS:
+{to_prompt_json(content.get("assets", []))}
+
+Return one allocation per channel, as a percentage of the total budget.
+Produce your split as a single JSON object.""".strip()
+
+
+def _forecast_channels(content: Dict[str, Any], strategy: Dict[str, Any]) -> List[str]:
+    channels = [c for c in strategy.get("channels") or [] if c]
+    if not channels:
+        channels = [a.get("channel") for a in content.get("assets", []) if a.get("channel")]
+    return list(dict.fromkeys(channels))
+
+
+def _fold(name: str) -> str:
+    return " ".join(name.split()).casefold()
+
+
+def _split_shares(split: BudgetSplit, channels: List[str]) -> List[float]:
+    """LLM allocations in channel order; channels it left out get nothing."""
+    by_name: Dict[str, float] = {}
+    for allocation in split.allocations:
+        key = _fold(allocation.channel_name)
+        by_name[key] = by_name.get(key, 0.0) + allocation.budget_share
+    return [by_name.get(_fold(c), 0.0) for c in channels]
+
+
 class AnalyticsAgent:
+    """
+    ANALYTICS_MODE:
+      deterministic — benchmark forecast (app.services.analytics_service), no LLM call
+      llm_split     — the LLM picks the budget split, the engine does the math
+      llm           — the LLM produces the whole report
+    """
+
     def __init__(self) -> None:
         self.llm = LLMFactory.get_llm(agent_type="analytics")
 
+    def _forecast(
+        self,
+        channels: List[str],
+        goal: str,
+        budget: float,
+        split: BudgetSplit | None = None,
+    ) -> AnalyticsReport:
+        report = analytics_service.forecast(
+            channels,
+            budget,
+            goal,
+            shares=_split_shares(split, channels) if split is not None else None,
+            simulations=settings.analytics_simulations,
+        )
+        logger.info(
+            f"AnalyticsAgent | mode={settings.analytics_mode} | channels={len(channels)} "
+            f"| impressions={report.total_impressions} | clicks={report.total_clicks}"
+        )
+        return report
+
     def run(
         self,
         content: Dict[str, Any] | None,
@@ -62,16 +145,21 @@ class AnalyticsAgent:
     ) -> AnalyticsReport:
         if not content or not content.get("assets"):
             # Return zero-state if content is missing — avoids LLM hallucinating channels
-            from app.schemas.analytics import ChannelPerformance
-            return AnalyticsReport(
-                total_impressions=0,
-                total_clicks=0,
-                overall_ctr=0.0,
-                conversion_rate=0.0,
-                channel_breakdown=[
-                    ChannelPerformance(channel_name="no_content", impressions=0, clicks=0, ctr=0.0)
-                ],
+            return _zero_report()
+
+        channels = _forecast_channels(content, strategy or {})
+        if settings.analytics_mode == "deterministic" and channels:
+            return self._forecast(channels, goal, budget)
+
+        if settings.analytics_mode == "llm_split" and channels:
+            split: BudgetSplit = self.llm.generate(
+                system_prompt=SPLIT_SYSTEM_PROMPT,
+                user_prompt=_build_split_prompt(
+                    content, channels, goal, target_audience, budget
+                ),
+                response_schema=BudgetSplit,
             )
+            return self._forecast(channels, goal, budget, split)
 
         result: AnalyticsReport = self.llm.generate(
             system_prompt=SYSTEM_PROMPT,
@@ -84,4 +172,55 @@ class AnalyticsAgent:
             ),
             response_schema=AnalyticsReport,
         )
-        return result
\ No newline at end of file
+        return result
+
+    async def arun(
+        self,
+        content: Dict[str, Any] | None,
+        strategy: Dict[str, Any] | None = None,
+        goal: str = "",
+        target_audience: str = "",
+        budget: float = 0.0,
+    ) -> AnalyticsReport:
+        if not content or not content.get("assets"):
+            return _zero_report()
+
+        channels = _forecast_channels(content, strategy or {})
+        if settings.analytics_mode == "deterministic" and channels:
+            return self._forecast(channels, goal, budget)
+
+        if settings.analytics_mode == "llm_split" and channels:
+            split: BudgetSplit = await self.llm.agenerate(
+                system_prompt=SPLIT_SYSTEM_PROMPT,
+                user_prompt=_build_split_prompt(
+                    content, channels, goal, target_audience, budget
+                ),
+                response_schema=BudgetSplit,
+            )
+            return self._forecast(channels, goal, budget, split)
+
+        result: AnalyticsReport = await self.llm.agenerate(
+            system_prompt=SYSTEM_PROMPT,
+            user_prompt=_build_user_prompt(
+                content or {},
+                strategy or {},
+                goal,
+                target_audience,
+                budget,
+            ),
+            response_schema=AnalyticsReport,
+        )
+        return result
+
+
+def _zero_report() -> AnalyticsReport:
+    from app.schemas.analytics import ChannelPerformance
+    return AnalyticsReport(
+        total_impressions=0,
+        total_clicks=0,
+        overall_ctr=0.0,
+        conversion_rate=0.0,
+        channel_breakdown=[
+            ChannelPerformance(channel_name="no_content", impressions=0, clicks=0, ctr=0.0)
+        ],
+    )
\ No newline at end of file
@@ -1,11 +1,11 @@
 # app/agents/content_agent.py
-import json
 import logging
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
-from app.schemas.content import ContentOutput
+from app.agents.prompt_payload import brand_payload, to_prompt_json
+from app.schemas.content import ContentAsset, ContentOutput
 from app.services.llm.llm_factory import LLMFactory
-from app.tools import CONTENT_TOOLS
+from app.tools import CONTENT_TOOLS, prefetch_calls
 
 logger = logging.getLogger("agents.content")
 
@@ -20,6 +20,10 @@ Quality standards:
 Output valid JSON only — no markdown, no code fences, no commentary. Return exactly one JSON object."""
 
 
+def _brand_id(brand_context: Dict[str, Any]) -> str:
+    return str(brand_context.get("id", brand_context.get("_id", "")))
+
+
 def _build_user_prompt(
     strategy: Dict[str, Any],
     brand_context: Dict[str, Any],
@@ -27,13 +31,13 @@ def _build_user_prompt(
     target_audience: str,
     budget: float,
 ) -> str:
-    brand_id = brand_context.get("id", brand_context.get("_id", ""))
+    brand_id = _brand_id(brand_context)
     return f"""Write campaign content assets for each channel in the strategy below.
 
 BRAND ID: {brand_id}
 
 BRAND CONTEXT:
-{json.dumps(brand_context, indent=2)}
+{brand_payload(brand_context, "content")}
 
 CAMPAIGN GOAL:
 {goal}
@@ -44,11 +48,50 @@ TARGET AUDIENCE:
 BUDGET (USD): ${budget:,.2f}
 
 STRATEGY:
-{json.dumps(strategy, indent=2)}
+{to_prompt_json(strategy)}
 
 Use your tools where needed, then produce one content asset per channel as a single JSON object.""".strip()
 
 
+def _build_channel_prompt(
+    channel: str,
+    strategy: Dict[str, Any],
+    brand_context: Dict[str, Any],
+    goal: str,
+    target_audience: str,
+    budget: float,
+) -> str:
+    brand_id = _brand_id(brand_context)
+    return f"""Write the campaign content asset for ONE channel of the strategy below.
+
+CHANNEL: {channel}
+
+BRAND ID: {brand_id}
+
+BRAND CONTEXT:
+{brand_payload(brand_context, "content")}
+
+CAMPAIGN GOAL:
+{goal}
+
+TARGET AUDIENCE:
+{target_audience}
+
+BUDGET (USD): ${budget:,.2f}
+
+STRATEGY:
+{to_prompt_json(strategy)}
+
+Use your tools where needed, then produce the single content asset for the {channel} channel as one JSON object (channel = "{channel}").""".strip()
+
+
+def _pin_channel(asset: ContentAsset, channel: str) -> ContentAsset:
+    """The asset belongs to the channel it was requested for, whatever the model wrote."""
+    if asset.channel != channel:
+        asset = asset.model_copy(update={"channel": channel})
+    return asset
+
+
 class ContentAgent:
     def __init__(self) -> None:
         self.llm = LLMFactory.get_llm(agent_type="content")
@@ -76,8 +119,114 @@ class ContentAgent:
                 budget,
             ),
             tools=CONTENT_TOOLS,
+            prefetch=prefetch_calls(CONTENT_TOOLS, _brand_id(brand_context)),
             response_schema=ContentOutput,
             max_steps=4,
         )
         logger.info("ContentAgent.run | complete")
-        return result
\ No newline at end of file
+        return result
+
+    async def arun(
+        self,
+        strategy: Dict[str, Any] | None,
+        brand_context: Dict[str, Any] | None = None,
+        goal: str = "",
+        target_audience: str = "",
+        budget: float = 0.0,
+        on_asset: Callable[[ContentAsset], None] | None = None,
+    ) -> ContentOutput:
+        """
+        Async `run`. With `on_asset`, the final synthesis is streamed and the
+        callback receives each ContentAsset as soon as the model closes it.
+        """
+        brand_context = brand_context or {}
+        logger.info(
+            "ContentAgent.arun | brand=%s | goal=%s",
+            brand_context.get("name", "?"), goal[:80],
+        )
+        kwargs = dict(
+            system_prompt=SYSTEM_PROMPT,
+            user_prompt=_build_user_prompt(
+                strategy or {},
+                brand_context,
+                goal,
+                target_audience,
+                budget,
+            ),
+            tools=CONTENT_TOOLS,
+            prefetch=prefetch_calls(CONTENT_TOOLS, _brand_id(brand_context)),
+            response_schema=ContentOutput,
+            max_steps=4,
+        )
+        if on_asset is None:
+            result: ContentOutput = await self.llm.agenerate_with_tools(**kwargs)
+        else:
+            async for value in self.llm.astream_generate_with_tools(**kwargs):
+                if isinstance(value, ContentAsset):
+                    on_asset(value)
+                else:
+                    result = value
+        logger.info("ContentAgent.arun | complete")
+        return result
+
+    # ------------------------------------------------------------------
+    # Per-channel generation (content fan-out)
+    # ------------------------------------------------------------------
+
+    def run_channel(
+        self,
+        channel: str,
+        strategy: Dict[str, Any] | None,
+        brand_context: Dict[str, Any] | None = None,
+        goal: str = "",
+        target_audience: str = "",
+        budget: float = 0.0,
+    ) -> ContentAsset:
+        """Write the asset for a single strategy channel."""
+        brand_context = brand_context or {}
+        logger.info("ContentAgent.run_channel | channel=%s", channel)
+        asset: ContentAsset = self.llm.generate_with_tools(
+            system_prompt=SYSTEM_PROMPT,
+            user_prompt=_build_channel_prompt(
+                channel,
+                strategy or {},
+                brand_context,
+                goal,
+                target_audience,
+                budget,
+            ),
+            tools=CONTENT_TOOLS,
+            prefetch=prefetch_calls(CONTENT_TOOLS, _brand_id(brand_context)),
+            response_schema=ContentAsset,
+            max_steps=4,
+        )
+        return _pin_channel(asset, channel)
+
+    async def arun_channel(
+        self,
+        channel: str,
+        strategy: Dict[str, Any] | None,
+        brand_context: Dict[str, Any] | None = None,
+        goal: str = "",
+        target_audience: str = "",
+        budget: float = 0.0,
+    ) -> ContentAsset:
+        """Async `run_channel`."""
+        brand_context = brand_context or {}
+        logger.info("ContentAgent.arun_channel | channel=%s", channel)
+        asset: ContentAsset = await self.llm.agenerate_with_tools(
+            system_prompt=SYSTEM_PROMPT,
+            user_prompt=_build_channel_prompt(
+                channel,
+                strategy or {},
+                brand_context,
+                goal,
+                target_audience,
+                budget,
+            ),
+            tools=CONTENT_TOOLS,
+            prefetch=prefetch_calls(CONTENT_TOOLS, _brand_id(brand_context)),
+            response_schema=ContentAsset,
+            max_steps=4,
+        )
+        return _pin_channel(asset, channel)
\ No newline at end of file
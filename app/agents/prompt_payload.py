@@ -0,0 +1,120 @@
+# app/agents/prompt_payload.py
+"""
+Prompt serialization for agent payloads (brand context, research,
+strategy, content assets).
+
+  - compact JSON: no indentation or separator spaces
+  - empty values (None, "", [], {}) are dropped at every level
+  - brand context goes through a per-agent field whitelist — ids,
+    timestamps and past campaign ids never reach a prompt
+  - research longer than PROMPT_RESEARCH_MAX_CHARS is summarized: long
+    text fields are cut to their leading sentences, long lists to their
+    first items
+
+PROMPT_COMPACT=false restores the previous pretty-printed, unfiltered
+payloads (benchmarks/bench_prompt_tokens.py compares the two).
+"""
+import json
+import re
+from typing import Any, Iterable
+
+from app.core.settings import settings
+
+# Dotted paths of brand_context each agent sees.
+BRAND_FIELDS: dict[str, tuple[str, ...]] = {
+    "research": ("name", "description", "industry", "usp", "target_audience"),
+    "strategy": (
+        "name", "description", "industry", "tone", "usp", "target_audience",
+        "memory.brand_guidelines", "memory.latest_insights",
+    ),
+    "content": (
+        "name", "description", "industry", "tone", "usp", "target_audience",
+        "memory.brand_guidelines",
+    ),
+}
+
+_EMPTY = (None, "", [], {})
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def prune(value: Any) -> Any:
+    """Drop empty values (None, "", [], {}) recursively."""
+    if isinstance(value, dict):
+        pruned = {k: prune(v) for k, v in value.items()}
+        return {k: v for k, v in pruned.items() if v not in _EMPTY}
+    if isinstance(value, list):
+        pruned = [prune(v) for v in value]
+        return [v for v in pruned if v not in _EMPTY]
+    return value
+
+
+def pick(data: dict[str, Any], paths: Iterable[str]) -> dict[str, Any]:
+    """Nested sub-dict of `data` holding only the given dotted paths."""
+    out: dict[str, Any] = {}
+    for path in paths:
+        *parents, leaf = path.split(".")
+        source, target = data, out
+        for key in parents:
+            source = source.get(key) if isinstance(source, dict) else None
+            target = target.setdefault(key, {})
+        if isinstance(source, dict) and leaf in source:
+            target[leaf] = source[leaf]
+    return out
+
+
+def to_prompt_json(value: Any) -> str:
+    """Serialize a prompt payload — compact and pruned unless PROMPT_COMPACT is off."""
+    if not settings.prompt_compact:
+        return json.dumps(value, indent=2)
+    return json.dumps(prune(value), separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def brand_payload(brand_context: dict[str, Any], agent: str) -> str:
+    """brand_context restricted to `agent`'s BRAND_FIELDS, serialized."""
+    if not settings.prompt_compact:
+        return to_prompt_json(brand_context)
+    return to_prompt_json(pick(brand_context, BRAND_FIELDS[agent]))
+
+
+def _shorten(text: str, limit: int) -> str:
+    """Leading whole sentences of `text` that fit in `limit` chars (at least one, hard-cut)."""
+    if len(text) <= limit:
+        return text
+    kept = ""
+    for sentence in _SENTENCE_END.split(text):
+        if len(kept) + len(sentence) + 1 > limit:
+            break
+        kept = f"{kept} {sentence}".strip()
+    return kept or text[:limit].rstrip() + "…"
+
+
+def summarize_research(research: dict[str, Any], max_chars: int) -> dict[str, Any]:
+    """
+    Fit research into roughly `max_chars` of compact JSON: each text field is
+    shortened to its leading sentences, then list fields (insights,
+    competitors) are cut to their first items, tightening until it fits.
+    """
+    for text_limit, list_limit in ((400, 8), (250, 5), (150, 3), (80, 3)):
+        summary = _summarize(research, text_limit, list_limit)
+        if len(to_prompt_json(summary)) <= max_chars:
+            break
+    return summary
+
+
+def _summarize(value: Any, text_limit: int, list_limit: int) -> Any:
+    if isinstance(value, dict):
+        return {k: _summarize(v, text_limit, list_limit) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_summarize(v, text_limit, list_limit) for v in value[:list_limit]]
+    if isinstance(value, str):
+        return _shorten(value, text_limit)
+    return value
+
+
+def research_payload(research: dict[str, Any]) -> str:
+    """Research serialized for a prompt, summarized when over PROMPT_RESEARCH_MAX_CHARS."""
+    text = to_prompt_json(research)
+    limit = settings.prompt_research_max_chars
+    if not settings.prompt_compact or limit <= 0 or len(text) <= limit:
+        return text
+    return to_prompt_json(summarize_research(research, limit))
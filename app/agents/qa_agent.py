@@ -1,10 +1,18 @@
 # app/agents/qa_agent.py
+import asyncio
+import hashlib
 import json
 import logging
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
+from app.agents.prompt_payload import to_prompt_json
+from app.core.cache import CacheBackend, build_cache_backend
+from app.core.settings import settings
 from app.schemas.qa import QAReport
 from app.services.llm.llm_factory import LLMFactory
+from app.validators.rule_engine import RuleFindings, run_rules
 
 logger = logging.getLogger("agents.qa")
 
@@ -25,6 +33,24 @@ RECOMMENDATIONS — quality improvements, does not block publishing:
 Set "passed" to true if there are zero critical issues.
 Output valid JSON only — no markdown, no code fences, no commentary. Return exactly one JSON object."""
 
+ASSET_SYSTEM_PROMPT = """You are a senior campaign QA reviewer checking ONE marketing asset before it goes live.
+
+Classify every finding into one of two buckets:
+
+CRITICAL — blocks publishing:
+- Content restriction violation
+- Asset has no CTA at all
+- Asset format completely wrong for its channel
+
+RECOMMENDATIONS — quality improvements, does not block publishing:
+- Generic copy, weak hook
+- CTA exists but could be sharper
+- Tone or brand voice could be stronger
+
+Start every finding with the asset's channel name.
+Set "passed" to true if there are zero critical issues.
+Output valid JSON only — no markdown, no code fences, no commentary. Return exactly one JSON object."""
+
 def _extract_restrictions(brand_context: Dict[str, Any]) -> list:
     """
     Content restrictions live inside memory.brand_guidelines, not at the
@@ -44,12 +70,20 @@ def _extract_restrictions(brand_context: Dict[str, Any]) -> list:
     return getattr(guidelines, "content_restrictions", [])
 
 
+def _notes_block(notes: List[str]) -> str:
+    if not notes:
+        return ""
+    lines = "\n".join(f"- {note}" for note in notes)
+    return f"\nAUTOMATED PRE-CHECK FINDINGS (verified by rule checks — reflect them in your review):\n{lines}\n"
+
+
 def _build_user_prompt(
     content: Dict[str, Any],
     brand_context: Dict[str, Any],
     strategy: Dict[str, Any],
     goal: str,
     target_audience: str,
+    notes: List[str] | None = None,
 ) -> str:
     return f"""Review the following campaign content before it goes live.
 
@@ -64,7 +98,8 @@ TARGET AUDIENCE: {target_audience}
 PLANNED CHANNELS: {json.dumps(strategy.get("channels", []))}
 
 CONTENT ASSETS:
-{json.dumps(content.get("assets", []), indent=2)}
+{to_prompt_json(content.get("assets", []))}
+{_notes_block(notes or [])}
 
 For each asset evaluate:
 1. Does it clearly belong to this brand without the brand name visible?
@@ -77,9 +112,131 @@ For any issue: name the channel, state the problem, explain why it matters.
 Produce your review as a single JSON object.""".strip()
 
 
+def _build_asset_prompt(
+    asset: Dict[str, Any],
+    restrictions: list,
+    tone: str,
+    goal: str,
+    usp: str,
+    notes: List[str] | None = None,
+) -> str:
+    # Only the asset, restrictions, tone, goal, USP and the asset's own rule
+    # findings go into the prompt — exactly what the verdict cache key
+    # covers, so a cached verdict is never stale.
+    return f"""Review the following content asset before it goes live.
+
+BRAND USP: {usp}
+BRAND TONE: {tone}
+CONTENT RESTRICTIONS: {json.dumps(restrictions)}
+
+CAMPAIGN GOAL: {goal}
+
+CONTENT ASSET:
+{to_prompt_json(asset)}
+{_notes_block(notes or [])}
+
+Evaluate:
+1. Does it violate any content restriction?
+2. Is the format and tone native to its channel, and in the brand's tone?
+3. Does the USP come through naturally — not forced?
+4. Does the CTA drive a specific action toward the campaign goal?
+
+For any issue: name the channel, state the problem, explain why it matters.
+Produce your review as a single JSON object.""".strip()
+
+
+def verdict_cache_key(
+    asset: Dict[str, Any],
+    restrictions: list,
+    tone: str,
+    goal: str,
+    usp: str,
+    notes: List[str] | None = None,
+) -> str:
+    payload = json.dumps(
+        {
+            "asset": asset,
+            "restrictions": restrictions,
+            "tone": tone,
+            "goal": goal,
+            "usp": usp,
+            "notes": notes or [],
+            "prompt": hashlib.sha256(ASSET_SYSTEM_PROMPT.encode("utf-8")).hexdigest(),
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def get_verdict_cache() -> CacheBackend | None:
+    """Process-wide per-asset QA verdict cache, or None when QA_CACHE_BACKEND=none."""
+    return build_cache_backend(
+        settings.qa_cache_backend,
+        namespace="qa_verdict",
+        ttl_seconds=settings.qa_cache_ttl_seconds,
+        max_entries=settings.qa_cache_max_entries,
+        redis_url=settings.redis_url,
+        path=settings.qa_cache_path,
+    )
+
+
+def _prevalidate(
+    content: Dict[str, Any],
+    brand_context: Dict[str, Any],
+    strategy: Dict[str, Any] | None,
+) -> RuleFindings:
+    if not settings.qa_rules_enabled:
+        return RuleFindings()
+    findings = run_rules(
+        content["assets"],
+        _extract_restrictions(brand_context),
+        (strategy or {}).get("channels") or [],
+        # per_channel pins each asset to its strategy channel name
+        strict_channels=settings.content_mode.strip().lower() == "per_channel",
+    )
+    logger.info(
+        f"QA_RULES | hard={len(findings.hard)} | soft={len(findings.notes())}"
+    )
+    return findings
+
+
+def _rule_failure_report(findings: RuleFindings) -> QAReport:
+    """Hard rule violations fail QA without an LLM review."""
+    return QAReport(
+        passed=False,
+        critical_issues=list(findings.hard),
+        recommendations=findings.notes(),
+    )
+
+
+def merge_verdicts(verdicts: List[QAReport]) -> QAReport:
+    """Fold per-asset verdicts into one campaign-level report (asset order kept)."""
+    critical = [issue for v in verdicts for issue in v.critical_issues]
+    return QAReport(
+        passed=all(v.passed for v in verdicts) and not critical,
+        critical_issues=critical,
+        recommendations=[rec for v in verdicts for rec in v.recommendations],
+    )
+
+
 class QAAgent:
+    """
+    Deterministic rule checks (app.validators.rule_engine) run first: a hard
+    violation fails QA with no LLM call, soft findings go into the prompt.
+
+    QA_MODE=per_asset (default) reviews each ContentAsset in its own small
+    call (QA_REVIEW_CONCURRENCY at once), and caches each verdict on asset +
+    restrictions + tone + goal + USP — regenerating one channel re-reviews
+    only that asset.
+    QA_MODE=batch reviews every asset in a single call with full campaign
+    context.
+    """
+
     def __init__(self) -> None:
         self.llm = LLMFactory.get_llm(agent_type="qa")
+        self.cache = get_verdict_cache()
 
     def run(
         self,
@@ -90,15 +247,36 @@ class QAAgent:
         target_audience: str = "",
     ) -> QAReport:
         if not content or not content.get("assets"):
-            return QAReport(
-                passed=False,
-                critical_issues=["No content assets were generated."],
-                recommendations=["Re-run the content agent with a valid strategy."],
-            )
+            return _no_content_report()
+
+        brand_context = brand_context or {}
+        findings = _prevalidate(content, brand_context, strategy)
+        if findings.blocking:
+            result = _rule_failure_report(findings)
+            _log_result(result)
+            return result
+
+        if settings.qa_mode == "per_asset":
+            restrictions = _extract_restrictions(brand_context)
+            tone = brand_context.get("tone", "")
+            usp = brand_context.get("usp", "")
+            assets = content["assets"]
+            # Per-asset reviews are independent LLM calls — run them side by side.
+            workers = max(1, min(settings.qa_review_concurrency, len(assets)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="qa-asset") as pool:
+                verdicts = list(pool.map(
+                    lambda item: self.review_asset(
+                        item[1], restrictions, tone, goal, usp, findings.soft.get(item[0])
+                    ),
+                    enumerate(assets),
+                ))
+            result = merge_verdicts(verdicts)
+            _log_result(result)
+            return result
 
         logger.info(
             "QAAgent.run | brand=%s | assets=%d",
-            (brand_context or {}).get("name", "?"),
+            brand_context.get("name", "?"),
             len(content.get("assets", [])),
         )
 
@@ -106,18 +284,147 @@ class QAAgent:
             system_prompt=SYSTEM_PROMPT,
             user_prompt=_build_user_prompt(
                 content,
-                brand_context or {},
+                brand_context,
                 strategy or {},
                 goal,
                 target_audience,
+                findings.notes(),
             ),
             response_schema=QAReport,
         )
+        _log_result(result)
+        return result
+
+    async def arun(
+        self,
+        content: Dict[str, Any] | None,
+        brand_context: Dict[str, Any] | None = None,
+        strategy: Dict[str, Any] | None = None,
+        goal: str = "",
+        target_audience: str = "",
+    ) -> QAReport:
+        if not content or not content.get("assets"):
+            return _no_content_report()
+
+        brand_context = brand_context or {}
+        findings = _prevalidate(content, brand_context, strategy)
+        if findings.blocking:
+            result = _rule_failure_report(findings)
+            _log_result(result)
+            return result
+
+        if settings.qa_mode == "per_asset":
+            restrictions = _extract_restrictions(brand_context)
+            tone = brand_context.get("tone", "")
+            usp = brand_context.get("usp", "")
+            semaphore = asyncio.Semaphore(max(1, settings.qa_review_concurrency))
+
+            async def review(idx: int, asset: Dict[str, Any]) -> QAReport:
+                async with semaphore:
+                    return await self.areview_asset(
+                        asset, restrictions, tone, goal, usp, findings.soft.get(idx)
+                    )
+
+            verdicts = await asyncio.gather(*(
+                review(idx, asset) for idx, asset in enumerate(content["assets"])
+            ))
+            result = merge_verdicts(list(verdicts))
+            _log_result(result)
+            return result
 
         logger.info(
-            "QAAgent.run | passed=%s | critical_issues=%d | recommendations=%d",
-            result.passed,
-            len(result.critical_issues),
-            len(result.recommendations),
+            "QAAgent.arun | brand=%s | assets=%d",
+            brand_context.get("name", "?"),
+            len(content.get("assets", [])),
+        )
+
+        result: QAReport = await self.llm.agenerate(
+            system_prompt=SYSTEM_PROMPT,
+            user_prompt=_build_user_prompt(
+                content,
+                brand_context,
+                strategy or {},
+                goal,
+                target_audience,
+                findings.notes(),
+            ),
+            response_schema=QAReport,
+        )
+        _log_result(result)
+        return result
+
+    def review_asset(
+        self,
+        asset: Dict[str, Any],
+        restrictions: list,
+        tone: str,
+        goal: str = "",
+        usp: str = "",
+        notes: List[str] | None = None,
+    ) -> QAReport:
+        """Verdict for a single asset — served from the verdict cache when unchanged."""
+        key = verdict_cache_key(asset, restrictions, tone, goal, usp, notes)
+        cached = self._cached_verdict(key, asset)
+        if cached is not None:
+            return cached
+
+        verdict: QAReport = self.llm.generate(
+            system_prompt=ASSET_SYSTEM_PROMPT,
+            user_prompt=_build_asset_prompt(asset, restrictions, tone, goal, usp, notes),
+            response_schema=QAReport,
         )
-        return result
\ No newline at end of file
+        self._store_verdict(key, verdict)
+        return verdict
+
+    async def areview_asset(
+        self,
+        asset: Dict[str, Any],
+        restrictions: list,
+        tone: str,
+        goal: str = "",
+        usp: str = "",
+        notes: List[str] | None = None,
+    ) -> QAReport:
+        key = verdict_cache_key(asset, restrictions, tone, goal, usp, notes)
+        cached = self._cached_verdict(key, asset)
+        if cached is not None:
+            return cached
+
+        verdict: QAReport = await self.llm.agenerate(
+            system_prompt=ASSET_SYSTEM_PROMPT,
+            user_prompt=_build_asset_prompt(asset, restrictions, tone, goal, usp, notes),
+            response_schema=QAReport,
+        )
+        self._store_verdict(key, verdict)
+        return verdict
+
+    def _cached_verdict(self, key: str, asset: Dict[str, Any]) -> Optional[QAReport]:
+        if self.cache is None:
+            return None
+        cached = self.cache.get(key)
+        if cached is None:
+            logger.info(f"QA_CACHE | miss | channel={asset.get('channel', '?')}")
+            return None
+        logger.info(f"QA_CACHE | hit | channel={asset.get('channel', '?')}")
+        return QAReport.model_validate_json(cached)
+
+    def _store_verdict(self, key: str, verdict: QAReport) -> None:
+        if self.cache is not None:
+            self.cache.set(key, verdict.model_dump_json())
+
+
+def _no_content_report() -> QAReport:
+    return QAReport(
+        passed=False,
+        critical_issues=["No content assets were generated."],
+        recommendations=["Re-run the content agent with a valid strategy."],
+    )
+
+
+def _log_result(result: QAReport) -> None:
+    logger.info(
+        "QAAgent | passed=%s | critical_issues=%d | recommendations=%d",
+        result.passed,
+        len(result.critical_issues),
+        len(result.recommendations),
+    )
\ No newline at end of file
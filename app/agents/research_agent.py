@@ -1,9 +1,9 @@
 # app/agents/research_agent.py
-import json
 import logging
 from datetime import date
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+from app.agents.prompt_payload import brand_payload, research_payload
 from app.schemas.research import ResearchOutput
 from app.services.llm.llm_factory import LLMFactory
 from app.tools import RESEARCH_TOOLS
@@ -28,13 +28,15 @@ def _build_user_prompt(
     goal: str,
     target_audience: str,
     budget: float,
+    prior: Optional[Dict[str, Any]] = None,
+    prior_date: str = "",
 ) -> str:
     return f"""Conduct market research to support the following campaign.
 
 TODAY'S DATE: {date.today().isoformat()}
 
 BRAND CONTEXT:
-{json.dumps(brand_context, indent=2)}
+{brand_payload(brand_context, "research")}
 
 CAMPAIGN GOAL:
 {goal}
@@ -43,10 +45,23 @@ TARGET AUDIENCE:
 {target_audience}
 
 BUDGET (USD): {budget:,.2f}
-
+{_prior_block(prior, prior_date)}
 Use your tools where needed, then produce your analysis as a single JSON object.""".strip()
 
 
+def _prior_block(prior: Optional[Dict[str, Any]], prior_date: str) -> str:
+    if not prior:
+        return ""
+    return f"""
+PREVIOUS RESEARCH FOR THIS BRAND, GOAL AND AUDIENCE (gathered {prior_date}):
+{research_payload(prior)}
+
+Refresh rather than redo: keep findings that still hold, and use your tools only
+to re-check time-sensitive parts (market size and growth figures, competitor moves,
+recent trends). Update whatever has changed.
+"""
+
+
 class ResearchAgent:
     def __init__(self) -> None:
         self.llm = LLMFactory.get_llm(agent_type="research")
@@ -57,6 +72,8 @@ class ResearchAgent:
         goal: str = "",
         target_audience: str = "",
         budget: float = 0.0,
+        prior: Optional[Dict[str, Any]] = None,
+        prior_date: str = "",
     ) -> ResearchOutput:
         logger.info(
             "ResearchAgent.run | brand=%s | goal=%s",
@@ -64,10 +81,37 @@ class ResearchAgent:
         )
         result: ResearchOutput = self.llm.generate_with_tools(
             system_prompt=SYSTEM_PROMPT,
-            user_prompt=_build_user_prompt(brand_context, goal, target_audience, budget),
+            user_prompt=_build_user_prompt(
+                brand_context, goal, target_audience, budget, prior, prior_date
+            ),
             tools=RESEARCH_TOOLS,
             response_schema=ResearchOutput,
             max_steps=6,
         )
         logger.info("ResearchAgent.run | complete")
+        return result
+
+    async def arun(
+        self,
+        brand_context: Dict[str, Any],
+        goal: str = "",
+        target_audience: str = "",
+        budget: float = 0.0,
+        prior: Optional[Dict[str, Any]] = None,
+        prior_date: str = "",
+    ) -> ResearchOutput:
+        logger.info(
+            "ResearchAgent.arun | brand=%s | goal=%s",
+            brand_context.get("name", "?"), goal[:80],
+        )
+        result: ResearchOutput = await self.llm.agenerate_with_tools(
+            system_prompt=SYSTEM_PROMPT,
+            user_prompt=_build_user_prompt(
+                brand_context, goal, target_audience, budget, prior, prior_date
+            ),
+            tools=RESEARCH_TOOLS,
+            response_schema=ResearchOutput,
+            max_steps=6,
+        )
+        logger.info("ResearchAgent.arun | complete")
         return result
\ No newline at end of file
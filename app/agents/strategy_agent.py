@@ -1,12 +1,12 @@
 # app/agents/strategy_agent.py
-import json
 import logging
 from datetime import date
 from typing import Any, Dict
 
+from app.agents.prompt_payload import brand_payload, research_payload
 from app.schemas.strategy import StrategyOutput
 from app.services.llm.llm_factory import LLMFactory
-from app.tools import STRATEGY_TOOLS
+from app.tools import STRATEGY_TOOLS, prefetch_calls
 
 logger = logging.getLogger("agents.strategy")
 
@@ -24,6 +24,10 @@ Quality standards:
 - Tactics must never violate brand content restrictions — always check guidelines before recommending"""
 
 
+def _brand_id(brand_context: Dict[str, Any]) -> str:
+    return str(brand_context.get("id", brand_context.get("_id", "")))
+
+
 def _build_user_prompt(
     research: Dict[str, Any],
     brand_context: Dict[str, Any],
@@ -31,7 +35,7 @@ def _build_user_prompt(
     target_audience: str,
     budget: float,
 ) -> str:
-    brand_id = brand_context.get("id", brand_context.get("_id", ""))
+    brand_id = _brand_id(brand_context)
     return f"""Design a campaign growth strategy using the inputs below.
 
 TODAY'S DATE: {date.today().isoformat()}
@@ -39,7 +43,7 @@ TODAY'S DATE: {date.today().isoformat()}
 BRAND ID: {brand_id}
 
 BRAND CONTEXT:
-{json.dumps(brand_context, indent=2)}
+{brand_payload(brand_context, "strategy")}
 
 CAMPAIGN GOAL:
 {goal}
@@ -50,7 +54,7 @@ TARGET AUDIENCE:
 BUDGET (USD): ${budget:,.2f}
 
 MARKET RESEARCH:
-{json.dumps(research, indent=2)}
+{research_payload(research)}
 
 Use your tools where needed, then produce your strategy as a single JSON object.""".strip()
 
@@ -82,8 +86,39 @@ class StrategyAgent:
                 budget,
             ),
             tools=STRATEGY_TOOLS,
+            prefetch=prefetch_calls(STRATEGY_TOOLS, _brand_id(brand_context)),
             response_schema=StrategyOutput,
             max_steps=4,
         )
         logger.info("StrategyAgent.run | complete")
+        return result
+
+    async def arun(
+        self,
+        research: Dict[str, Any] | None,
+        brand_context: Dict[str, Any] | None = None,
+        goal: str = "",
+        target_audience: str = "",
+        budget: float = 0.0,
+    ) -> StrategyOutput:
+        brand_context = brand_context or {}
+        logger.info(
+            "StrategyAgent.arun | brand=%s | goal=%s",
+            brand_context.get("name", "?"), goal[:80],
+        )
+        result: StrategyOutput = await self.llm.agenerate_with_tools(
+            system_prompt=SYSTEM_PROMPT,
+            user_prompt=_build_user_prompt(
+                research or {},
+                brand_context,
+                goal,
+                target_audience,
+                budget,
+            ),
+            tools=STRATEGY_TOOLS,
+            prefetch=prefetch_calls(STRATEGY_TOOLS, _brand_id(brand_context)),
+            response_schema=StrategyOutput,
+            max_steps=4,
+        )
+        logger.info("StrategyAgent.arun | complete")
         return result
\ No newline at end of file
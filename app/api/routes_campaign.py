@@ -1,24 +1,52 @@
 # app/api/routes_campaign.py
-from fastapi import APIRouter, HTTPException
+import json
 
-from app.schemas.campaign import CampaignCreate
-from app.services.campaign_service import CampaignService
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from app.core.settings import settings
+from app.schemas.campaign import (
+    CampaignBatchCreate,
+    CampaignBatchResponse,
+    CampaignCreate,
+    CampaignPage,
+    CampaignResponse,
+    CampaignStatus,
+)
+from app.services.campaign_service import RESUMABLE_STATUSES, CampaignService
 
 router = APIRouter(prefix="/brands/{brand_id}/campaigns", tags=["Campaigns"])
 
 
-@router.get("")
-def get_all_campaigns(brand_id: str):
-    """Get all campaigns for the brand."""
+def _sse(event: dict) -> str:
+    """Format one progress event as a Server-Sent Events frame."""
+    data = json.dumps(event["data"], ensure_ascii=False, default=str)
+    return f"event: {event['event']}\ndata: {data}\n\n"
+
+
+@router.get("", response_model=CampaignPage)
+async def get_all_campaigns(
+    brand_id: str,
+    limit: int = Query(settings.campaign_page_size, ge=1, le=settings.campaign_page_max_size),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    fields: str | None = Query(
+        None, description="Comma-separated fields to return; default is a summary without result blobs"
+    ),
+):
+    """
+    List the brand's campaigns, newest first, one page at a time. Items hold
+    summary fields only (no research / strategy / content / QA / analytics)
+    unless `fields` asks for them; fetch `.../{id}` for a full campaign.
+    """
     service = CampaignService()
-    return service.get_all_campaigns(brand_id=brand_id)
+    return await service.aget_campaign_page(brand_id, limit, cursor, fields)
 
 
 @router.get("/{campaign_id}")
-def get_campaign_by_id(brand_id: str, campaign_id: str):
+async def get_campaign_by_id(brand_id: str, campaign_id: str):
     """Get a single campaign by ID."""
     service = CampaignService()
-    campaign = service.get_campaign_by_id(brand_id=brand_id, campaign_id=campaign_id)
+    campaign = await service.aget_campaign_by_id(brand_id=brand_id, campaign_id=campaign_id)
     if campaign is None:
         raise HTTPException(status_code=404, detail="Campaign not found")
     if campaign.get("brand_id") != brand_id:
@@ -26,20 +54,89 @@ def get_campaign_by_id(brand_id: str, campaign_id: str):
     return campaign
 
 
-@router.post("/")
-def create_campaign(brand_id: str, payload: CampaignCreate):
-    """Create a campaign for the brand (brand_id in path overrides body)."""
+@router.get("/{campaign_id}/status", response_model=CampaignStatus)
+async def get_campaign_status(brand_id: str, campaign_id: str):
+    """Poll the progress of a queued or running campaign."""
+    service = CampaignService()
+    status = await service.aget_campaign_status(brand_id=brand_id, campaign_id=campaign_id)
+    if status is None or status.get("brand_id") != brand_id:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    return status
+
+
+@router.post("/{campaign_id}/resume", status_code=202, response_model=CampaignResponse)
+async def resume_campaign(brand_id: str, campaign_id: str):
+    """
+    Re-queue a campaign whose run errored. It restarts from the last
+    completed node — research / strategy output is reused, not regenerated.
+    """
+    service = CampaignService()
+    status = await service.aget_campaign_status(brand_id=brand_id, campaign_id=campaign_id)
+    if status is None or status.get("brand_id") != brand_id:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    if status.get("status") not in RESUMABLE_STATUSES:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Campaign is {status.get('status')!r}; only errored runs can be resumed",
+        )
+    return await service.aresume_campaign(brand_id=brand_id, campaign_id=campaign_id)
+
+
+@router.post("/", status_code=202, response_model=CampaignResponse)
+async def create_campaign(brand_id: str, payload: CampaignCreate):
+    """
+    Queue a campaign run for the brand (brand_id in path overrides body).
+    Returns the campaign id with status `queued`; poll `.../{id}/status`.
+    """
+    service = CampaignService()
+    payload.brand_id = brand_id
+    return await service.acreate_campaign(payload)
+
+
+@router.post("/batch", status_code=202, response_model=CampaignBatchResponse)
+async def create_campaign_batch(brand_id: str, payload: CampaignBatchCreate):
+    """
+    Queue many campaign variants for the brand as one batch job (brand_id in
+    path overrides each body). Variants sharing a goal and audience share one
+    research run. Each returned id can be polled via `.../{id}/status`.
+    """
+    service = CampaignService()
+    return await service.acreate_campaign_batch(brand_id, payload.campaigns)
+
+
+@router.post("/stream")
+async def stream_campaign(brand_id: str, payload: CampaignCreate):
+    """
+    Create a campaign and run it while streaming progress as Server-Sent
+    Events: `campaign` (queued, then running once a campaign queue slot is
+    free), then `node_start` / `node_end` (with the state the node produced)
+    per graph node, then `done` or `error`.
+    """
     service = CampaignService()
     payload.brand_id = brand_id
-    return service.create_campaign(payload)
+    events = service.astream_campaign(payload)
+    # Resolve the brand and persist before the 200 so a bad brand_id
+    # still surfaces as a normal HTTP error rather than a broken stream.
+    first = await anext(events)
+
+    async def body():
+        yield _sse(first)
+        async for event in events:
+            yield _sse(event)
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.delete("/{campaign_id}", status_code=204)
-def delete_campaign_by_id(brand_id: str, campaign_id: str):
+async def delete_campaign_by_id(brand_id: str, campaign_id: str):
     """Delete a campaign by ID."""
     service = CampaignService()
-    campaign = service.get_campaign_by_id(campaign_id)
+    campaign = await service.aget_campaign_by_id(brand_id=brand_id, campaign_id=campaign_id)
     if campaign is None or campaign.get("brand_id") != brand_id:
         raise HTTPException(status_code=404, detail="Campaign not found")
-    service.delete_campaign_by_id(campaign_id)
+    await service.adelete_campaign_by_id(campaign_id)
     return None
\ No newline at end of file
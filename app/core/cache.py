@@ -0,0 +1,226 @@
+# app/core/cache.py
+"""
+Key/value cache backends shared by the LLM response cache and other
+read-through caches.
+
+Values are strings (callers serialise — e.g. pydantic `model_dump_json()`).
+Every backend honours a TTL (0 = never expires) and a size bound:
+
+  memory → in-process LRU (OrderedDict), evicts least-recently-used entries
+           beyond max_entries. Per process — not shared between workers.
+  redis  → shared by every worker; TTL via key expiry, size bound left to the
+           server's maxmemory / eviction policy.
+  disk   → SQLite file; survives restarts. Evicts least-recently-read rows
+           beyond max_entries.
+
+Backends count hits and misses; `stats()` reports them.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+logger = logging.getLogger("cache")
+
+
+class CacheBackend(ABC):
+    def __init__(self, namespace: str, ttl_seconds: int) -> None:
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self._hits = 0
+        self._misses = 0
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        value = self._get(key)
+        with self._stats_lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        self._set(key, value)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            hits, misses = self._hits, self._misses
+        total = hits + misses
+        return {
+            "namespace": self.namespace,
+            "backend": type(self).__name__,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / total, 4) if total else 0.0,
+        }
+
+    def _expires_at(self) -> float | None:
+        return time.time() + self.ttl_seconds if self.ttl_seconds > 0 else None
+
+    @abstractmethod
+    def _get(self, key: str) -> str | None: ...
+
+    @abstractmethod
+    def _set(self, key: str, value: str) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+
+class MemoryLRUCache(CacheBackend):
+    def __init__(self, namespace: str, ttl_seconds: int, max_entries: int) -> None:
+        super().__init__(namespace, ttl_seconds)
+        self._max_entries = max(1, max_entries)
+        self._data: OrderedDict[str, tuple[float | None, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._data[key] = (self._expires_at(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class RedisCache(CacheBackend):
+    def __init__(self, namespace: str, ttl_seconds: int, url: str) -> None:
+        super().__init__(namespace, ttl_seconds)
+        import redis
+
+        self._redis = redis.Redis.from_url(url, decode_responses=True)
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _get(self, key: str) -> str | None:
+        try:
+            return self._redis.get(self._key(key))
+        except Exception as exc:
+            # A cache outage must degrade to a miss, never fail the caller.
+            logger.warning(f"cache | redis get failed | namespace={self.namespace} | error={exc}")
+            return None
+
+    def _set(self, key: str, value: str) -> None:
+        try:
+            self._redis.set(self._key(key), value, ex=self.ttl_seconds or None)
+        except Exception as exc:
+            logger.warning(f"cache | redis set failed | namespace={self.namespace} | error={exc}")
+
+    def delete(self, key: str) -> None:
+        self._redis.delete(self._key(key))
+
+    def clear(self) -> None:
+        for key in self._redis.scan_iter(f"{self.namespace}:*"):
+            self._redis.delete(key)
+
+
+class DiskCache(CacheBackend):
+    def __init__(self, namespace: str, ttl_seconds: int, max_entries: int, path: str) -> None:
+        super().__init__(namespace, ttl_seconds)
+        self._max_entries = max(1, max_entries)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,"
+                " expires_at REAL, accessed_at REAL NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+
+    def _get(self, key: str) -> str | None:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute(
+                    "DELETE FROM cache WHERE namespace = ? AND key = ?", (self.namespace, key)
+                )
+                return None
+            self._conn.execute(
+                "UPDATE cache SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (now, self.namespace, key),
+            )
+            return value
+
+    def _set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, key, value, self._expires_at(), now),
+            )
+            self._conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND key IN ("
+                " SELECT key FROM cache WHERE namespace = ?"
+                " ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.namespace, self.namespace, self._max_entries),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM cache WHERE namespace = ? AND key = ?", (self.namespace, key)
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache WHERE namespace = ?", (self.namespace,))
+
+
+def build_cache_backend(
+    kind: str,
+    *,
+    namespace: str,
+    ttl_seconds: int,
+    max_entries: int,
+    redis_url: str = "",
+    path: str = "",
+) -> CacheBackend | None:
+    """Construct a backend by name; "none" (or empty) disables caching."""
+    kind = (kind or "none").strip().lower()
+    if kind == "none":
+        return None
+    if kind == "memory":
+        return MemoryLRUCache(namespace, ttl_seconds, max_entries)
+    if kind == "redis":
+        return RedisCache(namespace, ttl_seconds, redis_url)
+    if kind == "disk":
+        return DiskCache(namespace, ttl_seconds, max_entries, path)
+    raise ValueError(f"Unsupported cache backend: {kind!r}")
@@ -1 +1,39 @@
 # app/core/constants.py
+"""
+Forecasting benchmarks used by the deterministic analytics engine
+(app.services.analytics_service). Ranges are the ones the analytics agent
+has always been given in its prompt; each forecast uses the midpoint and
+Monte-Carlo runs sample across the full range.
+
+    cpm: USD per 1,000 impressions (email: per 1,000 delivered sends)
+    ctr: clicks as a percentage of impressions
+"""
+
+CHANNEL_BENCHMARKS: dict[str, dict[str, tuple[float, float]]] = {
+    "paid_social": {"cpm": (6.0, 12.0), "ctr": (0.5, 1.5)},
+    "influencer":  {"cpm": (5.0, 15.0), "ctr": (1.0, 3.0)},
+    "email":       {"cpm": (1.0, 3.0),  "ctr": (2.0, 4.0)},
+    "content":     {"cpm": (3.0, 8.0),  "ctr": (0.3, 0.8)},
+    "app_store":   {"cpm": (2.0, 5.0),  "ctr": (2.0, 5.0)},
+}
+DEFAULT_CHANNEL_TYPE = "paid_social"
+
+# First match wins — "Instagram influencers" is an influencer channel, not paid social.
+CHANNEL_TYPE_KEYWORDS: list[tuple[str, tuple[str, ...]]] = [
+    ("influencer", ("influencer", "creator", "ugc", "ambassador", "partnership")),
+    ("email", ("email", "e-mail", "newsletter", "drip")),
+    ("app_store", ("app store", "play store", "google play", "aso", "search ads")),
+    ("content", ("blog", "seo", "article", "content", "podcast")),
+    ("paid_social", (
+        "instagram", "tiktok", "facebook", "meta", "social", "linkedin", "twitter",
+        "youtube", "snapchat", "pinterest", "reddit", "display", "paid",
+    )),
+]
+
+# Conversion rate (% of clicks completing the goal) by campaign goal keyword.
+GOAL_CONVERSION_BENCHMARKS: list[tuple[tuple[str, ...], tuple[float, float]]] = [
+    (("install", "download"), (1.0, 5.0)),
+    (("sign-up", "signup", "sign up", "waitlist", "register", "subscribe", "lead"), (5.0, 15.0)),
+    (("purchase", "sale", "buy", "order", "revenue", "checkout"), (1.0, 3.0)),
+]
+DEFAULT_CONVERSION_RANGE: tuple[float, float] = (2.0, 5.0)
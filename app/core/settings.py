@@ -20,19 +20,112 @@ class Settings(BaseSettings):
     ollama_base_url: str = "http://localhost:11434/v1"
     ollama_api_key: str = "ollama"
 
+    # ReAct engine — max tool calls from one LLM step executed concurrently
+    react_tool_concurrency: int = 4
+    # Run brand-id-only tools (brand memory / guidelines / tone) before the
+    # loop instead of waiting for the LLM to ask
+    react_prefetch: bool = True
+    # ReAct token budgets (0 = unlimited): the message history sent on each
+    # LLM turn, and the observations handed to the final synthesis
+    react_history_token_budget: int = 16000
+    react_observation_token_budget: int = 8000
+
+    # Agent prompt payloads (app/agents/prompt_payload.py): compact JSON,
+    # empty fields dropped, per-agent brand whitelists; false = pretty-printed
+    prompt_compact: bool = True
+    prompt_research_max_chars: int = 4000  # summarize longer research; 0 = never
+
+    # LLM response cache for generate(): "none" | "memory" | "redis" | "disk"
+    llm_cache_backend: str = "memory"
+    llm_cache_ttl_seconds: int = 86400  # 0 = never expire
+    llm_cache_max_entries: int = 1000   # memory / disk backends
+    llm_cache_path: str = "./.cache/llm_responses.sqlite3"  # disk backend
+
+    # External tool result cache (web_search, serper): "none" | "memory" | "redis" | "disk"
+    tool_cache_backend: str = "memory"
+    tool_cache_max_entries: int = 2000
+    tool_cache_path: str = "./.cache/tool_results.sqlite3"  # disk backend
+    web_search_cache_ttl_seconds: int = 6 * 3600   # market data moves slowly
+    serper_cache_ttl_seconds: int = 24 * 3600      # competitor profiles + news
+
     # Infra
     database_url: str = "sqlite:///./app.db"
     redis_url: str = "redis://localhost:6379/0"
 
+    # Campaign job queue: "inprocess" (runs inside the API process — no
+    # Redis or worker needed) | "celery" (Redis broker; start a worker with
+    # `celery -A app.workers.celery_app worker`)
+    campaign_queue_backend: str = "inprocess"
+    # Graph runs at once on the API event loop: inprocess jobs and /stream runs
+    campaign_queue_concurrency: int = 4
+    # POST .../campaigns/batch: variants per request, graphs run at once per batch
+    campaign_batch_max_size: int = 50
+    campaign_batch_concurrency: int = 8
+    # GET .../campaigns: default and largest `limit` per page
+    campaign_page_size: int = 20
+    campaign_page_max_size: int = 100
+
+    # Content generation: "per_channel" (one concurrent call per strategy
+    # channel, failed channels retried alone) | "single" (one call for all)
+    content_mode: str = "per_channel"
+    content_channel_max_attempts: int = 2
+
+    # QA review: "per_asset" (one concurrent call per asset, verdicts cached
+    # on asset + restrictions + tone + goal + USP) | "batch" (one call for all assets)
+    qa_mode: str = "per_asset"
+    qa_review_concurrency: int = 8  # per_asset reviews in flight per campaign
+    # Deterministic pre-QA checks (CTA present, planned channel, literal
+    # restriction hits); a hard violation fails QA with no LLM call
+    qa_rules_enabled: bool = True
+    qa_cache_backend: str = "memory"  # "none" | "memory" | "redis" | "disk"
+    qa_cache_ttl_seconds: int = 7 * 86400
+    qa_cache_max_entries: int = 5000
+    qa_cache_path: str = "./.cache/qa_verdicts.sqlite3"  # disk backend
+
+    # Analytics forecast: "deterministic" (benchmark math, no LLM) |
+    # "llm_split" (LLM picks the budget split only) | "llm" (LLM writes it all)
+    analytics_mode: str = "deterministic"
+    analytics_simulations: int = 2000  # Monte-Carlo draws for intervals; 0 = off
+
+    # Research reuse across campaigns of a brand with the same goal/audience
+    research_reuse_enabled: bool = True
+    research_fresh_hours: float = 24       # reuse stored research as-is
+    research_max_age_hours: float = 168    # older than fresh: refresh from it
+    # Semantic match over stored research when the exact fingerprint misses
+    research_semantic_cache: bool = True
+    # min(goal, audience) cosine similarity to reuse, per embedding backend
+    research_semantic_threshold_hashing: float = 0.6
+    research_semantic_threshold_sentence_transformers: float = 0.7
+    research_semantic_max_entries: int = 500   # per brand, newest kept
+
+    # Local CPU embeddings: "auto" (sentence-transformers if installed and
+    # the model is cached locally, else hashing) | "sentence-transformers" | "hashing"
+    embedding_backend: str = "auto"
+    embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+
+    # When QA halts a campaign, drop the analytics forecast computed in
+    # parallel with QA (it was for content that will not be published)
+    discard_analytics_on_qa_halt: bool = True
+
+    # Graph checkpoints for resuming failed runs: "mongo" | "memory" (per
+    # process — tests / local dev) | "none"
+    graph_checkpointer: str = "mongo"
+
     # MongoDB (brand data)
     mongodb_uri: str = "mongodb://localhost:27017"
     mongodb_db_name: str = "marketing_growth"
+    # Create the indexes in app/db/indexes.py when the API starts
+    mongodb_ensure_indexes: bool = True
+    # Process-level brand cache (campaign creation, graph brand tools);
+    # writes in this process invalidate at once, this bounds other processes
+    brand_cache_ttl_seconds: int = 300  # 0 = off
 
     # Tavily (search for research tools)
     tavily_api_key: str = ""
 
     # Serper (Google Search API – https://serper.dev/api-keys)
     serper_api_key: str = ""
+    serper_batch_concurrency: int = 4  # companies profiled at once by the batch tool
 
     # LangSmith tracing (LangChain/LangGraph)
     langsmith_tracing: bool = False
@@ -0,0 +1,168 @@
+# app/db/indexes.py
+"""
+MongoDB index bootstrap and query-plan checks.
+
+INDEX_SPECS lists every secondary index the repositories rely on; the API
+creates them at startup (create_indexes is a no-op for indexes that already
+exist). QUERY_PLAN_CHECKS pairs the hot queries with the index they must
+use — `python -m app.db.indexes --check` runs explain() on each against the
+configured database and fails if any falls back to a collection scan or an
+in-memory sort. tests/test_indexes.py runs the same check against a local
+mongod (skipped when none is reachable).
+
+Brands are only read by _id (the default index), so they need none.
+
+    python -m app.db.indexes           # create indexes
+    python -m app.db.indexes --check   # create, then verify query plans
+"""
+import logging
+import sys
+from typing import Any, Iterator
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.database import Database
+
+from app.db.mongodb import get_async_database, get_database
+
+logger = logging.getLogger("db.indexes")
+
+INDEX_SPECS: dict[str, list[IndexModel]] = {
+    "campaigns": [
+        # GET /brands/{id}/campaigns — filter by brand, keyset on (created_at, _id) desc
+        IndexModel(
+            [("brand_id", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+            name="brand_id_created_at_id",
+        ),
+        IndexModel([("status", ASCENDING)], name="status"),
+    ],
+    "research_store": [
+        IndexModel([("brand_id", ASCENDING), ("industry", ASCENDING)], name="brand_id_industry"),
+    ],
+    "graph_checkpoints": [
+        IndexModel(
+            [("thread_id", ASCENDING), ("checkpoint_ns", ASCENDING), ("checkpoint_id", DESCENDING)],
+            name="thread_ns_checkpoint",
+        ),
+    ],
+    "graph_checkpoint_writes": [
+        IndexModel(
+            [
+                ("thread_id", ASCENDING),
+                ("checkpoint_ns", ASCENDING),
+                ("checkpoint_id", ASCENDING),
+                ("task_id", ASCENDING),
+                ("idx", ASCENDING),
+            ],
+            name="thread_ns_checkpoint_task",
+        ),
+    ],
+}
+
+_CAMPAIGN_PAGE_SORT = [("created_at", DESCENDING), ("_id", DESCENDING)]
+
+# (collection, filter, sort, index the winning plan must use)
+QUERY_PLAN_CHECKS: list[tuple[str, dict[str, Any], list[tuple[str, int]] | None, str]] = [
+    # campaign_repo.list_page — first page, then a keyset page past a cursor
+    ("campaigns", {"brand_id": "plan-check"}, _CAMPAIGN_PAGE_SORT, "brand_id_created_at_id"),
+    (
+        "campaigns",
+        {
+            "brand_id": "plan-check",
+            "$or": [
+                {"created_at": {"$lt": "2026-01-01T00:00:00Z"}},
+                {"created_at": "2026-01-01T00:00:00Z", "_id": {"$lt": "plan-check"}},
+            ],
+        },
+        _CAMPAIGN_PAGE_SORT,
+        "brand_id_created_at_id",
+    ),
+    # campaign_repo.list_recent (get_past_campaigns) — must not pick the
+    # status index and sort in memory
+    (
+        "campaigns",
+        {"brand_id": "plan-check", "status": {"$in": ["completed", "failed"]}},
+        _CAMPAIGN_PAGE_SORT,
+        "brand_id_created_at_id",
+    ),
+    ("campaigns", {"status": "queued"}, None, "status"),
+    ("research_store", {"brand_id": "plan-check", "industry": ""}, None, "brand_id_industry"),
+    (
+        "graph_checkpoints",
+        {"thread_id": "plan-check", "checkpoint_ns": ""},
+        [("checkpoint_id", DESCENDING)],
+        "thread_ns_checkpoint",
+    ),
+]
+
+
+def ensure_indexes(db: Database | None = None) -> dict[str, list[str]]:
+    """Create every index in INDEX_SPECS. Returns index names per collection."""
+    db = db if db is not None else get_database()
+    created = {name: db[name].create_indexes(specs) for name, specs in INDEX_SPECS.items()}
+    logger.info(f"DB_INDEXES | ensured | {created}")
+    return created
+
+
+async def aensure_indexes() -> dict[str, list[str]]:
+    """Async `ensure_indexes` — run from the API lifespan."""
+    db = get_async_database()
+    created = {}
+    for name, specs in INDEX_SPECS.items():
+        created[name] = await db[name].create_indexes(specs)
+    logger.info(f"DB_INDEXES | ensured | {created}")
+    return created
+
+
+def _plan_stages(plan: Any) -> Iterator[dict[str, Any]]:
+    """Every stage node of an explain() plan tree (classic or SBE layout)."""
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            yield plan
+        for value in plan.values():
+            yield from _plan_stages(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            yield from _plan_stages(item)
+
+
+def plan_problems(explain: dict[str, Any], expected_index: str) -> list[str]:
+    """Why a winning plan is not an index scan on `expected_index` (empty = fine)."""
+    winning = explain.get("queryPlanner", {}).get("winningPlan", {})
+    stages = list(_plan_stages(winning))
+    problems = []
+    if any(s["stage"] == "COLLSCAN" for s in stages):
+        problems.append("collection scan")
+    if any(s["stage"] == "SORT" for s in stages):
+        problems.append("in-memory sort")
+    used = {s.get("indexName") for s in stages if s.get("indexName")}
+    if expected_index not in used:
+        problems.append(f"expected index {expected_index!r}, plan used {sorted(used) or 'none'}")
+    return problems
+
+
+def check_query_plans(db: Database | None = None) -> list[str]:
+    """explain() every QUERY_PLAN_CHECKS query; returns failure messages."""
+    db = db if db is not None else get_database()
+    failures = []
+    for collection, query, sort, index in QUERY_PLAN_CHECKS:
+        cursor = db[collection].find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        problems = plan_problems(cursor.explain(), index)
+        status = "ok" if not problems else "; ".join(problems)
+        logger.info(f"DB_INDEXES | plan | {collection} {query} sort={sort} | {status}")
+        if problems:
+            failures.append(f"{collection} {query} sort={sort}: {status}")
+    return failures
+
+
+if __name__ == "__main__":
+    from app.core.logging import setup_logging
+
+    setup_logging()
+    ensure_indexes()
+    if "--check" in sys.argv[1:]:
+        failures = check_query_plans()
+        for failure in failures:
+            print(f"FAIL  {failure}")
+        sys.exit(1 if failures else 0)
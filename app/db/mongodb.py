@@ -1,11 +1,14 @@
 # app/db/mongodb.py
-from pymongo import MongoClient
+from pymongo import AsyncMongoClient, MongoClient
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.collection import Collection
 from pymongo.database import Database
 
 from app.core.settings import settings
 
 _client: MongoClient | None = None
+_async_client: AsyncMongoClient | None = None
 
 
 def get_client() -> MongoClient:
@@ -28,3 +31,52 @@ def get_brands_collection() -> Collection:
 def get_campaigns_collection() -> Collection:
     """Collection for campaign runs (by brand, full graph result + metadata)."""
     return get_database()["campaigns"]
+
+
+def get_research_collection() -> Collection:
+    """Reusable research results, keyed by brand + industry + goal/audience fingerprint."""
+    return get_database()["research_store"]
+
+
+def get_checkpoints_collection() -> Collection:
+    """LangGraph checkpoints for campaign runs (one thread per campaign_id)."""
+    return get_database()["graph_checkpoints"]
+
+
+def get_checkpoint_writes_collection() -> Collection:
+    """Pending node writes attached to a checkpoint (partial super-steps)."""
+    return get_database()["graph_checkpoint_writes"]
+
+
+# --- Async (PyMongo native asyncio driver) — used by the async campaign path ---
+
+def get_async_client() -> AsyncMongoClient:
+    """Lazy async MongoDB client singleton (bound to the serving event loop)."""
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncMongoClient(settings.mongodb_uri)
+    return _async_client
+
+
+def get_async_database() -> AsyncDatabase:
+    return get_async_client()[settings.mongodb_db_name]
+
+
+def get_async_brands_collection() -> AsyncCollection:
+    return get_async_database()["brands"]
+
+
+def get_async_campaigns_collection() -> AsyncCollection:
+    return get_async_database()["campaigns"]
+
+
+def get_async_research_collection() -> AsyncCollection:
+    return get_async_database()["research_store"]
+
+
+def get_async_checkpoints_collection() -> AsyncCollection:
+    return get_async_database()["graph_checkpoints"]
+
+
+def get_async_checkpoint_writes_collection() -> AsyncCollection:
+    return get_async_database()["graph_checkpoint_writes"]
@@ -1,8 +1,23 @@
 # app/db/repositories/brand_repo.py
+import copy
+import logging
+import threading
+import time
 from datetime import datetime, timezone
 from typing import Any
 
-from app.db.mongodb import get_brands_collection
+from app.core.settings import settings
+from app.db.mongodb import get_async_brands_collection, get_brands_collection
+
+logger = logging.getLogger("db.brand_repo")
+
+# Process-level read-through cache for get_cached / aget_cached.
+# Every write to a brand bumps its version; an entry loaded under an older
+# version is never served, even if the write landed while it was loading.
+# BRAND_CACHE_TTL_SECONDS bounds staleness from writes in other processes.
+_cache: dict[str, tuple[int, float, dict[str, Any]]] = {}  # id -> (version, loaded_at, doc)
+_versions: dict[str, int] = {}
+_cache_lock = threading.Lock()
 
 
 def _now_iso() -> str:
@@ -80,6 +95,64 @@ def get_by_id(brand_id: str) -> dict[str, Any] | None:
     return _doc_to_response(doc)
 
 
+async def aget_by_id(brand_id: str) -> dict[str, Any] | None:
+    """Async `get_by_id`."""
+    coll = get_async_brands_collection()
+    doc = await coll.find_one({"_id": brand_id})
+    if doc is None:
+        return None
+    return _doc_to_response(doc)
+
+
+def invalidate(brand_id: str) -> None:
+    """Bump the brand's version so cached copies are dropped. Call after every write."""
+    with _cache_lock:
+        _versions[brand_id] = _versions.get(brand_id, 0) + 1
+        _cache.pop(brand_id, None)
+
+
+def _cached(brand_id: str) -> tuple[int, dict[str, Any] | None]:
+    """(current version, cached doc or None)."""
+    with _cache_lock:
+        version = _versions.get(brand_id, 0)
+        entry = _cache.get(brand_id)
+    if entry is None or entry[0] != version:
+        return version, None
+    if time.monotonic() - entry[1] > settings.brand_cache_ttl_seconds:
+        return version, None
+    return version, entry[2]
+
+
+def _store(brand_id: str, version: int, doc: dict[str, Any] | None) -> None:
+    if doc is None or settings.brand_cache_ttl_seconds <= 0:
+        return
+    with _cache_lock:
+        if _versions.get(brand_id, 0) == version:
+            _cache[brand_id] = (version, time.monotonic(), doc)
+
+
+def get_cached(brand_id: str) -> dict[str, Any] | None:
+    """`get_by_id` through the process-level brand cache. Returns a copy."""
+    version, doc = _cached(brand_id)
+    if doc is not None:
+        logger.info(f"BRAND_CACHE | hit | brand_id={brand_id}")
+        return copy.deepcopy(doc)
+    doc = get_by_id(brand_id)
+    _store(brand_id, version, doc)
+    return copy.deepcopy(doc)
+
+
+async def aget_cached(brand_id: str) -> dict[str, Any] | None:
+    """Async `get_cached`."""
+    version, doc = _cached(brand_id)
+    if doc is not None:
+        logger.info(f"BRAND_CACHE | hit | brand_id={brand_id}")
+        return copy.deepcopy(doc)
+    doc = await aget_by_id(brand_id)
+    _store(brand_id, version, doc)
+    return copy.deepcopy(doc)
+
+
 def update(brand_id: str, data: dict[str, Any]) -> dict[str, Any] | None:
     """Update brand in MongoDB. Merges memory subfields with existing memory."""
     coll = get_brands_collection()
@@ -98,6 +171,7 @@ def update(brand_id: str, data: dict[str, Any]) -> dict[str, Any] | None:
         memory["latest_insights"] = data["latest_insights"]
     set_fields["memory"] = memory
     coll.update_one({"_id": brand_id}, {"$set": set_fields})
+    invalidate(brand_id)
     return get_by_id(brand_id)
 
 
@@ -105,4 +179,5 @@ def delete(brand_id: str) -> bool:
     """Remove brand from MongoDB."""
     coll = get_brands_collection()
     result = coll.delete_one({"_id": brand_id})
+    invalidate(brand_id)
     return result.deleted_count > 0
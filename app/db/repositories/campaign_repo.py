@@ -1,8 +1,12 @@
 # app/db/repositories/campaign_repo.py
+import base64
+import json
 from datetime import datetime, timezone
 from typing import Any
 
-from app.db.mongodb import get_campaigns_collection
+from pymongo import UpdateOne
+
+from app.db.mongodb import get_async_campaigns_collection, get_campaigns_collection
 
 
 def _now_iso() -> str:
@@ -18,8 +22,42 @@ def create(data: dict[str, Any]) -> dict[str, Any]:
     campaign_id = data.get("campaign_id") or data.get("id")
     if not campaign_id:
         return data
+    doc = _new_doc(campaign_id, data)
+    coll = get_campaigns_collection()
+    coll.insert_one(doc)
+    return _doc_to_response(doc)
+
+
+async def acreate(data: dict[str, Any]) -> dict[str, Any]:
+    """Async `create`."""
+    campaign_id = data.get("campaign_id") or data.get("id")
+    if not campaign_id:
+        return data
+    doc = _new_doc(campaign_id, data)
+    coll = get_async_campaigns_collection()
+    await coll.insert_one(doc)
+    return _doc_to_response(doc)
+
+
+def create_many(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Save several campaign documents in one insert_many round trip."""
+    docs = [_new_doc(item["campaign_id"], item) for item in items]
+    if docs:
+        get_campaigns_collection().insert_many(docs, ordered=False)
+    return [_doc_to_response(d) for d in docs]
+
+
+async def acreate_many(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Async `create_many`."""
+    docs = [_new_doc(item["campaign_id"], item) for item in items]
+    if docs:
+        await get_async_campaigns_collection().insert_many(docs, ordered=False)
+    return [_doc_to_response(d) for d in docs]
+
+
+def _new_doc(campaign_id: str, data: dict[str, Any]) -> dict[str, Any]:
     now = _now_iso()
-    doc = {
+    return {
         "_id": campaign_id,
         "brand_id": data.get("brand_id", ""),
         "brand_name": data.get("brand_context", {}).get("name", ""),
@@ -28,16 +66,16 @@ def create(data: dict[str, Any]) -> dict[str, Any]:
         "target_audience": data.get("target_audience", ""),
         "budget": data.get("budget"),
         "research": data.get("research"),
+        "research_reused": bool(data.get("research_reused")),
         "strategy": data.get("strategy"),
         "content": data.get("content"),
         "qa_report": data.get("qa_report"),
         "analytics": data.get("analytics"),
+        "completed_nodes": [],
+        "error": None,
         "created_at": now,
         "updated_at": now,
     }
-    coll = get_campaigns_collection()
-    coll.insert_one(doc)
-    return _doc_to_response(doc)
 
 
 def _doc_to_response(doc: dict[str, Any]) -> dict[str, Any]:
@@ -56,6 +94,143 @@ def list_all(brand_id: str | None = None) -> list[dict[str, Any]]:
     return [_doc_to_response(d) for d in cursor]
 
 
+async def alist_all(brand_id: str | None = None) -> list[dict[str, Any]]:
+    """Async `list_all`."""
+    coll = get_async_campaigns_collection()
+    query = {"brand_id": brand_id} if brand_id else {}
+    cursor = coll.find(query).sort("created_at", -1)
+    return [_doc_to_response(d) async for d in cursor]
+
+
+# Every field of a campaign document (see _new_doc), for `fields=` validation.
+CAMPAIGN_FIELDS = frozenset({
+    "brand_id", "brand_name", "status", "goal", "target_audience", "budget",
+    "research", "research_reused", "strategy", "content", "qa_report", "analytics",
+    "completed_nodes", "failed_channels", "error", "created_at", "updated_at",
+})
+
+# Default list view — everything except the heavy result blobs.
+SUMMARY_FIELDS = (
+    "brand_id", "brand_name", "status", "goal", "target_audience", "budget",
+    "research_reused", "failed_channels", "error", "created_at", "updated_at",
+)
+
+_PAGE_SORT = [("created_at", -1), ("_id", -1)]
+
+# Statuses of runs that went through the whole graph — queued / running /
+# error campaigns have no strategy or QA outcome yet.
+FINISHED_STATUSES = ("completed", "failed")
+
+
+def encode_cursor(doc: dict[str, Any]) -> str:
+    """Opaque keyset cursor for the page after `doc` (its created_at and _id)."""
+    raw = json.dumps([doc["created_at"], str(doc["_id"])], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    """Inverse of `encode_cursor`. Raises ValueError for a malformed cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, campaign_id = json.loads(raw)
+    except (ValueError, TypeError) as exc:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from exc
+    if not isinstance(created_at, str) or not isinstance(campaign_id, str):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return created_at, campaign_id
+
+
+def _page_query(brand_id: str, cursor: str | None) -> dict[str, Any]:
+    query: dict[str, Any] = {"brand_id": brand_id}
+    if cursor:
+        created_at, campaign_id = decode_cursor(cursor)
+        query["$or"] = [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": campaign_id}},
+        ]
+    return query
+
+
+def _page_projection(fields: list[str] | None) -> list[str]:
+    # created_at is always kept: the next cursor is built from it.
+    return ["_id", "created_at", *(f for f in (fields or SUMMARY_FIELDS) if f != "created_at")]
+
+
+def _page(docs: list[dict[str, Any]], limit: int) -> dict[str, Any]:
+    next_cursor = encode_cursor(docs[limit - 1]) if len(docs) > limit else None
+    return {"items": [_doc_to_response(d) for d in docs[:limit]], "next_cursor": next_cursor}
+
+
+def list_page(
+    brand_id: str,
+    limit: int,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+) -> dict[str, Any]:
+    """
+    One page of a brand's campaigns, newest first: {"items", "next_cursor"}.
+    Keyset pagination on (created_at, _id) — pass next_cursor back for the
+    following page; it is None on the last one. `fields` picks the returned
+    fields (default SUMMARY_FIELDS).
+    """
+    docs = (
+        get_campaigns_collection()
+        .find(_page_query(brand_id, cursor), projection=_page_projection(fields))
+        .sort(_PAGE_SORT)
+        .limit(limit + 1)
+    )
+    return _page(list(docs), limit)
+
+
+async def alist_page(
+    brand_id: str,
+    limit: int,
+    cursor: str | None = None,
+    fields: list[str] | None = None,
+) -> dict[str, Any]:
+    """Async `list_page`."""
+    docs = (
+        get_async_campaigns_collection()
+        .find(_page_query(brand_id, cursor), projection=_page_projection(fields))
+        .sort(_PAGE_SORT)
+        .limit(limit + 1)
+    )
+    return _page([d async for d in docs], limit)
+
+
+def list_recent(brand_id: str, limit: int, fields: list[str]) -> list[dict[str, Any]]:
+    """
+    The brand's `limit` newest finished campaigns (FINISHED_STATUSES) with
+    only `fields` (dotted paths allowed, e.g. "strategy.channels"). In-flight
+    runs — including the one asking, and its batch siblings — are left out.
+    Sort, limit and projection all run in MongoDB on the
+    brand_id_created_at_id index (status is filtered on the fetched
+    documents), so cost does not grow with the brand's campaign history.
+    """
+    limit = max(limit, 1)  # limit(0) would mean "no limit" to MongoDB
+    query = {"brand_id": brand_id, "status": {"$in": list(FINISHED_STATUSES)}}
+    docs = (
+        get_campaigns_collection()
+        .find(query, projection=["_id", *fields])
+        .sort(_PAGE_SORT)
+        .limit(limit)
+    )
+    return [_doc_to_response(d) for d in docs]
+
+
+def list_by_ids(campaign_ids: list[str]) -> list[dict[str, Any]]:
+    """Return the given campaigns in one query, in `campaign_ids` order."""
+    docs = {d["_id"]: d for d in get_campaigns_collection().find({"_id": {"$in": campaign_ids}})}
+    return [_doc_to_response(docs[c]) for c in campaign_ids if c in docs]
+
+
+async def alist_by_ids(campaign_ids: list[str]) -> list[dict[str, Any]]:
+    """Async `list_by_ids`."""
+    cursor = get_async_campaigns_collection().find({"_id": {"$in": campaign_ids}})
+    docs = {d["_id"]: d async for d in cursor}
+    return [_doc_to_response(docs[c]) for c in campaign_ids if c in docs]
+
+
 def list_by_brand_id(brand_id: str) -> list[dict[str, Any]]:
     """Return all campaigns for the given brand_id."""
     return list_all(brand_id=brand_id)
@@ -70,8 +245,86 @@ def get_by_id(brand_id: str, campaign_id: str) -> dict[str, Any] | None:
     return _doc_to_response(doc)
 
 
+async def aget_by_id(brand_id: str, campaign_id: str) -> dict[str, Any] | None:
+    """Async `get_by_id`."""
+    coll = get_async_campaigns_collection()
+    doc = await coll.find_one({"_id": campaign_id})
+    if doc is None:
+        return None
+    return _doc_to_response(doc)
+
+
+def update(campaign_id: str, fields: dict[str, Any]) -> bool:
+    """Set fields on a campaign (job progress, results, status)."""
+    coll = get_campaigns_collection()
+    result = coll.update_one(
+        {"_id": campaign_id},
+        {"$set": {**fields, "updated_at": _now_iso()}},
+    )
+    return result.matched_count > 0
+
+
+async def aupdate(campaign_id: str, fields: dict[str, Any]) -> bool:
+    """Async `update`."""
+    coll = get_async_campaigns_collection()
+    result = await coll.update_one(
+        {"_id": campaign_id},
+        {"$set": {**fields, "updated_at": _now_iso()}},
+    )
+    return result.matched_count > 0
+
+
+def _bulk_updates(updates: dict[str, dict[str, Any]]) -> list[UpdateOne]:
+    now = _now_iso()
+    return [
+        UpdateOne({"_id": campaign_id}, {"$set": {**fields, "updated_at": now}})
+        for campaign_id, fields in updates.items()
+    ]
+
+
+def update_many(updates: dict[str, dict[str, Any]]) -> int:
+    """Set per-campaign fields on several campaigns in one bulk_write."""
+    if not updates:
+        return 0
+    result = get_campaigns_collection().bulk_write(_bulk_updates(updates), ordered=False)
+    return result.matched_count
+
+
+async def aupdate_many(updates: dict[str, dict[str, Any]]) -> int:
+    """Async `update_many`."""
+    if not updates:
+        return 0
+    result = await get_async_campaigns_collection().bulk_write(
+        _bulk_updates(updates), ordered=False
+    )
+    return result.matched_count
+
+
+# Fields returned by the status endpoint — never the heavy result blobs.
+_STATUS_PROJECTION = [
+    "_id", "brand_id", "status", "completed_nodes", "failed_channels", "error", "research_reused",
+    "updated_at",
+]
+
+
+async def aget_status(brand_id: str, campaign_id: str) -> dict[str, Any] | None:
+    """Return the job status fields of one campaign, or None if not found."""
+    coll = get_async_campaigns_collection()
+    doc = await coll.find_one({"_id": campaign_id}, projection=_STATUS_PROJECTION)
+    if doc is None:
+        return None
+    return _doc_to_response(doc)
+
+
 def delete(campaign_id: str) -> bool:
     """Remove campaign by campaign_id. Returns True if deleted."""
     coll = get_campaigns_collection()
     result = coll.delete_one({"_id": campaign_id})
     return result.deleted_count > 0
+
+
+async def adelete(campaign_id: str) -> bool:
+    """Async `delete`."""
+    coll = get_async_campaigns_collection()
+    result = await coll.delete_one({"_id": campaign_id})
+    return result.deleted_count > 0
@@ -1,14 +1,27 @@
 # app/graph/builder.py
 import logging
 
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END, StateGraph
 
-from app.graph.nodes.analytics_node import analytics_node
-from app.graph.nodes.content_node import content_node
-from app.graph.nodes.publish_node import publish_node
-from app.graph.nodes.qa_node import qa_node
-from app.graph.nodes.research_node import research_node
-from app.graph.nodes.strategy_node import strategy_node
+from app.core.settings import settings
+from app.graph.nodes.analytics_node import analytics_node, aanalytics_node
+from app.graph.nodes.content_channel_node import (
+    acontent_channel_node,
+    content_channel_node,
+    dispatch_channels,
+)
+from app.graph.nodes.content_node import (
+    acontent_node,
+    amerge_content_node,
+    content_node,
+    merge_content_node,
+)
+from app.graph.nodes.publish_node import apublish_node, publish_node
+from app.graph.nodes.qa_gate_node import aqa_gate_node, qa_gate_node
+from app.graph.nodes.qa_node import aqa_node, qa_node
+from app.graph.nodes.research_node import aresearch_node, research_node
+from app.graph.nodes.strategy_node import astrategy_node, strategy_node
 from app.graph.state import CampaignState
 
 logger = logging.getLogger("campaign_graph")
@@ -16,7 +29,7 @@ logger = logging.getLogger("campaign_graph")
 
 def _qa_router(state: CampaignState) -> str:
     """
-    Route after QA:
+    Route after the qa / analytics join:
     - zero critical_issues → publish (recommendations are logged but don't block)
     - any critical_issues  → END (hard violations block publishing)
     """
@@ -41,25 +54,66 @@ def _qa_router(state: CampaignState) -> str:
     return END
 
 
-def build_campaign_graph():
+def _node(name: str, func, afunc) -> RunnableLambda:
+    """
+    Pair a node's sync and async implementations so the same compiled graph
+    serves both `graph.invoke` (sync callers) and `graph.ainvoke` (async
+    route) without the async path falling back to a worker thread.
+    """
+    return RunnableLambda(func, afunc=afunc, name=name)
+
+
+def build_campaign_graph(checkpointer=None):
+    """
+    research → strategy → content ─┬─ qa ────────┬─ qa_gate ─(router)─ publish
+                                   └─ analytics ─┘                  └─ END
+
+    Analytics only needs content + strategy, so it runs alongside QA instead
+    of after publish — its LLM round-trip is off the critical path. qa_gate
+    waits for both branches before routing.
+
+    With content_mode="per_channel" (default), strategy fans out one
+    content_channel task per strategy channel (Send) and the content node
+    merges their assets; "single" writes every asset in one call.
+    """
     graph = StateGraph(CampaignState)
 
-    graph.add_node("research", research_node)
-    graph.add_node("strategy", strategy_node)
-    graph.add_node("content", content_node)
-    graph.add_node("qa", qa_node)
-    graph.add_node("publish", publish_node)
-    graph.add_node("analytics", analytics_node)
+    graph.add_node("research", _node("research", research_node, aresearch_node))
+    graph.add_node("strategy", _node("strategy", strategy_node, astrategy_node))
+    per_channel = settings.content_mode.strip().lower() == "per_channel"
+    if per_channel:
+        graph.add_node(
+            "content_channel",
+            _node("content_channel", content_channel_node, acontent_channel_node),
+        )
+        graph.add_node("content", _node("content", merge_content_node, amerge_content_node))
+    else:
+        graph.add_node("content", _node("content", content_node, acontent_node))
+    graph.add_node("qa", _node("qa", qa_node, aqa_node))
+    graph.add_node("publish", _node("publish", publish_node, apublish_node))
+    graph.add_node("analytics", _node("analytics", analytics_node, aanalytics_node))
+    graph.add_node("qa_gate", _node("qa_gate", qa_gate_node, aqa_gate_node))
 
     graph.set_entry_point("research")
 
     graph.add_edge("research", "strategy")
-    graph.add_edge("strategy", "content")
+    if per_channel:
+        # Map — one content_channel task per channel; reduce in content
+        graph.add_conditional_edges("strategy", dispatch_channels, ["content_channel", "content"])
+        graph.add_edge("content_channel", "content")
+    else:
+        graph.add_edge("strategy", "content")
+
+    # Fan out — QA and analytics both only need content + strategy
     graph.add_edge("content", "qa")
+    graph.add_edge("content", "analytics")
+
+    # Join — qa_gate runs once both branches have finished
+    graph.add_edge(["qa", "analytics"], "qa_gate")
 
     # Conditional — only hard violations block publishing
     graph.add_conditional_edges(
-        "qa",
+        "qa_gate",
         _qa_router,
         {
             "publish": "publish",
@@ -67,7 +121,6 @@ def build_campaign_graph():
         },
     )
 
-    graph.add_edge("publish", "analytics")
-    graph.set_finish_point("analytics")
+    graph.set_finish_point("publish")
 
-    return graph.compile()
\ No newline at end of file
+    return graph.compile(checkpointer=checkpointer)
\ No newline at end of file
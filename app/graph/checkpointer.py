@@ -0,0 +1,351 @@
+# app/graph/checkpointer.py
+"""
+Checkpoint persistence for the campaign graph.
+
+With a checkpointer, LangGraph saves the state after every super-step under
+the run's thread_id (= campaign_id). If content or QA fails after a costly
+research + strategy run, resuming the thread re-runs only the nodes that had
+not finished — completed node outputs are read back, not regenerated.
+
+Backends, selected by settings.graph_checkpointer:
+  mongo   → MongoCheckpointSaver below (graph_checkpoints +
+            graph_checkpoint_writes collections) — survives restarts and is
+            shared by API and Celery workers
+  memory  → LangGraph's InMemorySaver — per process, for tests / local dev
+  none    → no checkpointing; resume falls back to a fresh run
+"""
+from __future__ import annotations
+
+import logging
+from functools import lru_cache
+from typing import Any, AsyncIterator, Iterator, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+from pymongo import ASCENDING, DESCENDING, UpdateOne
+
+from app.core.settings import settings
+from app.db.mongodb import (
+    get_async_checkpoint_writes_collection,
+    get_async_checkpoints_collection,
+    get_checkpoint_writes_collection,
+    get_checkpoints_collection,
+)
+
+logger = logging.getLogger("campaign_graph")
+
+
+class MongoCheckpointSaver(BaseCheckpointSaver[str]):
+    """
+    Checkpoint saver on the app's MongoDB (sync + async drivers).
+
+    One document per checkpoint — channel values are stored inline, which is
+    fine at this graph's size (six nodes, one state dict). Values go through
+    LangGraph's serde, so anything the graph can hold round-trips.
+    """
+
+    # ------------------------------------------------------------------
+    # Sync
+    # ------------------------------------------------------------------
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        query = self._checkpoint_query(config)
+        doc = get_checkpoints_collection().find_one(query, sort=[("checkpoint_id", DESCENDING)])
+        if doc is None:
+            return None
+        writes = get_checkpoint_writes_collection().find(self._writes_query(doc)).sort(
+            [("task_id", ASCENDING), ("idx", ASCENDING)]
+        )
+        return self._to_tuple(doc, list(writes))
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        cursor = get_checkpoints_collection().find(self._list_query(config, before)).sort(
+            "checkpoint_id", DESCENDING
+        )
+        for doc in cursor:
+            if not self._matches(doc, filter):
+                continue
+            if limit is not None:
+                if limit <= 0:
+                    break
+                limit -= 1
+            writes = get_checkpoint_writes_collection().find(self._writes_query(doc)).sort(
+                [("task_id", ASCENDING), ("idx", ASCENDING)]
+            )
+            yield self._to_tuple(doc, list(writes))
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        doc = self._checkpoint_doc(config, checkpoint, metadata)
+        get_checkpoints_collection().replace_one(
+            {"_id": doc["_id"]}, doc, upsert=True
+        )
+        return self._saved_config(config, checkpoint)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        ops = self._write_ops(config, writes, task_id, task_path)
+        if ops:
+            get_checkpoint_writes_collection().bulk_write(ops, ordered=False)
+
+    def delete_thread(self, thread_id: str) -> None:
+        get_checkpoints_collection().delete_many({"thread_id": thread_id})
+        get_checkpoint_writes_collection().delete_many({"thread_id": thread_id})
+
+    # ------------------------------------------------------------------
+    # Async
+    # ------------------------------------------------------------------
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        query = self._checkpoint_query(config)
+        doc = await get_async_checkpoints_collection().find_one(
+            query, sort=[("checkpoint_id", DESCENDING)]
+        )
+        if doc is None:
+            return None
+        cursor = get_async_checkpoint_writes_collection().find(self._writes_query(doc)).sort(
+            [("task_id", ASCENDING), ("idx", ASCENDING)]
+        )
+        return self._to_tuple(doc, await cursor.to_list(length=None))
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        cursor = get_async_checkpoints_collection().find(self._list_query(config, before)).sort(
+            "checkpoint_id", DESCENDING
+        )
+        async for doc in cursor:
+            if not self._matches(doc, filter):
+                continue
+            if limit is not None:
+                if limit <= 0:
+                    break
+                limit -= 1
+            writes = get_async_checkpoint_writes_collection().find(self._writes_query(doc)).sort(
+                [("task_id", ASCENDING), ("idx", ASCENDING)]
+            )
+            yield self._to_tuple(doc, await writes.to_list(length=None))
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        doc = self._checkpoint_doc(config, checkpoint, metadata)
+        await get_async_checkpoints_collection().replace_one(
+            {"_id": doc["_id"]}, doc, upsert=True
+        )
+        return self._saved_config(config, checkpoint)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        ops = self._write_ops(config, writes, task_id, task_path)
+        if ops:
+            await get_async_checkpoint_writes_collection().bulk_write(ops, ordered=False)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await get_async_checkpoints_collection().delete_many({"thread_id": thread_id})
+        await get_async_checkpoint_writes_collection().delete_many({"thread_id": thread_id})
+
+    # ------------------------------------------------------------------
+    # Document mapping
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _checkpoint_query(config: RunnableConfig) -> dict[str, Any]:
+        configurable = config["configurable"]
+        query = {
+            "thread_id": configurable["thread_id"],
+            "checkpoint_ns": configurable.get("checkpoint_ns", ""),
+        }
+        if checkpoint_id := get_checkpoint_id(config):
+            query["checkpoint_id"] = checkpoint_id
+        return query
+
+    @staticmethod
+    def _list_query(config: RunnableConfig | None, before: RunnableConfig | None) -> dict[str, Any]:
+        query: dict[str, Any] = {}
+        if config:
+            configurable = config["configurable"]
+            query["thread_id"] = configurable["thread_id"]
+            if (checkpoint_ns := configurable.get("checkpoint_ns")) is not None:
+                query["checkpoint_ns"] = checkpoint_ns
+            if checkpoint_id := get_checkpoint_id(config):
+                query["checkpoint_id"] = checkpoint_id
+        if before and (before_id := get_checkpoint_id(before)) and "checkpoint_id" not in query:
+            query["checkpoint_id"] = {"$lt": before_id}
+        return query
+
+    @staticmethod
+    def _writes_query(doc: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "thread_id": doc["thread_id"],
+            "checkpoint_ns": doc["checkpoint_ns"],
+            "checkpoint_id": doc["checkpoint_id"],
+        }
+
+    def _matches(self, doc: dict[str, Any], filter: dict[str, Any] | None) -> bool:
+        if not filter:
+            return True
+        metadata = self.serde.loads_typed((doc["metadata_type"], doc["metadata"]))
+        return all(metadata.get(k) == v for k, v in filter.items())
+
+    def _checkpoint_doc(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+    ) -> dict[str, Any]:
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        checkpoint_type, checkpoint_bytes = self.serde.dumps_typed(checkpoint)
+        metadata_type, metadata_bytes = self.serde.dumps_typed(
+            get_checkpoint_metadata(config, metadata)
+        )
+        return {
+            "_id": f"{thread_id}:{checkpoint_ns}:{checkpoint['id']}",
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns,
+            "checkpoint_id": checkpoint["id"],
+            "parent_checkpoint_id": configurable.get("checkpoint_id"),
+            "checkpoint_type": checkpoint_type,
+            "checkpoint": checkpoint_bytes,
+            "metadata_type": metadata_type,
+            "metadata": metadata_bytes,
+        }
+
+    @staticmethod
+    def _saved_config(config: RunnableConfig, checkpoint: Checkpoint) -> RunnableConfig:
+        configurable = config["configurable"]
+        return {
+            "configurable": {
+                "thread_id": configurable["thread_id"],
+                "checkpoint_ns": configurable.get("checkpoint_ns", ""),
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def _write_ops(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str,
+    ) -> list[UpdateOne]:
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        checkpoint_id = configurable["checkpoint_id"]
+
+        ops = []
+        for idx, (channel, value) in enumerate(writes):
+            write_idx = WRITES_IDX_MAP.get(channel, idx)
+            value_type, value_bytes = self.serde.dumps_typed(value)
+            doc = {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint_id,
+                "task_id": task_id,
+                "task_path": task_path,
+                "idx": write_idx,
+                "channel": channel,
+                "value_type": value_type,
+                "value": value_bytes,
+            }
+            _id = f"{thread_id}:{checkpoint_ns}:{checkpoint_id}:{task_id}:{write_idx}"
+            # Special writes (errors, interrupts — negative idx) overwrite;
+            # regular writes are kept from the first attempt, as InMemorySaver does.
+            if write_idx < 0:
+                ops.append(UpdateOne({"_id": _id}, {"$set": doc}, upsert=True))
+            else:
+                ops.append(UpdateOne({"_id": _id}, {"$setOnInsert": doc}, upsert=True))
+        return ops
+
+    def _to_tuple(self, doc: dict[str, Any], writes: list[dict[str, Any]]) -> CheckpointTuple:
+        thread_id = doc["thread_id"]
+        checkpoint_ns = doc["checkpoint_ns"]
+        parent_id = doc.get("parent_checkpoint_id")
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": doc["checkpoint_id"],
+                }
+            },
+            checkpoint=self.serde.loads_typed((doc["checkpoint_type"], doc["checkpoint"])),
+            metadata=self.serde.loads_typed((doc["metadata_type"], doc["metadata"])),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_id,
+                    }
+                }
+                if parent_id
+                else None
+            ),
+            pending_writes=[
+                (w["task_id"], w["channel"], self.serde.loads_typed((w["value_type"], w["value"])))
+                for w in writes
+            ],
+        )
+
+
+@lru_cache(maxsize=None)
+def get_checkpointer() -> BaseCheckpointSaver | None:
+    """Process-wide checkpointer from settings.graph_checkpointer, or None."""
+    backend = settings.graph_checkpointer.strip().lower()
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return InMemorySaver()
+    if backend == "mongo":
+        return MongoCheckpointSaver()
+    raise ValueError(f"Unsupported graph checkpointer: {backend!r}")
+
+
+def thread_config(campaign_id: str) -> RunnableConfig:
+    """Run config binding a graph run to its campaign's checkpoint thread."""
+    return {"configurable": {"thread_id": campaign_id}}
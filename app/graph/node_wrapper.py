@@ -1,16 +1,36 @@
+import inspect
 import time
 import logging
 
+from app.memory.brand_snapshot import brand_snapshot
+
 logger = logging.getLogger("campaign_graph")
 
 
 def node_logger(node_name):
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            async def async_wrapper(state):
+                logger.info(f"NODE_START | {node_name}")
+                start = time.time()
+
+                with brand_snapshot(state.get("brand_context")):
+                    result = await func(state)
+
+                duration = round(time.time() - start, 3)
+                logger.info(
+                    f"NODE_END | {node_name} | duration={duration}s"
+                )
+
+                return result
+            return async_wrapper
+
         def wrapper(state):
             logger.info(f"NODE_START | {node_name}")
             start = time.time()
 
-            result = func(state)
+            with brand_snapshot(state.get("brand_context")):
+                result = func(state)
 
             duration = round(time.time() - start, 3)
             logger.info(
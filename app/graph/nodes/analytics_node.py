@@ -13,5 +13,17 @@ def analytics_node(state):
         target_audience=state.get("target_audience", ""),
         budget=state.get("budget", 0.0),
     )
-    state["analytics"] = report.model_dump()
-    return state
\ No newline at end of file
+    return {"analytics": report.model_dump()}
+
+
+@node_logger("analytics")
+async def aanalytics_node(state):
+    agent = AnalyticsAgent()
+    report = await agent.arun(
+        content=state.get("content"),
+        strategy=state.get("strategy", {}),
+        goal=state.get("goal", ""),
+        target_audience=state.get("target_audience", ""),
+        budget=state.get("budget", 0.0),
+    )
+    return {"analytics": report.model_dump()}
\ No newline at end of file
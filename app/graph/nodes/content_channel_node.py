@@ -0,0 +1,102 @@
+# app/graph/nodes/content_channel_node.py
+"""
+Per-channel content fan-out.
+
+dispatch_channels() maps each strategy channel to its own content_channel
+task via Send; LangGraph runs them concurrently in one super-step. Each task
+retries only its own channel, and a channel that still fails is recorded in
+`failed_channels` instead of sinking the assets of every other channel.
+The content node (merge_content_node) reduces them into ContentOutput.
+"""
+import logging
+
+from langgraph.config import get_stream_writer
+from langgraph.types import Send
+
+from app.agents.content_agent import ContentAgent
+from app.core.settings import settings
+from app.graph.node_wrapper import node_logger
+
+logger = logging.getLogger("campaign_graph")
+
+
+def strategy_channels(state) -> list[str]:
+    """Strategy channels in order, de-duplicated."""
+    channels = (state.get("strategy") or {}).get("channels") or []
+    return list(dict.fromkeys(c for c in channels if c))
+
+
+def dispatch_channels(state):
+    """Conditional edge after strategy: one content_channel task per channel."""
+    channels = strategy_channels(state)
+    if not channels:
+        # Nothing to fan out over — the content node falls back to one call.
+        return "content"
+    logger.info(f"CONTENT_FANOUT | channels={len(channels)} | {channels}")
+    return [
+        Send(
+            "content_channel",
+            {
+                "channel": channel,
+                "strategy": state.get("strategy"),
+                "brand_context": state.get("brand_context", {}),
+                "goal": state.get("goal", ""),
+                "target_audience": state.get("target_audience", ""),
+                "budget": state.get("budget", 0.0),
+            },
+        )
+        for channel in channels
+    ]
+
+
+def _channel_kwargs(task) -> dict:
+    return {
+        "channel": task["channel"],
+        "strategy": task.get("strategy"),
+        "brand_context": task.get("brand_context", {}),
+        "goal": task.get("goal", ""),
+        "target_audience": task.get("target_audience", ""),
+        "budget": task.get("budget", 0.0),
+    }
+
+
+def _failed(channel: str, attempts: int, exc: Exception) -> dict:
+    logger.error(
+        f"CONTENT_CHANNEL | failed | channel={channel} | attempts={attempts} | error={exc}"
+    )
+    return {"failed_channels": [channel]}
+
+
+@node_logger("content_channel")
+def content_channel_node(task):
+    agent = ContentAgent()
+    attempts = max(1, settings.content_channel_max_attempts)
+    for attempt in range(1, attempts + 1):
+        try:
+            asset = agent.run_channel(**_channel_kwargs(task))
+            return {"channel_assets": [asset.model_dump()]}
+        except Exception as exc:
+            if attempt == attempts:
+                return _failed(task["channel"], attempts, exc)
+            logger.warning(
+                f"CONTENT_CHANNEL | retry | channel={task['channel']} | attempt={attempt} | error={exc}"
+            )
+
+
+@node_logger("content_channel")
+async def acontent_channel_node(task):
+    writer = get_stream_writer()
+    agent = ContentAgent()
+    attempts = max(1, settings.content_channel_max_attempts)
+    for attempt in range(1, attempts + 1):
+        try:
+            asset = await agent.arun_channel(**_channel_kwargs(task))
+        except Exception as exc:
+            if attempt == attempts:
+                return _failed(task["channel"], attempts, exc)
+            logger.warning(
+                f"CONTENT_CHANNEL | retry | channel={task['channel']} | attempt={attempt} | error={exc}"
+            )
+            continue
+        writer({"event": "content_asset", "data": {"node": "content", "asset": asset.model_dump()}})
+        return {"channel_assets": [asset.model_dump()]}
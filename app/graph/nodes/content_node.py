@@ -1,10 +1,18 @@
 # app/graph/nodes/content_node.py
+import asyncio
+import logging
+
+from langgraph.config import get_stream_writer
+
 from app.agents.content_agent import ContentAgent
 from app.graph.node_wrapper import node_logger
+from app.graph.nodes.content_channel_node import strategy_channels
+from app.schemas.content import ContentOutput
 
+logger = logging.getLogger("campaign_graph")
 
-@node_logger("content")
-def content_node(state):
+
+def _generate(state):
     agent = ContentAgent()
     content_output = agent.run(
         strategy=state.get("strategy"),
@@ -13,5 +21,123 @@ def content_node(state):
         target_audience=state.get("target_audience", ""),
         budget=state.get("budget", 0.0),
     )
-    state["content"] = content_output.model_dump()
-    return state
\ No newline at end of file
+    return {"content": content_output.model_dump()}
+
+
+async def _agenerate(state):
+    # Each asset is pushed to "custom" stream consumers (the SSE endpoint) as
+    # soon as the model closes it; a no-op when nobody streams that mode.
+    writer = get_stream_writer()
+
+    def on_asset(asset):
+        writer({"event": "content_asset", "data": {"node": "content", "asset": asset.model_dump()}})
+
+    agent = ContentAgent()
+    content_output = await agent.arun(
+        strategy=state.get("strategy"),
+        brand_context=state.get("brand_context", {}),
+        goal=state.get("goal", ""),
+        target_audience=state.get("target_audience", ""),
+        budget=state.get("budget", 0.0),
+        on_asset=on_asset,
+    )
+    return {"content": content_output.model_dump()}
+
+
+def failed_channels(state) -> list[str]:
+    """
+    Channels whose content_channel task gave up and that the merged
+    `content` still lacks (the content node may have regenerated them).
+    Persisted on the campaign and reported by QA.
+    """
+    produced = {a.get("channel") for a in (state.get("content") or {}).get("assets") or []}
+    failed = state.get("failed_channels") or []
+    return [c for c in dict.fromkeys(failed) if c not in produced]
+
+
+def _collected(state) -> list[dict]:
+    """Per-channel assets from the fan-out, in strategy order."""
+    by_channel = {a["channel"]: a for a in state.get("channel_assets") or []}
+    return [by_channel[c] for c in strategy_channels(state) if c in by_channel]
+
+
+def _channel_kwargs(state, channel: str) -> dict:
+    return {
+        "channel": channel,
+        "strategy": state.get("strategy"),
+        "brand_context": state.get("brand_context", {}),
+        "goal": state.get("goal", ""),
+        "target_audience": state.get("target_audience", ""),
+        "budget": state.get("budget", 0.0),
+    }
+
+
+def _regenerate(state) -> list[dict]:
+    """
+    Every content_channel task failed. A resume restarts at this node, not
+    at the fan-out, so the channels are retried here — otherwise each resume
+    would hit the same empty channel_assets and fail again.
+    """
+    channels = strategy_channels(state)
+    logger.warning(f"CONTENT_MERGE | no channel assets | regenerating={channels}")
+    agent = ContentAgent()
+    assets = []
+    for channel in channels:
+        try:
+            assets.append(agent.run_channel(**_channel_kwargs(state, channel)).model_dump())
+        except Exception as exc:
+            logger.error(f"CONTENT_MERGE | regenerate failed | channel={channel} | error={exc}")
+    return assets
+
+
+async def _aregenerate(state) -> list[dict]:
+    channels = strategy_channels(state)
+    logger.warning(f"CONTENT_MERGE | no channel assets | regenerating={channels}")
+    agent = ContentAgent()
+    results = await asyncio.gather(
+        *(agent.arun_channel(**_channel_kwargs(state, c)) for c in channels),
+        return_exceptions=True,
+    )
+    assets = []
+    for channel, result in zip(channels, results):
+        if isinstance(result, Exception):
+            logger.error(f"CONTENT_MERGE | regenerate failed | channel={channel} | error={result}")
+        else:
+            assets.append(result.model_dump())
+    return assets
+
+
+def _merge(state, assets: list[dict]):
+    """Reduce the per-channel assets into ContentOutput, in strategy order."""
+    if not assets:
+        # Raising keeps the run resumable: the checkpoint resumes at content,
+        # which regenerates the channels again.
+        failed = state.get("failed_channels") or strategy_channels(state)
+        raise RuntimeError(f"Content generation failed for every channel: {failed}")
+    return {"content": ContentOutput.model_validate({"assets": assets}).model_dump()}
+
+
+@node_logger("content")
+def content_node(state):
+    """Single call — every channel's asset in one ContentOutput (content_mode=single)."""
+    return _generate(state)
+
+
+@node_logger("content")
+async def acontent_node(state):
+    return await _agenerate(state)
+
+
+@node_logger("content")
+def merge_content_node(state):
+    """Join of the content_channel fan-out; single call when there are no channels."""
+    if not strategy_channels(state):
+        return _generate(state)
+    return _merge(state, _collected(state) or _regenerate(state))
+
+
+@node_logger("content")
+async def amerge_content_node(state):
+    if not strategy_channels(state):
+        return await _agenerate(state)
+    return _merge(state, _collected(state) or await _aregenerate(state))
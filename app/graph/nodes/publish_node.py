@@ -2,5 +2,9 @@ from app.graph.node_wrapper import node_logger
 
 @node_logger("publish")
 def publish_node(state):
-    state["status"] = "published"
-    return state
\ No newline at end of file
+    return {"status": "published"}
+
+
+@node_logger("publish")
+async def apublish_node(state):
+    return {"status": "published"}
\ No newline at end of file
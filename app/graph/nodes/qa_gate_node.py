@@ -0,0 +1,22 @@
+# app/graph/nodes/qa_gate_node.py
+from app.core.settings import settings
+from app.graph.node_wrapper import node_logger
+
+
+def _gate(state):
+    qa_report = state.get("qa_report") or {}
+    if qa_report.get("critical_issues") and settings.discard_analytics_on_qa_halt:
+        # The campaign will not publish — don't keep a forecast for it.
+        return {"analytics": None}
+    return {}
+
+
+@node_logger("qa_gate")
+def qa_gate_node(state):
+    """Join point of the parallel qa / analytics branches; routing follows."""
+    return _gate(state)
+
+
+@node_logger("qa_gate")
+async def aqa_gate_node(state):
+    return _gate(state)
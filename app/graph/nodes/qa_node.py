@@ -1,6 +1,20 @@
 # app/graph/nodes/qa_node.py
 from app.agents.qa_agent import QAAgent
 from app.graph.node_wrapper import node_logger
+from app.graph.nodes.content_node import failed_channels
+from app.schemas.qa import QAReport
+
+
+def _report(report: QAReport, state) -> dict:
+    # A channel that failed generation is absent from content, so the
+    # reviewer never sees it — say so in the report instead of silently
+    # publishing without it.
+    for channel in failed_channels(state):
+        report.recommendations.append(
+            f"{channel} — no asset: content generation failed for this planned channel. "
+            "Regenerate it before launch."
+        )
+    return {"qa_report": report.model_dump()}
 
 
 @node_logger("qa")
@@ -13,5 +27,17 @@ def qa_node(state):
         goal=state.get("goal", ""),
         target_audience=state.get("target_audience", ""),
     )
-    state["qa_report"] = report.model_dump()
-    return state
\ No newline at end of file
+    return _report(report, state)
+
+
+@node_logger("qa")
+async def aqa_node(state):
+    agent = QAAgent()
+    report = await agent.arun(
+        content=state.get("content"),
+        brand_context=state.get("brand_context", {}),
+        strategy=state.get("strategy", {}),
+        goal=state.get("goal", ""),
+        target_audience=state.get("target_audience", ""),
+    )
+    return _report(report, state)
\ No newline at end of file
@@ -1,16 +1,41 @@
 # app/graph/nodes/research_node.py
-from app.agents.research_agent import ResearchAgent
+import logging
+
 from app.graph.node_wrapper import node_logger
+from app.memory.research_memory import aresearch_with_reuse, research_with_reuse
+
+logger = logging.getLogger("campaign_graph")
+
+
+def _preloaded(state) -> bool:
+    """Batch runs share one research result per (goal, audience) cluster."""
+    if state.get("research"):
+        logger.info(f"RESEARCH | preloaded | campaign_id={state.get('campaign_id')}")
+        return True
+    return False
 
 
 @node_logger("research")
 def research_node(state):
-    agent = ResearchAgent()
-    research_output = agent.run(
+    if _preloaded(state):
+        return {}
+    research, reused = research_with_reuse(
+        brand_context=state.get("brand_context", {}),
+        goal=state.get("goal", ""),
+        target_audience=state.get("target_audience", ""),
+        budget=state.get("budget", 0.0),
+    )
+    return {"research": research, "research_reused": reused}
+
+
+@node_logger("research")
+async def aresearch_node(state):
+    if _preloaded(state):
+        return {}
+    research, reused = await aresearch_with_reuse(
         brand_context=state.get("brand_context", {}),
         goal=state.get("goal", ""),
         target_audience=state.get("target_audience", ""),
         budget=state.get("budget", 0.0),
     )
-    state["research"] = research_output.model_dump()
-    return state
\ No newline at end of file
+    return {"research": research, "research_reused": reused}
@@ -13,5 +13,17 @@ def strategy_node(state):
         target_audience=state.get("target_audience", ""),
         budget=state.get("budget", 0.0),
     )
-    state["strategy"] = strategy_output.model_dump()
-    return state
\ No newline at end of file
+    return {"strategy": strategy_output.model_dump()}
+
+
+@node_logger("strategy")
+async def astrategy_node(state):
+    agent = StrategyAgent()
+    strategy_output = await agent.arun(
+        research=state.get("research"),
+        brand_context=state.get("brand_context", {}),
+        goal=state.get("goal", ""),
+        target_audience=state.get("target_audience", ""),
+        budget=state.get("budget", 0.0),
+    )
+    return {"strategy": strategy_output.model_dump()}
\ No newline at end of file
@@ -0,0 +1,67 @@
+# app/graph/registry.py
+"""
+Process-wide compiled campaign graph.
+
+Compiling the StateGraph (six nodes, edges, channel setup) on every request
+is pure overhead — the topology never changes at runtime, and a compiled
+graph holds no per-run state (that lives in the input dict), so a single
+instance is safely shared by every request, thread and event loop.
+
+The cached graph is keyed on a fingerprint of AGENT_MODEL_MAP. If the map is
+edited at runtime — or invalidate_campaign_graph() is called — the next
+access recompiles the graph and drops LLMFactory's cached provider clients,
+so nodes pick up the new provider/model mapping.
+
+The graph is compiled with the process-wide checkpointer (see
+app/graph/checkpointer.py) — it outlives recompiles, so saved runs stay
+resumable.
+"""
+import json
+import logging
+import threading
+
+from app.config import AGENT_MODEL_MAP
+from app.graph.builder import build_campaign_graph
+from app.graph.checkpointer import get_checkpointer
+from app.services.llm.llm_factory import LLMFactory
+
+logger = logging.getLogger("campaign_graph")
+
+_lock = threading.Lock()
+_graph = None
+_fingerprint: str | None = None
+
+
+def _model_map_fingerprint() -> str:
+    return json.dumps(AGENT_MODEL_MAP, sort_keys=True)
+
+
+def get_campaign_graph():
+    """Return the shared compiled graph, compiling it on first use."""
+    global _graph, _fingerprint
+
+    fingerprint = _model_map_fingerprint()
+    graph = _graph
+    if graph is not None and _fingerprint == fingerprint:
+        return graph
+
+    with _lock:
+        if _graph is not None and _fingerprint != fingerprint:
+            logger.info("Graph registry | AGENT_MODEL_MAP changed → recompiling")
+            LLMFactory.get_llm.cache_clear()
+        if _graph is None or _fingerprint != fingerprint:
+            _graph = build_campaign_graph(checkpointer=get_checkpointer())
+            _fingerprint = fingerprint
+            logger.info("Graph registry | campaign graph compiled")
+        return _graph
+
+
+def invalidate_campaign_graph() -> None:
+    """Drop the compiled graph and cached LLM clients; next access rebuilds."""
+    global _graph, _fingerprint
+
+    with _lock:
+        _graph = None
+        _fingerprint = None
+        LLMFactory.get_llm.cache_clear()
+    logger.info("Graph registry | invalidated")
@@ -1,4 +1,5 @@
-from typing import TypedDict, Optional, List, Dict
+import operator
+from typing import Annotated, TypedDict, Optional, List, Dict
 
 
 class CampaignState(TypedDict):
@@ -13,8 +14,13 @@ class CampaignState(TypedDict):
     budget: Optional[float]
 
     research: Optional[dict]  # ResearchOutput.model_dump()
+    research_reused: bool     # research served from the store (app/memory/research_memory.py)
     strategy: Optional[dict]  # StrategyOutput.model_dump()
     content: Optional[dict]   # ContentOutput.model_dump()
+    # Per-channel content fan-out — each content_channel task appends here,
+    # then the content node merges them into `content`
+    channel_assets: Annotated[List[dict], operator.add]   # ContentAsset.model_dump()
+    failed_channels: Annotated[List[str], operator.add]
     qa_report: Optional[dict]  # QAReport.model_dump()
     analytics: Optional[dict]  # AnalyticsReport.model_dump()
 
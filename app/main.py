@@ -1,5 +1,7 @@
 # app/main.py
+import logging
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -16,10 +18,24 @@ os.environ["LANGCHAIN_PROJECT"] = settings.langsmith_project
 
 from app.api.routes_brand import router as brand_router
 from app.api.routes_campaign import router as campaign_router
+from app.db.indexes import aensure_indexes
 
 setup_logging()
+logger = logging.getLogger("main")
 
-app = FastAPI(title="Multi Agents Marketing and Growth System")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.mongodb_ensure_indexes:
+        try:
+            await aensure_indexes()
+        except Exception as exc:
+            # Serve anyway — queries still work, just without the indexes.
+            logger.error(f"DB_INDEXES | failed | error={exc}")
+    yield
+
+
+app = FastAPI(title="Multi Agents Marketing and Growth System", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -2,6 +2,7 @@
 from typing import Any
 
 from app.db.mongodb import get_brands_collection
+from app.db.repositories.brand_repo import invalidate
 
 
 def get_memory(brand_id: str) -> dict[str, Any]:
@@ -22,6 +23,7 @@ def set_memory(brand_id: str, memory: dict[str, Any]) -> None:
         {"$set": {"memory": memory}},
         upsert=False,
     )
+    invalidate(brand_id)
 
 
 def delete_memory(brand_id: str) -> None:
@@ -31,3 +33,4 @@ def delete_memory(brand_id: str) -> None:
         {"_id": brand_id},
         {"$set": {"memory": {}}},
     )
+    invalidate(brand_id)
@@ -0,0 +1,44 @@
+# app/memory/brand_snapshot.py
+"""
+Per-run brand snapshot for the brand tools.
+
+Every campaign run already carries the full brand in
+CampaignState["brand_context"]. node_logger binds it here for the duration
+of each graph node, and get_brand_memory / get_brand_guidelines /
+get_brand_tone read it through load_brand() instead of querying MongoDB —
+one run sees one consistent brand view and makes no brand round trips.
+
+The snapshot lives in a ContextVar, so it follows the node into ReAct
+tool threads (copied contexts) and never leaks between concurrent runs.
+Outside a run, or for another brand id, load_brand() falls back to the
+process-level cache in brand_repo.
+"""
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator
+
+from app.db.repositories.brand_repo import get_cached
+
+logger = logging.getLogger("memory.brand_snapshot")
+
+_snapshot: ContextVar[dict[str, Any] | None] = ContextVar("brand_snapshot", default=None)
+
+
+@contextmanager
+def brand_snapshot(brand_context: dict[str, Any] | None) -> Iterator[None]:
+    """Bind `brand_context` as the current run's brand inside the block."""
+    token = _snapshot.set(brand_context or None)
+    try:
+        yield
+    finally:
+        _snapshot.reset(token)
+
+
+def load_brand(brand_id: str) -> dict[str, Any] | None:
+    """The brand as seen by the current run, else a (cached) database read."""
+    snapshot = _snapshot.get()
+    if snapshot is not None and str(snapshot.get("id", "")) == brand_id:
+        logger.info(f"BRAND_SNAPSHOT | hit | brand_id={brand_id}")
+        return snapshot
+    return get_cached(brand_id)
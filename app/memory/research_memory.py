@@ -0,0 +1,239 @@
+# app/memory/research_memory.py
+"""
+Research reuse across campaigns of the same brand.
+
+Finished ResearchOutputs are stored under brand_id + industry + a
+fingerprint of the normalized goal and audience (case, punctuation, word
+order and filler words ignored). A later campaign with a matching
+fingerprint gets, by age of the stored research:
+
+  <= RESEARCH_FRESH_HOURS     reused as-is, no LLM / tool calls
+  <= RESEARCH_MAX_AGE_HOURS   refreshed: the agent gets the stored research
+                              and only re-checks time-sensitive findings
+  older / no match            full research run
+
+Without an exact match, the semantic index (semantic_research_cache) is
+asked for a fresh entry of the same brand whose goal/audience means the
+same thing; a hit is reused like a fresh exact match.
+"""
+import hashlib
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from app.agents.research_agent import ResearchAgent
+from app.core.settings import settings
+from app.db.mongodb import get_async_research_collection, get_research_collection
+from app.memory.semantic_research_cache import get_semantic_index
+
+logger = logging.getLogger("memory.research")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is of on or our the their to with "
+    "who want wants more get".split()
+)
+_ISO = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).strftime(_ISO)
+
+
+def _fold(value: str) -> str:
+    return " ".join((value or "").split()).casefold()
+
+
+def fingerprint(goal: str, target_audience: str) -> str:
+    """Order-insensitive hash of the meaningful words of goal and audience."""
+    parts = []
+    for text in (goal, target_audience):
+        tokens = re.findall(r"[a-z0-9]+", (text or "").casefold())
+        parts.append(" ".join(sorted({t for t in tokens if t not in _STOPWORDS})))
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()[:32]
+
+
+def _key(brand_context: dict, goal: str, target_audience: str) -> str:
+    return ":".join((
+        str(brand_context.get("id", "")),
+        _fold(brand_context.get("industry", "")),
+        fingerprint(goal, target_audience),
+    ))
+
+
+@dataclass
+class StoredResearch:
+    research: dict[str, Any]
+    researched_at: str
+    age_hours: float
+
+    @property
+    def fresh(self) -> bool:
+        return self.age_hours <= settings.research_fresh_hours
+
+    @property
+    def refreshable(self) -> bool:
+        return self.age_hours <= settings.research_max_age_hours
+
+
+def _stored(doc: dict | None) -> StoredResearch | None:
+    if doc is None:
+        return None
+    researched_at = datetime.strptime(doc["researched_at"], _ISO).replace(tzinfo=timezone.utc)
+    age = (datetime.now(timezone.utc) - researched_at).total_seconds() / 3600
+    return StoredResearch(doc["research"], doc["researched_at"], age)
+
+
+def _doc(brand_context: dict, goal: str, target_audience: str, research: dict) -> dict:
+    return {
+        "brand_id": str(brand_context.get("id", "")),
+        "industry": brand_context.get("industry", ""),
+        "fingerprint": fingerprint(goal, target_audience),
+        "goal": goal,
+        "target_audience": target_audience,
+        "research": research,
+        "researched_at": _now_iso(),
+    }
+
+
+def lookup(brand_context: dict, goal: str, target_audience: str) -> StoredResearch | None:
+    doc = get_research_collection().find_one({"_id": _key(brand_context, goal, target_audience)})
+    return _stored(doc)
+
+
+async def alookup(brand_context: dict, goal: str, target_audience: str) -> StoredResearch | None:
+    """Async `lookup`."""
+    doc = await get_async_research_collection().find_one(
+        {"_id": _key(brand_context, goal, target_audience)}
+    )
+    return _stored(doc)
+
+
+def save(brand_context: dict, goal: str, target_audience: str, research: dict) -> None:
+    doc = _doc(brand_context, goal, target_audience, research)
+    get_research_collection().replace_one(
+        {"_id": _key(brand_context, goal, target_audience)}, doc, upsert=True
+    )
+    _index(brand_context, goal, target_audience, doc)
+
+
+async def asave(brand_context: dict, goal: str, target_audience: str, research: dict) -> None:
+    """Async `save`."""
+    doc = _doc(brand_context, goal, target_audience, research)
+    await get_async_research_collection().replace_one(
+        {"_id": _key(brand_context, goal, target_audience)}, doc, upsert=True
+    )
+    _index(brand_context, goal, target_audience, doc)
+
+
+def _enabled(brand_context: dict) -> bool:
+    return settings.research_reuse_enabled and bool(brand_context.get("id"))
+
+
+def _brand_docs_query(brand_context: dict) -> dict:
+    return {"brand_id": str(brand_context["id"]), "industry": brand_context.get("industry", "")}
+
+
+def _semantic_lookup(brand_context: dict, goal: str, target_audience: str) -> StoredResearch | None:
+    index = get_semantic_index()
+    if index is None:
+        return None
+    if not index.is_loaded(str(brand_context["id"])):
+        index.load(brand_context, get_research_collection().find(_brand_docs_query(brand_context)))
+    hit = index.search(brand_context, goal, target_audience, settings.research_fresh_hours)
+    return _stored({"research": hit.research, "researched_at": hit.researched_at}) if hit else None
+
+
+async def _asemantic_lookup(
+    brand_context: dict, goal: str, target_audience: str
+) -> StoredResearch | None:
+    """Async `_semantic_lookup`."""
+    index = get_semantic_index()
+    if index is None:
+        return None
+    if not index.is_loaded(str(brand_context["id"])):
+        cursor = get_async_research_collection().find(_brand_docs_query(brand_context))
+        index.load(brand_context, [d async for d in cursor])
+    hit = index.search(brand_context, goal, target_audience, settings.research_fresh_hours)
+    return _stored({"research": hit.research, "researched_at": hit.researched_at}) if hit else None
+
+
+def _index(brand_context: dict, goal: str, target_audience: str, doc: dict) -> None:
+    index = get_semantic_index()
+    if index is not None:
+        index.add(
+            _key(brand_context, goal, target_audience),
+            brand_context, goal, target_audience, doc["research"], doc["researched_at"],
+        )
+
+
+def research_with_reuse(
+    brand_context: dict,
+    goal: str = "",
+    target_audience: str = "",
+    budget: float = 0.0,
+) -> tuple[dict[str, Any], bool]:
+    """
+    Research for a campaign, served from the store when possible.
+    Returns (ResearchOutput dump, reused) — reused is True only when the
+    stored research was used verbatim.
+    """
+    stored = lookup(brand_context, goal, target_audience) if _enabled(brand_context) else None
+    if stored is not None and stored.fresh:
+        logger.info(f"RESEARCH_STORE | reused | brand={brand_context.get('name')} | age_h={stored.age_hours:.1f}")
+        return stored.research, True
+
+    if stored is None and _enabled(brand_context):
+        similar = _semantic_lookup(brand_context, goal, target_audience)
+        if similar is not None:
+            return similar.research, True
+
+    prior = stored if stored is not None and stored.refreshable else None
+    if prior is not None:
+        logger.info(f"RESEARCH_STORE | refresh | brand={brand_context.get('name')} | age_h={prior.age_hours:.1f}")
+    research = ResearchAgent().run(
+        brand_context=brand_context,
+        goal=goal,
+        target_audience=target_audience,
+        budget=budget,
+        prior=prior.research if prior else None,
+        prior_date=prior.researched_at if prior else "",
+    ).model_dump()
+    if _enabled(brand_context):
+        save(brand_context, goal, target_audience, research)
+    return research, False
+
+
+async def aresearch_with_reuse(
+    brand_context: dict,
+    goal: str = "",
+    target_audience: str = "",
+    budget: float = 0.0,
+) -> tuple[dict[str, Any], bool]:
+    """Async `research_with_reuse`."""
+    stored = await alookup(brand_context, goal, target_audience) if _enabled(brand_context) else None
+    if stored is not None and stored.fresh:
+        logger.info(f"RESEARCH_STORE | reused | brand={brand_context.get('name')} | age_h={stored.age_hours:.1f}")
+        return stored.research, True
+
+    if stored is None and _enabled(brand_context):
+        similar = await _asemantic_lookup(brand_context, goal, target_audience)
+        if similar is not None:
+            return similar.research, True
+
+    prior = stored if stored is not None and stored.refreshable else None
+    if prior is not None:
+        logger.info(f"RESEARCH_STORE | refresh | brand={brand_context.get('name')} | age_h={prior.age_hours:.1f}")
+    output = await ResearchAgent().arun(
+        brand_context=brand_context,
+        goal=goal,
+        target_audience=target_audience,
+        budget=budget,
+        prior=prior.research if prior else None,
+        prior_date=prior.researched_at if prior else "",
+    )
+    research = output.model_dump()
+    if _enabled(brand_context):
+        await asave(brand_context, goal, target_audience, research)
+    return research, False
@@ -0,0 +1,188 @@
+# app/memory/semantic_research_cache.py
+"""
+Semantic look-up over stored research.
+
+The exact research store (research_memory) only matches campaigns whose
+goal/audience normalise to the same words. This index embeds the goal and
+the audience separately with the local embedder (app.services.embeddings)
+and scores a stored entry by the lower of the two cosine similarities, so
+a different goal for the same audience (or the reverse) cannot ride on the
+half that matches. The index is already per brand, so brand name and
+industry are not embedded — text shared by every entry only inflates
+scores.
+
+The closest fresh entry is reused when its score clears the threshold of
+the active embedding backend (RESEARCH_SEMANTIC_THRESHOLD_HASHING /
+RESEARCH_SEMANTIC_THRESHOLD_SENTENCE_TRANSFORMERS) — with
+sentence-transformers, "grow app installs among Gen Z" can reuse "drive
+Gen Z downloads"; the hashing fallback catches rewordings, not synonyms.
+
+In-process NumPy brute force, one matrix per brand: a brand has tens to
+hundreds of stored research entries, and a dot product over that is
+microseconds. Each brand is warmed from the research_store collection on
+first use, so restarts lose nothing.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Iterable
+
+import numpy as np
+
+from app.core.settings import settings
+from app.services.embeddings import Embedder, get_embedder
+
+logger = logging.getLogger("memory.research")
+
+_ISO = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _epoch(iso: str) -> float:
+    return datetime.strptime(iso, _ISO).replace(tzinfo=timezone.utc).timestamp()
+
+
+def _embed_pairs(embedder: Embedder, pairs: list[tuple[str, str]]) -> tuple[np.ndarray, np.ndarray]:
+    """(goal vectors, audience vectors) for (goal, target_audience) pairs, in one embed call."""
+    vectors = embedder.embed([g for g, _ in pairs] + [a for _, a in pairs])
+    return vectors[:len(pairs)], vectors[len(pairs):]
+
+
+def threshold_for(embedder: Embedder) -> float:
+    """Similarity a stored entry must reach with this embedding backend."""
+    if embedder.name == "sentence-transformers":
+        return settings.research_semantic_threshold_sentence_transformers
+    return settings.research_semantic_threshold_hashing
+
+
+@dataclass
+class SemanticHit:
+    research: dict[str, Any]
+    researched_at: str
+    score: float
+
+
+class _BrandIndex:
+    def __init__(self) -> None:
+        self.keys: list[str] = []
+        self.entries: list[tuple[dict[str, Any], str]] = []  # (research, researched_at)
+        self.goals: np.ndarray | None = None
+        self.audiences: np.ndarray | None = None
+
+    def upsert(
+        self, key: str, goal: np.ndarray, audience: np.ndarray, research: dict, researched_at: str
+    ) -> None:
+        if key in self.keys:
+            row = self.keys.index(key)
+            self.entries[row] = (research, researched_at)
+            self.goals[row] = goal
+            self.audiences[row] = audience
+            return
+        self.keys.append(key)
+        self.entries.append((research, researched_at))
+        goal, audience = goal[np.newaxis, :], audience[np.newaxis, :]
+        if self.goals is None:
+            self.goals, self.audiences = goal, audience
+        else:
+            self.goals = np.vstack([self.goals, goal])
+            self.audiences = np.vstack([self.audiences, audience])
+
+    def trim(self, max_entries: int) -> None:
+        if len(self.keys) <= max_entries:
+            return
+        keep = sorted(
+            range(len(self.keys)), key=lambda i: self.entries[i][1], reverse=True
+        )[:max_entries]
+        keep.sort()
+        self.keys = [self.keys[i] for i in keep]
+        self.entries = [self.entries[i] for i in keep]
+        self.goals = self.goals[keep]
+        self.audiences = self.audiences[keep]
+
+
+class SemanticResearchIndex:
+    def __init__(self, embedder: Embedder, threshold: float, max_entries: int) -> None:
+        self.embedder = embedder
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._brands: dict[str, _BrandIndex] = {}
+        self._lock = threading.Lock()
+
+    def is_loaded(self, brand_id: str) -> bool:
+        return brand_id in self._brands
+
+    def load(self, brand_context: dict, docs: Iterable[dict]) -> None:
+        """Warm a brand's index from its research_store documents."""
+        brand_id = str(brand_context.get("id", ""))
+        docs = list(docs)
+        index = _BrandIndex()
+        if docs:
+            goals, audiences = _embed_pairs(
+                self.embedder, [(d.get("goal", ""), d.get("target_audience", "")) for d in docs]
+            )
+            for doc, goal, audience in zip(docs, goals, audiences):
+                index.upsert(doc["_id"], goal, audience, doc["research"], doc["researched_at"])
+            index.trim(self.max_entries)
+        with self._lock:
+            self._brands.setdefault(brand_id, index)
+        logger.info(f"RESEARCH_SEMANTIC | loaded | brand_id={brand_id} | entries={len(docs)}")
+
+    def add(
+        self,
+        key: str,
+        brand_context: dict,
+        goal: str,
+        target_audience: str,
+        research: dict,
+        researched_at: str,
+    ) -> None:
+        brand_id = str(brand_context.get("id", ""))
+        goals, audiences = _embed_pairs(self.embedder, [(goal, target_audience)])
+        with self._lock:
+            index = self._brands.setdefault(brand_id, _BrandIndex())
+            index.upsert(key, goals[0], audiences[0], research, researched_at)
+            index.trim(self.max_entries)
+
+    def search(
+        self,
+        brand_context: dict,
+        goal: str,
+        target_audience: str,
+        max_age_hours: float,
+    ) -> SemanticHit | None:
+        """Closest research of the same brand no older than max_age_hours, above threshold."""
+        brand_id = str(brand_context.get("id", ""))
+        goals, audiences = _embed_pairs(self.embedder, [(goal, target_audience)])
+        with self._lock:
+            index = self._brands.get(brand_id)
+            if index is None or index.goals is None:
+                return None
+            cutoff = datetime.now(timezone.utc).timestamp() - max_age_hours * 3600
+            rows = [i for i, (_, at) in enumerate(index.entries) if _epoch(at) >= cutoff]
+            if not rows:
+                return None
+            scores = np.minimum(index.goals[rows] @ goals[0], index.audiences[rows] @ audiences[0])
+            best = int(np.argmax(scores))
+            score = float(scores[best])
+            research, researched_at = index.entries[rows[best]]
+        if score < self.threshold:
+            logger.info(f"RESEARCH_SEMANTIC | miss | brand_id={brand_id} | best={score:.3f}")
+            return None
+        logger.info(f"RESEARCH_SEMANTIC | hit | brand_id={brand_id} | score={score:.3f}")
+        return SemanticHit(research, researched_at, score)
+
+
+@lru_cache(maxsize=None)
+def get_semantic_index() -> SemanticResearchIndex | None:
+    """Process-wide index, or None when RESEARCH_SEMANTIC_CACHE is off."""
+    if not settings.research_semantic_cache:
+        return None
+    embedder = get_embedder()
+    return SemanticResearchIndex(
+        embedder,
+        threshold=threshold_for(embedder),
+        max_entries=settings.research_semantic_max_entries,
+    )
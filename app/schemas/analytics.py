@@ -36,6 +36,23 @@ class ChannelPerformance(BaseModel):
     )
 
 
+class ForecastInterval(BaseModel):
+    model_config = ConfigDict(strict=True, extra="forbid")
+
+    low: int = Field(..., ge=0)
+    high: int = Field(..., ge=0)
+
+
+class ForecastIntervals(BaseModel):
+    model_config = ConfigDict(strict=True, extra="forbid")
+
+    confidence: float = Field(..., gt=0, lt=100, description="Interval width in percent, e.g. 90.0.")
+    simulations: int = Field(..., ge=1)
+    total_impressions: ForecastInterval
+    total_clicks: ForecastInterval
+    conversions: ForecastInterval
+
+
 class AnalyticsReport(BaseModel):
     model_config = ConfigDict(strict=True, extra="forbid")
 
@@ -75,4 +92,39 @@ class AnalyticsReport(BaseModel):
             "Per-channel performance forecast. Must include one entry per channel in the strategy. "
             "Aggregated totals above must be consistent with the sum of values here."
         ),
-    )
\ No newline at end of file
+    )
+    confidence_intervals: ForecastIntervals | None = Field(
+        default=None,
+        description=(
+            "Monte-Carlo confidence intervals over the benchmark ranges. "
+            "Computed by the forecasting engine — leave null."
+        ),
+    )
+
+
+class ChannelAllocation(BaseModel):
+    model_config = ConfigDict(strict=True, extra="forbid")
+
+    channel_name: str = Field(
+        ...,
+        description="Name of the marketing channel, matching exactly what is defined in the strategy.",
+    )
+    budget_share: float = Field(
+        ...,
+        ge=0,
+        le=100,
+        description="Percentage of the total budget allocated to this channel.",
+    )
+
+
+class BudgetSplit(BaseModel):
+    model_config = ConfigDict(strict=True, extra="forbid")
+
+    allocations: list[ChannelAllocation] = Field(
+        ...,
+        min_length=1,
+        description=(
+            "One entry per strategy channel. Shares should sum to 100 and follow each "
+            "channel's expected return for the campaign goal."
+        ),
+    )
@@ -1,5 +1,7 @@
 # app/schemas/campaign.py
-from pydantic import BaseModel
+from typing import Any
+
+from pydantic import BaseModel, Field
 
 class CampaignCreate(BaseModel):
     brand_id: str
@@ -9,4 +11,34 @@ class CampaignCreate(BaseModel):
 
 class CampaignResponse(BaseModel):
     id: str
-    status: str
\ No newline at end of file
+    status: str
+
+
+class CampaignBatchCreate(BaseModel):
+    """Many campaign variants for one brand, run as a single batch job."""
+
+    campaigns: list[CampaignCreate] = Field(..., min_length=1)
+
+
+class CampaignBatchResponse(BaseModel):
+    campaigns: list[CampaignResponse]
+
+
+class CampaignPage(BaseModel):
+    """One page of GET /brands/{id}/campaigns; pass next_cursor back for the next."""
+
+    items: list[dict[str, Any]]
+    next_cursor: str | None = None
+
+
+class CampaignStatus(BaseModel):
+    """Job progress for a queued / running campaign."""
+
+    id: str
+    status: str
+    completed_nodes: list[str] = Field(default_factory=list)
+    # Planned channels with no asset — their content generation failed
+    failed_channels: list[str] = Field(default_factory=list)
+    error: str | None = None
+    research_reused: bool = False
+    updated_at: str = ""
\ No newline at end of file
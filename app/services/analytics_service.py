@@ -1 +1,175 @@
 # app/services/analytics_service.py
+"""
+Deterministic campaign forecasting.
+
+Channels are mapped to a benchmark type (app.core.constants) and the whole
+forecast is computed as NumPy vectors over channels:
+
+    budget_i      = budget * share_i
+    impressions_i = floor(budget_i / cpm_i * 1000)
+    clicks_i      = floor(impressions_i * ctr_i / 100)
+
+Totals are sums of the integer rows and CTRs are derived from them, so the
+AnalyticsReport is arithmetically consistent by construction. Monte-Carlo
+intervals reuse the same formulas over a (simulations × channels) matrix
+of CPM / CTR / conversion draws (triangular around each range midpoint).
+"""
+from typing import Sequence
+
+import numpy as np
+
+from app.core.constants import (
+    CHANNEL_BENCHMARKS,
+    CHANNEL_TYPE_KEYWORDS,
+    DEFAULT_CHANNEL_TYPE,
+    DEFAULT_CONVERSION_RANGE,
+    GOAL_CONVERSION_BENCHMARKS,
+)
+from app.schemas.analytics import (
+    AnalyticsReport,
+    ChannelPerformance,
+    ForecastInterval,
+    ForecastIntervals,
+)
+
+MC_SEED = 7  # fixed so the same campaign always gets the same intervals
+MC_CONFIDENCE = 90.0
+
+
+def channel_type(channel: str) -> str:
+    name = " ".join(channel.split()).casefold()
+    for kind, keywords in CHANNEL_TYPE_KEYWORDS:
+        if any(k in name for k in keywords):
+            return kind
+    return DEFAULT_CHANNEL_TYPE
+
+
+def conversion_range(goal: str) -> tuple[float, float]:
+    goal = goal.casefold()
+    for keywords, rng in GOAL_CONVERSION_BENCHMARKS:
+        if any(k in goal for k in keywords):
+            return rng
+    return DEFAULT_CONVERSION_RANGE
+
+
+def _ranges(channels: Sequence[str], metric: str) -> np.ndarray:
+    """(channels × 2) array of [low, high] for `metric`."""
+    return np.array(
+        [CHANNEL_BENCHMARKS[channel_type(c)][metric] for c in channels],
+        dtype=float,
+    )
+
+
+def default_shares(channels: Sequence[str]) -> np.ndarray:
+    """
+    Budget split without an LLM: half spread evenly, half by expected clicks
+    per dollar (CTR / CPM at the range midpoints) — efficient channels get
+    more, but every strategy channel stays funded.
+    """
+    n = len(channels)
+    efficiency = _ranges(channels, "ctr").mean(axis=1) / _ranges(channels, "cpm").mean(axis=1)
+    return 0.5 / n + 0.5 * efficiency / efficiency.sum()
+
+
+def normalize_shares(shares: Sequence[float], channels: Sequence[str]) -> np.ndarray:
+    shares = np.clip(np.asarray(shares, dtype=float), 0.0, None)
+    total = shares.sum()
+    if total <= 0:
+        return default_shares(channels)
+    return shares / total
+
+
+def _project(budgets: np.ndarray, cpm: np.ndarray, ctr: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    impressions = np.floor(budgets / cpm * 1000.0)
+    clicks = np.floor(impressions * ctr / 100.0)
+    return impressions, clicks
+
+
+def _pct(part: int, whole: int) -> float:
+    return round(part / whole * 100, 2) if whole else 0.0
+
+
+def forecast(
+    channels: Sequence[str],
+    budget: float,
+    goal: str = "",
+    shares: Sequence[float] | None = None,
+    simulations: int = 0,
+) -> AnalyticsReport:
+    channels = list(dict.fromkeys(c for c in channels if c))
+    if not channels:
+        raise ValueError("Cannot forecast a campaign with no channels")
+
+    split = default_shares(channels) if shares is None else normalize_shares(shares, channels)
+    budgets = max(budget, 0.0) * split
+    cpm_range = _ranges(channels, "cpm")
+    ctr_range = _ranges(channels, "ctr")
+    conv_low, conv_high = conversion_range(goal)
+
+    impressions, clicks = _project(budgets, cpm_range.mean(axis=1), ctr_range.mean(axis=1))
+    impressions = impressions.astype(int).tolist()
+    clicks = clicks.astype(int).tolist()
+
+    total_impressions = sum(impressions)
+    total_clicks = sum(clicks)
+    report = AnalyticsReport(
+        total_impressions=total_impressions,
+        total_clicks=total_clicks,
+        overall_ctr=_pct(total_clicks, total_impressions),
+        conversion_rate=round((conv_low + conv_high) / 2, 2),
+        channel_breakdown=[
+            ChannelPerformance(
+                channel_name=name,
+                impressions=imp,
+                clicks=clk,
+                ctr=_pct(clk, imp),
+            )
+            for name, imp, clk in zip(channels, impressions, clicks)
+        ],
+    )
+
+    if simulations > 0:
+        report.confidence_intervals = _monte_carlo(
+            budgets, cpm_range, ctr_range, (conv_low, conv_high), simulations
+        )
+    return report
+
+
+def _triangular(rng: np.random.Generator, ranges: np.ndarray, size: tuple[int, ...]) -> np.ndarray:
+    low, high = ranges[..., 0], ranges[..., 1]
+    return rng.triangular(low, (low + high) / 2, np.maximum(high, low + 1e-9), size=size)
+
+
+def _monte_carlo(
+    budgets: np.ndarray,
+    cpm_range: np.ndarray,
+    ctr_range: np.ndarray,
+    conv_range: tuple[float, float],
+    simulations: int,
+) -> ForecastIntervals:
+    rng = np.random.default_rng(MC_SEED)
+    shape = (simulations, len(budgets))
+    impressions, clicks = _project(
+        budgets,
+        _triangular(rng, cpm_range, shape),
+        _triangular(rng, ctr_range, shape),
+    )
+    total_impressions = impressions.sum(axis=1)
+    total_clicks = clicks.sum(axis=1)
+    conversions = np.floor(
+        total_clicks * _triangular(rng, np.array(conv_range), (simulations,)) / 100.0
+    )
+
+    tail = (100.0 - MC_CONFIDENCE) / 2
+
+    def interval(samples: np.ndarray) -> ForecastInterval:
+        low, high = np.percentile(samples, [tail, 100.0 - tail])
+        return ForecastInterval(low=int(low), high=int(high))
+
+    return ForecastIntervals(
+        confidence=MC_CONFIDENCE,
+        simulations=simulations,
+        total_impressions=interval(total_impressions),
+        total_clicks=interval(total_clicks),
+        conversions=interval(conversions),
+    )
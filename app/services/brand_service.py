@@ -3,9 +3,11 @@ import uuid
 
 from fastapi import HTTPException
 
+from app.db.repositories.brand_repo import aget_cached as repo_aget_cached
 from app.db.repositories.brand_repo import create as repo_create
 from app.db.repositories.brand_repo import delete as repo_delete
 from app.db.repositories.brand_repo import get_by_id as repo_get_by_id
+from app.db.repositories.brand_repo import get_cached as repo_get_cached
 from app.db.repositories.brand_repo import list_all as repo_list_all
 from app.db.repositories.brand_repo import update as repo_update
 from app.schemas.brand import BrandCreate, BrandResponse, BrandSummary, BrandUpdate
@@ -61,12 +63,17 @@ class BrandService:
 
     def get_by_id(self, brand_id: str) -> BrandResponse | None:
         """Return full brand object (context + memory + timestamps)."""
-        doc = repo_get_by_id(brand_id)
+        doc = repo_get_cached(brand_id)
         if doc is None:
             raise HTTPException(status_code=400, detail="Brand not present")
         return BrandResponse(**doc)
 
-    
+    async def aget_by_id(self, brand_id: str) -> BrandResponse | None:
+        """Async `get_by_id`."""
+        doc = await repo_aget_cached(brand_id)
+        if doc is None:
+            raise HTTPException(status_code=400, detail="Brand not present")
+        return BrandResponse(**doc)
 
     def update(self, brand_id: str, payload: BrandUpdate) -> BrandResponse | None:
         """Update brand (partial)."""
@@ -1,71 +1,275 @@
 # app/services/campaign_service.py
+import asyncio
+import logging
 import uuid
+from typing import Any, AsyncIterator
 
+from fastapi import HTTPException
+
+from app.core.settings import settings
 from app.db.repositories.campaign_repo import (
+    CAMPAIGN_FIELDS,
+    acreate as campaign_repo_acreate,
+    acreate_many as campaign_repo_acreate_many,
+    aupdate_many as campaign_repo_aupdate_many,
+    adelete as campaign_repo_adelete,
+    aget_by_id as campaign_repo_aget_by_id,
+    aget_status as campaign_repo_aget_status,
+    alist_page as campaign_repo_alist_page,
+    aupdate as campaign_repo_aupdate,
     create as campaign_repo_create,
     delete as campaign_repo_delete,
     get_by_id as campaign_repo_get_by_id,
-    list_all as campaign_repo_list_all,
+    list_page as campaign_repo_list_page,
+    update_many as campaign_repo_update_many,
 )
-from app.graph.builder import build_campaign_graph
+from app.graph.checkpointer import get_checkpointer
 from app.services.brand_service import BrandService
+from app.workers.queue import get_campaign_queue
+
+logger = logging.getLogger("campaign_service")
+
+def initial_state(
+    campaign_id: str,
+    brand_context: dict,
+    *,
+    goal: str,
+    target_audience: str,
+    budget: float,
+) -> dict:
+    """Graph input for a fresh campaign run."""
+    return {
+        "campaign_id": campaign_id,
+        "brand_context": brand_context,
+        "goal": goal,
+        "target_audience": target_audience,
+        "budget": budget,
+        "research": None,
+        "research_reused": False,
+        "strategy": None,
+        "content": None,
+        "channel_assets": [],
+        "failed_channels": [],
+        "qa_report": None,
+        "analytics": None,
+    }
+
+
+def campaign_status(result: dict) -> str:
+    """Final campaign status from a finished graph state."""
+    qa_report = result.get("qa_report") or {}
+
+    # Status is driven by critical issues, not the binary passed flag.
+    # A campaign with only recommendations still completes successfully.
+    critical_issues = qa_report.get("critical_issues", [])
+    return "failed" if critical_issues else "completed"
+
+
+# Runs that stopped on an exception keep their checkpoints and can resume.
+RESUMABLE_STATUSES = ("error",)
+
+# Strong refs to streamed runs — the event loop only keeps weak refs to tasks.
+_stream_tasks: set[asyncio.Task] = set()
+
+
+def parse_fields(fields: str | None) -> list[str] | None:
+    """`fields=` query value ("goal,status,analytics") → field list; None = summary view."""
+    if not fields:
+        return None
+    names = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    unknown = [f for f in names if f not in CAMPAIGN_FIELDS and f != "id"]
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown campaign fields: {', '.join(unknown)}",
+        )
+    return [f for f in names if f != "id"] or None
+
+
+def _enqueue_failed(campaign_ids: list[str], exc: Exception) -> tuple[dict, HTTPException]:
+    """
+    Status updates and the 503 for campaigns whose job could not be queued
+    (broker down). They are marked `error`, so /resume can queue them again
+    instead of leaving them `queued` forever.
+    """
+    logger.error(f"QUEUE | enqueue failed | campaigns={campaign_ids} | error={exc}")
+    error = f"Could not queue the campaign run: {exc}"
+    updates = {cid: {"status": "error", "error": error} for cid in campaign_ids}
+    return updates, HTTPException(
+        status_code=503,
+        detail="Campaign queue unavailable — the campaign was saved with status "
+        "'error' and can be resumed",
+    )
+
+
+def _queued_payload(campaign_id: str, campaign_data, brand_context: dict) -> dict:
+    return {
+        "campaign_id": campaign_id,
+        "brand_id": campaign_data.brand_id,
+        "status": "queued",
+        "goal": campaign_data.goal,
+        "target_audience": campaign_data.target_audience,
+        "budget": campaign_data.budget,
+        "brand_context": brand_context,
+    }
 
 
 class CampaignService:
     def create_campaign(self, campaign_data):
-        graph = build_campaign_graph()
+        """
+        Persist the campaign as `queued` and hand the graph run to the job
+        queue. Returns immediately — poll the status endpoint for progress.
+        """
         brand_service = BrandService()
-        brand_context = brand_service.get_by_id(campaign_data.brand_id)
+        brand_context = brand_service.get_by_id(campaign_data.brand_id).model_dump()
 
         campaign_id = str(uuid.uuid4())
+        campaign_repo_create(_queued_payload(campaign_id, campaign_data, brand_context))
+        self._enqueue(campaign_data.brand_id, campaign_id)
+
+        return {"id": campaign_id, "status": "queued"}
 
-        result = graph.invoke({
-            "campaign_id": campaign_id,
-            "brand_context": brand_context.model_dump(),
-            "goal": campaign_data.goal,
-            "target_audience": campaign_data.target_audience,
-            "budget": campaign_data.budget,
-            "research": None,
-            "strategy": None,
-            "content": None,
-            "qa_report": None,
-            "analytics": None,
-        })
-
-        qa_report = result.get("qa_report") or {}
-
-        # Status is driven by critical issues, not the binary passed flag.
-        # A campaign with only recommendations still completes successfully.
-        critical_issues = qa_report.get("critical_issues", [])
-        status = "failed" if critical_issues else "completed"
-
-        payload = {
-            "campaign_id": campaign_id,
-            "brand_id": campaign_data.brand_id,
-            "status": status,
-            "goal": campaign_data.goal,
-            "target_audience": campaign_data.target_audience,
-            "budget": campaign_data.budget,
-            "brand_context": brand_context.model_dump(),
-            "research": result.get("research"),
-            "strategy": result.get("strategy"),
-            "content": result.get("content"),
-            "qa_report": result.get("qa_report"),
-            "analytics": result.get("analytics"),
-        }
-        campaign_repo_create(payload)
-
-        return {
-            "id": campaign_id,
-            "status": status,
-            "research": result,
-        }
-
-    def get_all_campaigns(self, brand_id: str | None = None):
-        return campaign_repo_list_all(brand_id=brand_id)
+    async def acreate_campaign(self, campaign_data):
+        """Async `create_campaign`."""
+        brand_service = BrandService()
+        brand = await brand_service.aget_by_id(campaign_data.brand_id)
+        brand_context = brand.model_dump()
+
+        campaign_id = str(uuid.uuid4())
+        await campaign_repo_acreate(_queued_payload(campaign_id, campaign_data, brand_context))
+        await self._aenqueue(campaign_data.brand_id, campaign_id)
+
+        return {"id": campaign_id, "status": "queued"}
+
+    async def acreate_campaign_batch(self, brand_id: str, variants: list) -> dict:
+        """
+        Persist every variant as `queued` in one insert_many and hand the
+        whole batch to the job queue as a single job, so the brand is loaded
+        and research is run once per (goal, audience) cluster.
+        """
+        if len(variants) > settings.campaign_batch_max_size:
+            raise HTTPException(
+                status_code=422,
+                detail=f"A batch holds at most {settings.campaign_batch_max_size} campaigns",
+            )
+        brand_service = BrandService()
+        brand = await brand_service.aget_by_id(brand_id)
+        brand_context = brand.model_dump()
+
+        payloads = []
+        for variant in variants:
+            variant.brand_id = brand_id
+            payloads.append(_queued_payload(str(uuid.uuid4()), variant, brand_context))
+        await campaign_repo_acreate_many(payloads)
+
+        campaign_ids = [p["campaign_id"] for p in payloads]
+        try:
+            await get_campaign_queue().aenqueue_batch(brand_id, campaign_ids)
+        except Exception as exc:
+            updates, error = _enqueue_failed(campaign_ids, exc)
+            await campaign_repo_aupdate_many(updates)
+            raise error from exc
+        return {"campaigns": [{"id": cid, "status": "queued"} for cid in campaign_ids]}
+
+    async def astream_campaign(self, campaign_data) -> AsyncIterator[dict[str, Any]]:
+        """
+        Persist the campaign and run it on this event loop, yielding the
+        per-node progress events of `astream_campaign_job`.
+
+        The run takes a campaign queue job slot, so streamed runs count
+        against CAMPAIGN_QUEUE_CONCURRENCY like queued ones. A `campaign`
+        event with status `queued` is yielded first, before waiting for it.
+
+        The run is a detached task feeding a queue: if the client disconnects
+        the run still completes and persists — only the event feed stops.
+        """
+        from app.workers.tasks import astream_campaign_job
+
+        brand_service = BrandService()
+        brand = await brand_service.aget_by_id(campaign_data.brand_id)
+        brand_context = brand.model_dump()
+
+        campaign_id = str(uuid.uuid4())
+        await campaign_repo_acreate(_queued_payload(campaign_id, campaign_data, brand_context))
+
+        events: asyncio.Queue = asyncio.Queue()
+
+        async def pump() -> None:
+            try:
+                async with get_campaign_queue().job_slot():
+                    async for event in astream_campaign_job(campaign_data.brand_id, campaign_id):
+                        events.put_nowait(event)
+            finally:
+                events.put_nowait(None)
+
+        task = asyncio.get_running_loop().create_task(pump())
+        _stream_tasks.add(task)
+        task.add_done_callback(_stream_tasks.discard)
+
+        yield {"event": "campaign", "data": {"id": campaign_id, "status": "queued"}}
+        while (event := await events.get()) is not None:
+            yield event
+
+    async def aresume_campaign(self, brand_id: str, campaign_id: str):
+        """
+        Re-queue an errored campaign. The job continues the checkpointed
+        graph thread, so nodes that already completed are not re-run.
+        """
+        await campaign_repo_aupdate(campaign_id, {"status": "queued", "error": None})
+        await self._aenqueue(brand_id, campaign_id, resume=True)
+        return {"id": campaign_id, "status": "queued"}
+
+    @staticmethod
+    def _enqueue(brand_id: str, campaign_id: str) -> None:
+        try:
+            get_campaign_queue().enqueue(brand_id, campaign_id)
+        except Exception as exc:
+            updates, error = _enqueue_failed([campaign_id], exc)
+            campaign_repo_update_many(updates)
+            raise error from exc
+
+    @staticmethod
+    async def _aenqueue(brand_id: str, campaign_id: str, *, resume: bool = False) -> None:
+        try:
+            await get_campaign_queue().aenqueue(brand_id, campaign_id, resume=resume)
+        except Exception as exc:
+            updates, error = _enqueue_failed([campaign_id], exc)
+            await campaign_repo_aupdate_many(updates)
+            raise error from exc
+
+    async def aget_campaign_status(self, brand_id: str, campaign_id: str):
+        return await campaign_repo_aget_status(brand_id=brand_id, campaign_id=campaign_id)
+
+    def get_campaign_page(
+        self, brand_id: str, limit: int, cursor: str | None = None, fields: str | None = None
+    ):
+        try:
+            return campaign_repo_list_page(brand_id, limit, cursor, parse_fields(fields))
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+
+    async def aget_campaign_page(
+        self, brand_id: str, limit: int, cursor: str | None = None, fields: str | None = None
+    ):
+        try:
+            return await campaign_repo_alist_page(brand_id, limit, cursor, parse_fields(fields))
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
 
     def get_campaign_by_id(self, brand_id: str, campaign_id: str):
         return campaign_repo_get_by_id(brand_id=brand_id, campaign_id=campaign_id)
 
+    async def aget_campaign_by_id(self, brand_id: str, campaign_id: str):
+        return await campaign_repo_aget_by_id(brand_id=brand_id, campaign_id=campaign_id)
+
     def delete_campaign_by_id(self, campaign_id: str) -> bool:
-        return campaign_repo_delete(campaign_id)
\ No newline at end of file
+        checkpointer = get_checkpointer()
+        if checkpointer is not None:
+            checkpointer.delete_thread(campaign_id)
+        return campaign_repo_delete(campaign_id)
+
+    async def adelete_campaign_by_id(self, campaign_id: str) -> bool:
+        checkpointer = get_checkpointer()
+        if checkpointer is not None:
+            await checkpointer.adelete_thread(campaign_id)
+        return await campaign_repo_adelete(campaign_id)
\ No newline at end of file
@@ -0,0 +1,109 @@
+# app/services/embeddings.py
+"""
+Local CPU text embeddings — no API calls, no GPU.
+
+  sentence-transformers → small local model (EMBEDDING_MODEL, default
+                          all-MiniLM-L6-v2), when the package is installed
+                          and the model is already in the local cache
+  hashing               → fallback with no extra dependencies: signed
+                          feature hashing of words and character n-grams.
+                          Catches rewordings and reorderings, not synonyms.
+
+EMBEDDING_BACKEND picks one explicitly; "auto" tries sentence-transformers
+from local files only (never a hub download) and falls back to hashing.
+An explicit "sentence-transformers" may download the model. Vectors are L2-normalised float32, so cosine
+similarity is a dot product.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+
+import numpy as np
+
+from app.core.settings import settings
+
+logger = logging.getLogger("embeddings")
+
+
+class Embedder(ABC):
+    name: str = ""
+
+    @abstractmethod
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """(len(texts) × dim) float32, rows L2-normalised."""
+
+
+def _normalise(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return (vectors / np.where(norms == 0, 1.0, norms)).astype(np.float32)
+
+
+class HashingEmbedder(Embedder):
+    name = "hashing"
+
+    def __init__(self, dim: int = 2048, ngram_range: tuple[int, int] = (3, 5)) -> None:
+        self.dim = dim
+        self.ngram_range = ngram_range
+
+    def _features(self, text: str) -> list[str]:
+        words = re.findall(r"[a-z0-9]+", text.casefold())
+        features = [f"w:{w}" for w in words]
+        lo, hi = self.ngram_range
+        for word in words:
+            padded = f" {word} "
+            for n in range(lo, hi + 1):
+                features.extend(f"c:{padded[i:i + n]}" for i in range(len(padded) - n + 1))
+        return features
+
+    def _slot(self, feature: str) -> tuple[int, float]:
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        return value % self.dim, 1.0 if (value >> 63) & 1 else -1.0
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                slot, sign = self._slot(feature)
+                vectors[row, slot] += sign
+        return _normalise(vectors)
+
+
+class SentenceTransformerEmbedder(Embedder):
+    name = "sentence-transformers"
+
+    def __init__(self, model_name: str, local_files_only: bool = False) -> None:
+        from sentence_transformers import SentenceTransformer
+
+        self._model = SentenceTransformer(
+            model_name, device="cpu", local_files_only=local_files_only
+        )
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        vectors = self._model.encode(texts, convert_to_numpy=True, show_progress_bar=False)
+        return _normalise(np.asarray(vectors, dtype=np.float32))
+
+
+@lru_cache(maxsize=None)
+def get_embedder() -> Embedder:
+    """Process-wide embedder selected by settings.embedding_backend."""
+    backend = settings.embedding_backend.strip().lower()
+    if backend == "hashing":
+        return HashingEmbedder()
+    if backend not in ("auto", "sentence-transformers"):
+        raise ValueError(f"Unsupported embedding backend: {backend!r}")
+    try:
+        embedder = SentenceTransformerEmbedder(
+            settings.embedding_model, local_files_only=backend == "auto"
+        )
+    except Exception as exc:
+        if backend == "sentence-transformers":
+            raise
+        logger.warning(f"EMBEDDINGS | sentence-transformers unavailable ({exc}) → hashing")
+        return HashingEmbedder()
+    logger.info(f"EMBEDDINGS | sentence-transformers | model={settings.embedding_model}")
+    return embedder
@@ -1,5 +1,6 @@
 from .anthropic_provider import AnthropicProvider
 from .base import BaseLLM
+from .cached_llm import CachedLLM
 from .llm_factory import LLMFactory
 from .ollama_provider import OllamaProvider
 from .openai_provider import OpenAIProvider
@@ -7,6 +8,7 @@ from .openai_provider import OpenAIProvider
 __all__ = [
     "AnthropicProvider",
     "BaseLLM",
+    "CachedLLM",
     "LLMFactory",
     "OllamaProvider",
     "OpenAIProvider",
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Sequence
+from typing import AsyncIterator, Sequence
 
 from langchain_anthropic import ChatAnthropic
 from langchain_core.tools import BaseTool
@@ -20,6 +20,7 @@ from app.core.settings import settings
 
 from .base import BaseLLM
 from .react_engine import ReActEngine
+from .structured_stream import StructuredStreamParser
 
 logger = logging.getLogger("anthropic_provider")
 
@@ -49,22 +50,43 @@ class AnthropicProvider(BaseLLM):
         *,
         response_schema: type[BaseModel],
     ) -> BaseModel:
-        from langchain_core.messages import HumanMessage, SystemMessage
-
-        schema_hint = json.dumps(response_schema.model_json_schema(), indent=2)
-        augmented_system = (
-            f"{system_prompt}\n\n"
-            "Return ONLY a valid JSON object that conforms to this schema "
-            "(no markdown, no code fences):\n"
-            f"{schema_hint}"
+        response = self._chat.invoke(
+            _structured_messages(system_prompt, user_prompt, response_schema)
         )
+        return self._parsed(response, response_schema)
 
-        response = self._chat.invoke([
-            SystemMessage(content=augmented_system),
-            HumanMessage(content=user_prompt),
-        ])
+    async def agenerate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        response_schema: type[BaseModel],
+    ) -> BaseModel:
+        response = await self._chat.ainvoke(
+            _structured_messages(system_prompt, user_prompt, response_schema)
+        )
+        return self._parsed(response, response_schema)
 
-        raw_text: str = response.content
+    async def astream_generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        response_schema: type[BaseModel],
+    ) -> AsyncIterator[BaseModel]:
+        parser = StructuredStreamParser(response_schema)
+        response = None
+        async for chunk in self._chat.astream(
+            _structured_messages(system_prompt, user_prompt, response_schema)
+        ):
+            response = chunk if response is None else response + chunk
+            for item in parser.feed(chunk.text):
+                yield item
+        yield self._parsed(response, response_schema)
+
+    def _parsed(self, response, response_schema: type[BaseModel]) -> BaseModel:
+        # .text flattens streamed chunks, whose content is a list of blocks.
+        raw_text: str = response.text
         # Strip accidental markdown fences if the model adds them.
         if raw_text.startswith("```"):
             raw_text = raw_text.split("```")[1]
@@ -90,15 +112,17 @@ class AnthropicProvider(BaseLLM):
         tools: Sequence[BaseTool],
         response_schema: type[BaseModel],
         max_steps: int = 8,
+        prefetch: Sequence[dict] | None = None,
     ) -> BaseModel:
         llm_with_tools = self._chat.bind_tools(tools)
         engine = ReActEngine(
             llm_with_tools=llm_with_tools,
             tools=tools,
             max_steps=max_steps,
+            provider="anthropic",
         )
 
-        observations = engine.run(system_prompt, user_prompt)
+        observations = engine.run(system_prompt, user_prompt, prefetch=prefetch)
         logger.info(
             f"ReAct complete | provider=anthropic | "
             f"observations_len={len(observations)}"
@@ -111,11 +135,94 @@ class AnthropicProvider(BaseLLM):
             response_schema=response_schema,
         )
 
+    async def agenerate_with_tools(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        tools: Sequence[BaseTool],
+        response_schema: type[BaseModel],
+        max_steps: int = 8,
+        prefetch: Sequence[dict] | None = None,
+    ) -> BaseModel:
+        llm_with_tools = self._chat.bind_tools(tools)
+        engine = ReActEngine(
+            llm_with_tools=llm_with_tools,
+            tools=tools,
+            max_steps=max_steps,
+            provider="anthropic",
+        )
+
+        observations = await engine.arun(system_prompt, user_prompt, prefetch=prefetch)
+        logger.info(
+            f"ReAct complete | provider=anthropic | "
+            f"observations_len={len(observations)}"
+        )
+
+        enriched_prompt = _build_synthesis_prompt(user_prompt, observations)
+        return await self.agenerate(
+            system_prompt=system_prompt,
+            user_prompt=enriched_prompt,
+            response_schema=response_schema,
+        )
+
+    async def astream_generate_with_tools(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        tools: Sequence[BaseTool],
+        response_schema: type[BaseModel],
+        max_steps: int = 8,
+        prefetch: Sequence[dict] | None = None,
+    ) -> AsyncIterator[BaseModel]:
+        llm_with_tools = self._chat.bind_tools(tools)
+        engine = ReActEngine(
+            llm_with_tools=llm_with_tools,
+            tools=tools,
+            max_steps=max_steps,
+            provider="anthropic",
+        )
+
+        observations = await engine.arun(system_prompt, user_prompt, prefetch=prefetch)
+        logger.info(
+            f"ReAct complete | provider=anthropic | "
+            f"observations_len={len(observations)}"
+        )
+
+        enriched_prompt = _build_synthesis_prompt(user_prompt, observations)
+        async for value in self.astream_generate(
+            system_prompt=system_prompt,
+            user_prompt=enriched_prompt,
+            response_schema=response_schema,
+        ):
+            yield value
+
 
 # ---------------------------------------------------------------------------
-# Shared helper
+# Shared helpers
 # ---------------------------------------------------------------------------
 
+def _structured_messages(
+    system_prompt: str,
+    user_prompt: str,
+    response_schema: type[BaseModel],
+) -> list:
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    schema_hint = json.dumps(response_schema.model_json_schema(), indent=2)
+    augmented_system = (
+        f"{system_prompt}\n\n"
+        "Return ONLY a valid JSON object that conforms to this schema "
+        "(no markdown, no code fences):\n"
+        f"{schema_hint}"
+    )
+    return [
+        SystemMessage(content=augmented_system),
+        HumanMessage(content=user_prompt),
+    ]
+
+
 def _build_synthesis_prompt(original_user_prompt: str, observations: str) -> str:
     return (
         f"{original_user_prompt}\n\n"
@@ -5,15 +5,26 @@ Abstract base for all LLM providers.
 Two generation modes:
   generate()            → structured output only (no tools, used by QA / Analytics)
   generate_with_tools() → ReAct loop first, then structured output synthesis
+
+Each mode has an async twin (agenerate / agenerate_with_tools) backed by the
+providers' native async clients, so the async campaign path never parks an
+event-loop thread on network I/O.
+
+Streaming twins (astream_generate / astream_generate_with_tools) yield each
+item of the schema's list field as soon as it is complete, then the full
+result. The base implementations fall back to the blocking call; providers
+override them with real token streaming.
 """
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Sequence, TypeVar
+from typing import AsyncIterator, Sequence, TypeVar
 
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel
 
+from .structured_stream import stream_items
+
 T = TypeVar("T", bound=BaseModel)
 
 
@@ -49,6 +60,7 @@ class BaseLLM(ABC):
         tools: Sequence[BaseTool],
         response_schema: type[BaseModel],
         max_steps: int = 8,
+        prefetch: Sequence[dict] | None = None,
     ) -> BaseModel:
         """
         Run a ReAct (Reason + Act) loop with the provided tools, then
@@ -59,4 +71,84 @@ class BaseLLM(ABC):
           2. Drive the ReAct engine until the LLM stops calling tools.
           3. Call `generate()` once more with all observations appended
              to the user prompt, to produce the final typed output.
-        """
\ No newline at end of file
+
+        `prefetch` — tool calls ({"name", "args"}) run before the first LLM
+        turn and seeded into the history as its results (see ReActEngine).
+        """
+
+    # ------------------------------------------------------------------
+    # Async twins
+    # ------------------------------------------------------------------
+
+    @abstractmethod
+    async def agenerate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        response_schema: type[BaseModel],
+    ) -> BaseModel:
+        """Async variant of `generate()`."""
+
+    @abstractmethod
+    async def agenerate_with_tools(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        tools: Sequence[BaseTool],
+        response_schema: type[BaseModel],
+        max_steps: int = 8,
+        prefetch: Sequence[dict] | None = None,
+    ) -> BaseModel:
+        """Async variant of `generate_with_tools()` — uses ReActEngine.arun."""
+
+    # ------------------------------------------------------------------
+    # Streaming twins
+    # ------------------------------------------------------------------
+
+    async def astream_generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        response_schema: type[BaseModel],
+    ) -> AsyncIterator[BaseModel]:
+        """
+        Streaming variant of `agenerate()`.
+
+        Yields every item of the schema's first list-of-models field (e.g.
+        each ContentAsset of ContentOutput.assets) as soon as it is complete,
+        then the full validated `response_schema` object as the last value.
+        """
+        result = await self.agenerate(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            response_schema=response_schema,
+        )
+        for item in stream_items(result):
+            yield item
+        yield result
+
+    async def astream_generate_with_tools(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        tools: Sequence[BaseTool],
+        response_schema: type[BaseModel],
+        max_steps: int = 8,
+        prefetch: Sequence[dict] | None = None,
+    ) -> AsyncIterator[BaseModel]:
+        """ReAct loop, then a streamed synthesis — see `astream_generate()`."""
+        result = await self.agenerate_with_tools(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            tools=tools,
+            response_schema=response_schema,
+            max_steps=max_steps,
+            prefetch=prefetch,
+        )
+        for item in stream_items(result):
+            yield item
+        yield result
\ No newline at end of file
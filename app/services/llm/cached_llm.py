@@ -0,0 +1,234 @@
+# app/services/llm/cached_llm.py
+"""
+Response-caching wrapper around any BaseLLM.
+
+Retries, QA re-runs and repeated demo campaigns send byte-identical
+(model, system_prompt, user_prompt, response_schema) requests to generate().
+CachedLLM serves those from a cache backend instead of paying for the tokens
+again.
+
+Key   = sha256 over provider/model namespace, both prompts and the schema's
+        JSON schema — editing a schema (new field, changed description)
+        changes its digest, so stale entries simply stop matching.
+Value = the validated pydantic output as JSON; hits are re-validated into the
+        schema on the way out, so callers always get a typed object.
+
+generate_with_tools() is passed through uncached: its ReAct loop pulls live
+tool data, so identical prompts do not imply identical answers.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from functools import lru_cache
+from typing import AsyncIterator, Sequence
+
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel
+
+from app.core.cache import CacheBackend
+
+from .base import BaseLLM
+from .structured_stream import stream_items
+
+logger = logging.getLogger("llm_cache")
+
+
+@lru_cache(maxsize=None)
+def _schema_digest(response_schema: type[BaseModel]) -> str:
+    schema_json = json.dumps(response_schema.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema_json.encode("utf-8")).hexdigest()
+
+
+def response_cache_key(
+    namespace: str,
+    system_prompt: str,
+    user_prompt: str,
+    response_schema: type[BaseModel],
+) -> str:
+    h = hashlib.sha256()
+    for part in (namespace, system_prompt, user_prompt, _schema_digest(response_schema)):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+class CachedLLM(BaseLLM):
+    """
+    Parameters
+    ----------
+    llm:
+        The provider to wrap.
+    cache:
+        Backend shared by every CachedLLM (see app.core.cache).
+    namespace:
+        "provider:model" — keeps identical prompts to different models apart.
+    """
+
+    def __init__(self, llm: BaseLLM, cache: CacheBackend, namespace: str) -> None:
+        self._llm = llm
+        self._cache = cache
+        self._namespace = namespace
+
+    # ------------------------------------------------------------------
+    # Mode 1 — cached
+    # ------------------------------------------------------------------
+
+    def generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        response_schema: type[BaseModel],
+    ) -> BaseModel:
+        key = response_cache_key(self._namespace, system_prompt, user_prompt, response_schema)
+        cached = self._lookup(key, response_schema)
+        if cached is not None:
+            return cached
+
+        result = self._llm.generate(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            response_schema=response_schema,
+        )
+        self._store(key, result)
+        return result
+
+    async def agenerate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        response_schema: type[BaseModel],
+    ) -> BaseModel:
+        key = response_cache_key(self._namespace, system_prompt, user_prompt, response_schema)
+        cached = self._lookup(key, response_schema)
+        if cached is not None:
+            return cached
+
+        result = await self._llm.agenerate(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            response_schema=response_schema,
+        )
+        self._store(key, result)
+        return result
+
+    async def astream_generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        response_schema: type[BaseModel],
+    ) -> AsyncIterator[BaseModel]:
+        key = response_cache_key(self._namespace, system_prompt, user_prompt, response_schema)
+        cached = self._lookup(key, response_schema)
+        if cached is not None:
+            for item in stream_items(cached):
+                yield item
+            yield cached
+            return
+
+        async for value in self._llm.astream_generate(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            response_schema=response_schema,
+        ):
+            if isinstance(value, response_schema):
+                self._store(key, value)
+            yield value
+
+    # ------------------------------------------------------------------
+    # Mode 2 — pass-through (live tool data)
+    # ------------------------------------------------------------------
+
+    def generate_with_tools(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        tools: Sequence[BaseTool],
+        response_schema: type[BaseModel],
+        max_steps: int = 8,
+        prefetch: Sequence[dict] | None = None,
+    ) -> BaseModel:
+        return self._llm.generate_with_tools(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            tools=tools,
+            response_schema=response_schema,
+            max_steps=max_steps,
+            prefetch=prefetch,
+        )
+
+    async def agenerate_with_tools(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        tools: Sequence[BaseTool],
+        response_schema: type[BaseModel],
+        max_steps: int = 8,
+        prefetch: Sequence[dict] | None = None,
+    ) -> BaseModel:
+        return await self._llm.agenerate_with_tools(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            tools=tools,
+            response_schema=response_schema,
+            max_steps=max_steps,
+            prefetch=prefetch,
+        )
+
+    async def astream_generate_with_tools(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        tools: Sequence[BaseTool],
+        response_schema: type[BaseModel],
+        max_steps: int = 8,
+        prefetch: Sequence[dict] | None = None,
+    ) -> AsyncIterator[BaseModel]:
+        async for value in self._llm.astream_generate_with_tools(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            tools=tools,
+            response_schema=response_schema,
+            max_steps=max_steps,
+            prefetch=prefetch,
+        ):
+            yield value
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _lookup(self, key: str, response_schema: type[BaseModel]) -> BaseModel | None:
+        raw = self._cache.get(key)
+        if raw is not None:
+            try:
+                result = response_schema.model_validate_json(raw)
+            except Exception as exc:
+                logger.warning(f"LLM_CACHE | corrupt entry dropped | error={exc}")
+                self._cache.delete(key)
+            else:
+                logger.info(
+                    f"LLM_CACHE | hit | namespace={self._namespace} | "
+                    f"schema={response_schema.__name__} | {self._stats_line()}"
+                )
+                return result
+
+        logger.info(
+            f"LLM_CACHE | miss | namespace={self._namespace} | "
+            f"schema={response_schema.__name__} | {self._stats_line()}"
+        )
+        return None
+
+    def _store(self, key: str, result: BaseModel) -> None:
+        self._cache.set(key, result.model_dump_json())
+
+    def _stats_line(self) -> str:
+        stats = self._cache.stats()
+        return f"hits={stats['hits']} | misses={stats['misses']} | hit_rate={stats['hit_rate']}"
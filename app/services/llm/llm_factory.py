@@ -3,14 +3,29 @@ from __future__ import annotations
 from functools import lru_cache
 
 from app.config import AGENT_MODEL_MAP
+from app.core.cache import CacheBackend, build_cache_backend
 from app.core.settings import settings
 
 from .anthropic_provider import AnthropicProvider
 from .base import BaseLLM
+from .cached_llm import CachedLLM
 from .ollama_provider import OllamaProvider
 from .openai_provider import OpenAIProvider
 
 
+@lru_cache(maxsize=None)
+def get_response_cache() -> CacheBackend | None:
+    """Process-wide LLM response cache, or None when LLM_CACHE_BACKEND=none."""
+    return build_cache_backend(
+        settings.llm_cache_backend,
+        namespace="llm",
+        ttl_seconds=settings.llm_cache_ttl_seconds,
+        max_entries=settings.llm_cache_max_entries,
+        redis_url=settings.redis_url,
+        path=settings.llm_cache_path,
+    )
+
+
 class LLMFactory:
     @staticmethod
     @lru_cache(maxsize=None)
@@ -19,6 +34,7 @@ class LLMFactory:
         Return an LLM for a given agent/node type.
         Reads provider and model from app.config.AGENT_MODEL_MAP;
         falls back to settings when agent is not in the map.
+        Wrapped in CachedLLM when a response cache backend is configured.
         """
         key = agent_type.lower()
         entry = AGENT_MODEL_MAP.get(key)
@@ -31,10 +47,18 @@ class LLMFactory:
             model = ""
 
         if provider == "ollama":
-            return OllamaProvider(model=model or settings.ollama_model_default)
-        if provider == "openai":
-            return OpenAIProvider(model=model or settings.openai_model_default)
-        if provider == "anthropic":
-            return AnthropicProvider(model=model or settings.anthropic_model_default)
+            model = model or settings.ollama_model_default
+            llm: BaseLLM = OllamaProvider(model=model)
+        elif provider == "openai":
+            model = model or settings.openai_model_default
+            llm = OpenAIProvider(model=model)
+        elif provider == "anthropic":
+            model = model or settings.anthropic_model_default
+            llm = AnthropicProvider(model=model)
+        else:
+            raise ValueError(f"Unsupported LLM provider: {provider!r}")
 
-        raise ValueError(f"Unsupported LLM provider: {provider!r}")
+        cache = get_response_cache()
+        if cache is None:
+            return llm
+        return CachedLLM(llm, cache, namespace=f"{provider}:{model}")
@@ -0,0 +1,163 @@
+# app/services/llm/message_budget.py
+"""
+Token budgets for the ReAct loop.
+
+Without limits every ToolMessage stays in the history sent on each LLM
+turn, and every observation lands in the final synthesis prompt — six
+steps of search results can run to tens of thousands of tokens. One
+MessageBudget per ReActEngine run keeps both bounded:
+
+  admit()             compacts JSON tool results (lossless) and replaces a
+                      result identical to an earlier one with a short
+                      back-reference, recorded as an observation only once
+  fit_history()       before each LLM turn, if the history is over
+                      REACT_HISTORY_TOKEN_BUDGET, cuts older ToolMessages
+                      (oldest first) down to a short head — the latest
+                      step's results stay whole
+  fit_observations()  the same for the synthesis prompt against
+                      REACT_OBSERVATION_TOKEN_BUDGET
+
+Tokens are counted per provider: tiktoken for OpenAI when its encoding is
+available, otherwise a characters-per-token estimate for the provider.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from functools import lru_cache
+from typing import Callable
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+
+logger = logging.getLogger("react_engine")
+
+# Rough characters per token when no tokenizer is available.
+_CHARS_PER_TOKEN = {"openai": 4.0, "anthropic": 3.5, "ollama": 4.0}
+_DEFAULT_CHARS_PER_TOKEN = 4.0
+_MESSAGE_OVERHEAD_TOKENS = 4  # role / framing per chat message
+_TRUNCATED_HEAD_CHARS = 400
+
+
+class TokenCounter:
+    def __init__(self, provider: str | None) -> None:
+        self.provider = (provider or "").lower()
+        self._encode = self._tokenizer()
+
+    def _tokenizer(self) -> Callable[[str], int] | None:
+        if self.provider != "openai":
+            return None
+        try:
+            import tiktoken
+
+            encoding = tiktoken.get_encoding("o200k_base")
+        except Exception as exc:  # not installed, or encoding not downloadable
+            logger.info(f"REACT_BUDGET | tiktoken unavailable ({type(exc).__name__}) — estimating")
+            return None
+        return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+    def count(self, text: str) -> int:
+        if self._encode is not None:
+            return self._encode(text)
+        ratio = _CHARS_PER_TOKEN.get(self.provider, _DEFAULT_CHARS_PER_TOKEN)
+        return int(len(text) / ratio) + 1
+
+    def count_message(self, message: BaseMessage) -> int:
+        content = message.content if isinstance(message.content, str) else json.dumps(message.content)
+        tokens = self.count(content) + _MESSAGE_OVERHEAD_TOKENS
+        for call in getattr(message, "tool_calls", None) or []:
+            tokens += self.count(call["name"]) + self.count(json.dumps(call["args"]))
+        return tokens
+
+
+@lru_cache(maxsize=None)
+def get_token_counter(provider: str | None) -> TokenCounter:
+    return TokenCounter(provider)
+
+
+def _compact(result: str) -> str:
+    """Re-serialize JSON results without whitespace; other text unchanged."""
+    try:
+        return json.dumps(json.loads(result), separators=(",", ":"), ensure_ascii=False)
+    except (TypeError, ValueError):
+        return result
+
+
+def _truncate(text: str, head_chars: int = _TRUNCATED_HEAD_CHARS) -> str:
+    if len(text) <= head_chars:
+        return text
+    return f"{text[:head_chars]}… [truncated {len(text) - head_chars} chars]"
+
+
+class MessageBudget:
+    """Per-run token bookkeeping for ReActEngine. 0 budgets mean unlimited."""
+
+    def __init__(self, counter: TokenCounter, history_tokens: int, observation_tokens: int) -> None:
+        self.counter = counter
+        self.history_tokens = history_tokens
+        self.observation_tokens = observation_tokens
+        self._seen: dict[str, str] = {}  # result digest -> first tool_call_id
+
+    def admit(self, call: dict, result: str) -> tuple[str, bool]:
+        """
+        (ToolMessage content, is_new) for one tool result. Repeats of an
+        earlier identical result come back as a back-reference.
+        """
+        result = _compact(result)
+        digest = hashlib.sha256(result.encode("utf-8")).hexdigest()
+        first = self._seen.get(digest)
+        if first is not None:
+            logger.info(f"REACT_BUDGET | duplicate result | tool={call['name']} | same_as={first}")
+            return json.dumps({"note": f"Identical to the result of tool call {first} above."}), False
+        self._seen[digest] = call["id"]
+        return result, True
+
+    def fit_history(self, messages: list[BaseMessage]) -> None:
+        """Truncate older ToolMessages in place until the history fits the budget."""
+        if self.history_tokens <= 0:
+            return
+        sizes = [self.counter.count_message(m) for m in messages]
+        total = sum(sizes)
+        if total <= self.history_tokens:
+            return
+        # Results of the latest step are what the model is about to read — keep them.
+        last_ai = max((i for i, m in enumerate(messages) if isinstance(m, AIMessage)), default=len(messages))
+        before = total
+        for i, message in enumerate(messages[:last_ai]):
+            if total <= self.history_tokens:
+                break
+            if not isinstance(message, ToolMessage):
+                continue
+            shortened = _truncate(message.content if isinstance(message.content, str) else str(message.content))
+            if shortened == message.content:
+                continue
+            messages[i] = ToolMessage(content=shortened, tool_call_id=message.tool_call_id)
+            new_size = self.counter.count_message(messages[i])
+            total -= sizes[i] - new_size
+            sizes[i] = new_size
+        logger.info(
+            f"REACT_BUDGET | history truncated | tokens={before}→{total} | "
+            f"budget={self.history_tokens}"
+        )
+
+    def fit_observations(self, observations: list[str]) -> list[str]:
+        """Observations for the synthesis prompt, oldest truncated first to fit the budget."""
+        if self.observation_tokens <= 0:
+            return observations
+        sizes = [self.counter.count(o) for o in observations]
+        total = sum(sizes)
+        if total <= self.observation_tokens:
+            return observations
+        fitted = list(observations)
+        before = total
+        for i in range(len(fitted) - 1):  # the last one (final answer / latest result) stays whole
+            if total <= self.observation_tokens:
+                break
+            fitted[i] = _truncate(fitted[i])
+            new_size = self.counter.count(fitted[i])
+            total -= sizes[i] - new_size
+        logger.info(
+            f"REACT_BUDGET | observations truncated | tokens={before}→{total} | "
+            f"budget={self.observation_tokens}"
+        )
+        return fitted
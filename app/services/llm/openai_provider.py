@@ -6,17 +6,18 @@ the ReAct tool-calling loop via `generate_with_tools()`.
 from __future__ import annotations
 
 import logging
-from typing import Sequence
+from typing import AsyncIterator, Sequence
 
 from langchain_core.tools import BaseTool
 from langchain_openai import ChatOpenAI
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from pydantic import BaseModel
 
 from app.core.settings import settings
 
 from .base import BaseLLM
 from .react_engine import ReActEngine
+from .structured_stream import StructuredStreamParser
 
 logger = logging.getLogger("openai_provider")
 
@@ -27,6 +28,7 @@ class OpenAIProvider(BaseLLM):
 
         # Raw OpenAI client — used for structured-output generation (mode 1).
         self._client = OpenAI(api_key=settings.openai_api_key)
+        self._async_client = AsyncOpenAI(api_key=settings.openai_api_key)
 
         # LangChain chat model — used for tool-binding in ReAct (mode 2).
         self._chat = ChatOpenAI(
@@ -47,15 +49,59 @@ class OpenAIProvider(BaseLLM):
         response_schema: type[BaseModel],
     ) -> BaseModel:
         response = self._client.beta.chat.completions.parse(
-            model=self._model_name,
-            messages=[
+            **self._parse_kwargs(system_prompt, user_prompt, response_schema)
+        )
+        return self._parsed(response)
+
+    async def agenerate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        response_schema: type[BaseModel],
+    ) -> BaseModel:
+        response = await self._async_client.beta.chat.completions.parse(
+            **self._parse_kwargs(system_prompt, user_prompt, response_schema)
+        )
+        return self._parsed(response)
+
+    async def astream_generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        response_schema: type[BaseModel],
+    ) -> AsyncIterator[BaseModel]:
+        parser = StructuredStreamParser(response_schema)
+        async with self._async_client.beta.chat.completions.stream(
+            **self._parse_kwargs(system_prompt, user_prompt, response_schema),
+            stream_options={"include_usage": True},
+        ) as stream:
+            async for event in stream:
+                if event.type == "content.delta":
+                    for item in parser.feed(event.delta):
+                        yield item
+            response = await stream.get_final_completion()
+        yield self._parsed(response)
+
+    def _parse_kwargs(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        response_schema: type[BaseModel],
+    ) -> dict:
+        return {
+            "model": self._model_name,
+            "messages": [
                 {"role": "system", "content": system_prompt},
                 {"role": "user",   "content": user_prompt},
             ],
-            temperature=0.7,
-            max_tokens=7048,
-            response_format=response_schema,
-        )
+            "temperature": 0.7,
+            "max_tokens": 7048,
+            "response_format": response_schema,
+        }
+
+    def _parsed(self, response) -> BaseModel:
         usage = response.usage
         logger.info(
             f"LLM_CALL | provider=openai | model={self._model_name} | "
@@ -77,15 +123,17 @@ class OpenAIProvider(BaseLLM):
         tools: Sequence[BaseTool],
         response_schema: type[BaseModel],
         max_steps: int = 8,
+        prefetch: Sequence[dict] | None = None,
     ) -> BaseModel:
         llm_with_tools = self._chat.bind_tools(tools)
         engine = ReActEngine(
             llm_with_tools=llm_with_tools,
             tools=tools,
             max_steps=max_steps,
+            provider="openai",
         )
 
-        observations = engine.run(system_prompt, user_prompt)
+        observations = engine.run(system_prompt, user_prompt, prefetch=prefetch)
         logger.info(
             f"ReAct complete | provider=openai | "
             f"observations_len={len(observations)}"
@@ -100,6 +148,69 @@ class OpenAIProvider(BaseLLM):
             response_schema=response_schema,
         )
 
+    async def agenerate_with_tools(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        tools: Sequence[BaseTool],
+        response_schema: type[BaseModel],
+        max_steps: int = 8,
+        prefetch: Sequence[dict] | None = None,
+    ) -> BaseModel:
+        llm_with_tools = self._chat.bind_tools(tools)
+        engine = ReActEngine(
+            llm_with_tools=llm_with_tools,
+            tools=tools,
+            max_steps=max_steps,
+            provider="openai",
+        )
+
+        observations = await engine.arun(system_prompt, user_prompt, prefetch=prefetch)
+        logger.info(
+            f"ReAct complete | provider=openai | "
+            f"observations_len={len(observations)}"
+        )
+
+        enriched_prompt = _build_synthesis_prompt(user_prompt, observations)
+        return await self.agenerate(
+            system_prompt=system_prompt,
+            user_prompt=enriched_prompt,
+            response_schema=response_schema,
+        )
+
+    async def astream_generate_with_tools(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        *,
+        tools: Sequence[BaseTool],
+        response_schema: type[BaseModel],
+        max_steps: int = 8,
+        prefetch: Sequence[dict] | None = None,
+    ) -> AsyncIterator[BaseModel]:
+        llm_with_tools = self._chat.bind_tools(tools)
+        engine = ReActEngine(
+            llm_with_tools=llm_with_tools,
+            tools=tools,
+            max_steps=max_steps,
+            provider="openai",
+        )
+
+        observations = await engine.arun(system_prompt, user_prompt, prefetch=prefetch)
+        logger.info(
+            f"ReAct complete | provider=openai | "
+            f"observations_len={len(observations)}"
+        )
+
+        enriched_prompt = _build_synthesis_prompt(user_prompt, observations)
+        async for value in self.astream_generate(
+            system_prompt=system_prompt,
+            user_prompt=enriched_prompt,
+            response_schema=response_schema,
+        ):
+            yield value
+
 
 # ---------------------------------------------------------------------------
 # Shared helper
@@ -10,18 +10,43 @@ the engine drives the LLM until it either:
   2. Exhausts the allowed step budget (safety ceiling).
 
 The engine is intentionally stateless — all context lives in the message
-history it accumulates during a single `run()` call.
+history it accumulates during a single `run()` call.  A per-run
+MessageBudget (message_budget.py) keeps that history and the returned
+observations within token budgets, and dedupes identical tool results.
+
+When the LLM emits several tool calls in one AIMessage they are independent
+by construction (the model had no observation between them), so they are
+dispatched concurrently on a small thread pool.  ToolMessages are still
+appended in the original call order so the message history is identical to
+a sequential run.
+
+Prefetch: tool calls whose arguments are known before the LLM runs (the
+brand tools only take brand_id) can be passed as `prefetch`.  They are
+executed up front and seeded into the history as an assistant tool-call
+turn plus its ToolMessages, exactly as if the model had asked for them —
+saving the LLM round trip that would have requested them.  When the
+prefetch already covers every bound tool there is nothing left to fetch
+and the loop is skipped.
 
 Usage
 -----
     engine  = ReActEngine(llm_with_tools, tools=RESEARCH_TOOLS, max_steps=6)
     summary = engine.run(system_prompt, user_prompt)
     # summary is a plain string — pass it to the final structured generation step.
+
+    summary = await engine.arun(system_prompt, user_prompt)
+    # async variant — LLM turns via ainvoke, tool calls gathered on the loop.
+
+    summary = engine.run(system_prompt, user_prompt,
+                         prefetch=[{"name": "get_brand_tone", "args": {"brand_id": bid}}])
 """
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Sequence
 
 from langchain_core.messages import (
@@ -33,6 +58,9 @@ from langchain_core.messages import (
 )
 from langchain_core.tools import BaseTool
 
+from app.core.settings import settings
+from app.services.llm.message_budget import MessageBudget, get_token_counter
+
 logger = logging.getLogger("react_engine")
 
 # Hard ceiling — prevents infinite loops if the LLM keeps calling tools.
@@ -52,6 +80,13 @@ class ReActEngine:
     max_steps:
         Maximum tool-calling rounds before the loop is aborted and whatever
         observations we have are passed to the final synthesis step.
+    max_concurrency:
+        Maximum number of tool calls from a single step executed at once.
+        Defaults to `settings.react_tool_concurrency`; 1 disables parallel
+        dispatch.
+    provider:
+        "openai" | "anthropic" | "ollama" — selects how tokens are counted
+        against the history / observation budgets.
     """
 
     def __init__(
@@ -59,19 +94,35 @@ class ReActEngine:
         llm_with_tools: Any,
         tools: Sequence[BaseTool],
         max_steps: int = _DEFAULT_MAX_STEPS,
+        max_concurrency: int | None = None,
+        provider: str | None = None,
     ) -> None:
         self._llm = llm_with_tools
+        self._provider = provider
         self._tool_map: dict[str, BaseTool] = {t.name: t for t in tools}
         self._max_steps = max_steps
+        self._max_concurrency = max(
+            1,
+            max_concurrency if max_concurrency is not None
+            else settings.react_tool_concurrency,
+        )
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def run(self, system_prompt: str, user_prompt: str) -> str:
+    def run(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        prefetch: Sequence[dict] | None = None,
+    ) -> str:
         """
         Execute the ReAct loop.
 
+        `prefetch` — tool calls ({"name", "args"}) to run before the first
+        LLM turn; their results start the history.
+
         Returns a plain-text summary of all observations gathered — ready
         to be handed to a final structured-generation call.
         """
@@ -81,12 +132,22 @@ class ReActEngine:
         ]
 
         observations: list[str] = []
+        budget = self._new_budget()
         steps = 0
 
+        if prefetch:
+            seed = self._prefetch_message(prefetch)
+            messages.append(seed)
+            results = self._dispatch(seed.tool_calls)
+            self._record(seed.tool_calls, results, messages, observations, budget)
+            if self._covers_all_tools(prefetch):
+                return self._format_observations(budget.fit_observations(observations))
+
         while steps < self._max_steps:
             steps += 1
             logger.info(f"ReActEngine | step={steps}/{self._max_steps}")
 
+            budget.fit_history(messages)
             ai_message: AIMessage = self._llm.invoke(messages)
             messages.append(ai_message)
 
@@ -100,45 +161,65 @@ class ReActEngine:
                     observations.append(str(ai_message.content))
                 break
 
-            # ---------- dispatch each tool call ----------
-            for call in tool_calls:
-                tool_name = call["name"]
-                tool_args = call["args"]
-                call_id   = call["id"]
+            # ---------- dispatch tool calls (concurrently) ----------
+            results = self._dispatch(tool_calls)
+            self._record(tool_calls, results, messages, observations, budget)
 
-                logger.info(
-                    f"ReActEngine | tool_call | name={tool_name} | args={tool_args}"
-                )
+        else:
+            logger.warning(
+                f"ReActEngine | max_steps={self._max_steps} reached — "
+                "forcing synthesis with collected observations"
+            )
 
-                tool_fn = self._tool_map.get(tool_name)
-                if tool_fn is None:
-                    result = json.dumps({
-                        "error": f"Unknown tool '{tool_name}'. "
-                                 f"Available: {list(self._tool_map)}"
-                    })
-                    logger.warning(
-                        f"ReActEngine | unknown tool | name={tool_name}"
-                    )
-                else:
-                    try:
-                        raw = tool_fn.invoke(tool_args)
-                        result = raw if isinstance(raw, str) else json.dumps(raw)
-                        logger.info(
-                            f"ReActEngine | tool_result | "
-                            f"name={tool_name} | "
-                            f"result_len={len(result)}"
-                        )
-                    except Exception as exc:
-                        result = json.dumps({"error": str(exc)})
-                        logger.error(
-                            f"ReActEngine | tool_error | "
-                            f"name={tool_name} | error={exc}"
-                        )
-
-                observations.append(f"[{tool_name}] → {result}")
-                messages.append(
-                    ToolMessage(content=result, tool_call_id=call_id)
-                )
+        return self._format_observations(budget.fit_observations(observations))
+
+    async def arun(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        prefetch: Sequence[dict] | None = None,
+    ) -> str:
+        """
+        Async variant of `run()`.
+
+        LLM turns use `ainvoke`; tool calls from one step are gathered on
+        the running event loop, bounded by max_concurrency.
+        """
+        messages: list[BaseMessage] = [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=user_prompt),
+        ]
+
+        observations: list[str] = []
+        budget = self._new_budget()
+        steps = 0
+
+        if prefetch:
+            seed = self._prefetch_message(prefetch)
+            messages.append(seed)
+            results = await self._adispatch(seed.tool_calls)
+            self._record(seed.tool_calls, results, messages, observations, budget)
+            if self._covers_all_tools(prefetch):
+                return self._format_observations(budget.fit_observations(observations))
+
+        while steps < self._max_steps:
+            steps += 1
+            logger.info(f"ReActEngine | step={steps}/{self._max_steps}")
+
+            budget.fit_history(messages)
+            ai_message: AIMessage = await self._llm.ainvoke(messages)
+            messages.append(ai_message)
+
+            tool_calls = getattr(ai_message, "tool_calls", None) or []
+
+            if not tool_calls:
+                logger.info("ReActEngine | no tool calls — loop complete")
+                if ai_message.content:
+                    observations.append(str(ai_message.content))
+                break
+
+            results = await self._adispatch(tool_calls)
+            self._record(tool_calls, results, messages, observations, budget)
 
         else:
             logger.warning(
@@ -146,12 +227,151 @@ class ReActEngine:
                 "forcing synthesis with collected observations"
             )
 
-        return self._format_observations(observations)
+        return self._format_observations(budget.fit_observations(observations))
 
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _prefetch_message(prefetch: Sequence[dict]) -> AIMessage:
+        """Synthetic assistant turn requesting the prefetched calls."""
+        logger.info(
+            f"ReActEngine | prefetch | "
+            f"tools={[call['name'] for call in prefetch]}"
+        )
+        return AIMessage(
+            content="",
+            tool_calls=[
+                {"name": call["name"], "args": call["args"], "id": f"prefetch_{i}"}
+                for i, call in enumerate(prefetch)
+            ],
+        )
+
+    def _covers_all_tools(self, prefetch: Sequence[dict]) -> bool:
+        covered = {call["name"] for call in prefetch}
+        if covered.issuperset(self._tool_map):
+            logger.info("ReActEngine | prefetch covers every tool — loop skipped")
+            return True
+        return False
+
+    def _new_budget(self) -> MessageBudget:
+        return MessageBudget(
+            get_token_counter(self._provider),
+            history_tokens=settings.react_history_token_budget,
+            observation_tokens=settings.react_observation_token_budget,
+        )
+
+    @staticmethod
+    def _record(
+        tool_calls: list[dict],
+        results: list[str],
+        messages: list[BaseMessage],
+        observations: list[str],
+        budget: MessageBudget,
+    ) -> None:
+        # Append in the original call order — the LLM matches each
+        # ToolMessage to its call by id, but a stable order keeps the
+        # history (and any tracing) identical to a sequential run.
+        for call, result in zip(tool_calls, results):
+            content, is_new = budget.admit(call, result)
+            if is_new:
+                observations.append(f"[{call['name']}] → {content}")
+            messages.append(
+                ToolMessage(content=content, tool_call_id=call["id"])
+            )
+
+    def _dispatch(self, tool_calls: list[dict]) -> list[str]:
+        """
+        Execute every tool call from one step and return their results in
+        call order.  Calls run on a thread pool bounded by max_concurrency;
+        a single call (or max_concurrency=1) runs inline.
+        """
+        workers = min(self._max_concurrency, len(tool_calls))
+        if workers <= 1:
+            return [self._execute_tool_call(call) for call in tool_calls]
+
+        logger.info(
+            f"ReActEngine | parallel dispatch | "
+            f"calls={len(tool_calls)} | workers={workers}"
+        )
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="react-tool"
+        ) as pool:
+            # Each call gets a copy of the caller's context so tracing
+            # callbacks and any run-scoped context vars follow the tool.
+            futures = [
+                pool.submit(
+                    contextvars.copy_context().run,
+                    self._execute_tool_call,
+                    call,
+                )
+                for call in tool_calls
+            ]
+            return [f.result() for f in futures]
+
+    async def _adispatch(self, tool_calls: list[dict]) -> list[str]:
+        """Async counterpart of `_dispatch()` — gather under a semaphore."""
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _bounded(call: dict) -> str:
+            async with semaphore:
+                return await self._aexecute_tool_call(call)
+
+        return list(await asyncio.gather(*(_bounded(c) for c in tool_calls)))
+
+    def _execute_tool_call(self, call: dict) -> str:
+        """Run one tool call. Never raises — errors become JSON results."""
+        tool_fn = self._resolve_tool(call)
+        if tool_fn is None:
+            return self._unknown_tool_result(call["name"])
+        try:
+            return self._tool_result(call["name"], tool_fn.invoke(call["args"]))
+        except Exception as exc:
+            return self._tool_error(call["name"], exc)
+
+    async def _aexecute_tool_call(self, call: dict) -> str:
+        """Async `_execute_tool_call()` — sync-only tools run in an executor."""
+        tool_fn = self._resolve_tool(call)
+        if tool_fn is None:
+            return self._unknown_tool_result(call["name"])
+        try:
+            raw = await tool_fn.ainvoke(call["args"])
+            return self._tool_result(call["name"], raw)
+        except Exception as exc:
+            return self._tool_error(call["name"], exc)
+
+    def _resolve_tool(self, call: dict) -> BaseTool | None:
+        logger.info(
+            f"ReActEngine | tool_call | name={call['name']} | args={call['args']}"
+        )
+        return self._tool_map.get(call["name"])
+
+    def _unknown_tool_result(self, tool_name: str) -> str:
+        logger.warning(f"ReActEngine | unknown tool | name={tool_name}")
+        return json.dumps({
+            "error": f"Unknown tool '{tool_name}'. "
+                     f"Available: {list(self._tool_map)}"
+        })
+
+    @staticmethod
+    def _tool_result(tool_name: str, raw: Any) -> str:
+        result = raw if isinstance(raw, str) else json.dumps(raw)
+        logger.info(
+            f"ReActEngine | tool_result | "
+            f"name={tool_name} | "
+            f"result_len={len(result)}"
+        )
+        return result
+
+    @staticmethod
+    def _tool_error(tool_name: str, exc: Exception) -> str:
+        logger.error(
+            f"ReActEngine | tool_error | "
+            f"name={tool_name} | error={exc}"
+        )
+        return json.dumps({"error": str(exc)})
+
     @staticmethod
     def _format_observations(observations: list[str]) -> str:
         if not observations:
@@ -0,0 +1,124 @@
+# app/services/llm/structured_stream.py
+"""
+Incremental parsing for streamed structured output.
+
+A schema like ContentOutput is one JSON object whose payload is a list of
+sub-models (`assets: list[ContentAsset]`). While the model is still emitting
+tokens, StructuredStreamParser scans the raw text and hands back each list
+item as soon as its closing brace arrives — so the first asset can be shown
+long before the last one is written.
+
+Only complete items are emitted; the authoritative result is still the full
+response validated against the schema once the stream ends.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import typing
+from functools import lru_cache
+
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger("llm_stream")
+
+
+@lru_cache(maxsize=None)
+def stream_field(response_schema: type[BaseModel]) -> tuple[str, type[BaseModel]] | None:
+    """First `list[<BaseModel>]` field of the schema — the one worth streaming."""
+    for name, field in response_schema.model_fields.items():
+        if typing.get_origin(field.annotation) is not list:
+            continue
+        (item_type,) = typing.get_args(field.annotation) or (None,)
+        if isinstance(item_type, type) and issubclass(item_type, BaseModel):
+            return name, item_type
+    return None
+
+
+def stream_items(result: BaseModel) -> list[BaseModel]:
+    """Items of the streamed field on an already-complete result."""
+    target = stream_field(type(result))
+    if target is None:
+        return []
+    return list(getattr(result, target[0]))
+
+
+class StructuredStreamParser:
+    """
+    Feed raw text deltas; get back validated items of the schema's list field.
+
+    Tracks string/escape state and bracket depth character by character, so
+    braces inside string values never confuse it, and text outside the JSON
+    object (e.g. a stray ```json fence) is ignored.
+    """
+
+    def __init__(self, response_schema: type[BaseModel]) -> None:
+        target = stream_field(response_schema)
+        self._field, self._item_model = target if target else (None, None)
+        self._buffer: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._string_start = -1
+        self._last_key: str | None = None
+        self._in_array = False
+        self._item_start = -1
+        self._pos = 0
+
+    def feed(self, text: str) -> list[BaseModel]:
+        if self._field is None or not text:
+            return []
+        self._buffer.append(text)
+        items: list[BaseModel] = []
+
+        for ch in text:
+            pos = self._pos
+            self._pos += 1
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_key = self._slice(self._string_start + 1, pos)
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._string_start = pos
+            elif ch in "{[":
+                if ch == "[" and self._depth == 1 and self._last_key == self._field:
+                    self._in_array = True
+                elif ch == "{" and self._in_array and self._depth == 2:
+                    self._item_start = pos
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if ch == "}" and self._in_array and self._depth == 2 and self._item_start >= 0:
+                    item = self._validate(self._slice(self._item_start, pos + 1))
+                    if item is not None:
+                        items.append(item)
+                    self._item_start = -1
+                elif ch == "]" and self._in_array and self._depth == 1:
+                    self._in_array = False
+            elif ch == "," and self._depth == 1:
+                self._last_key = None
+
+        return items
+
+    def _slice(self, start: int, end: int) -> str:
+        if len(self._buffer) > 1:
+            self._buffer = ["".join(self._buffer)]
+        return self._buffer[0][start:end]
+
+    def _validate(self, raw: str) -> BaseModel | None:
+        try:
+            return self._item_model.model_validate(json.loads(raw))
+        except (ValueError, ValidationError) as exc:
+            # The final full-response validation is authoritative — a bad
+            # partial item is skipped here, not raised.
+            logger.warning(f"LLM_STREAM | item skipped | field={self._field} | error={exc}")
+            return None
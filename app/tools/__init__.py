@@ -10,20 +10,55 @@ Each agent imports only its own registry. This is the hard boundary:
 An agent cannot accidentally call a tool outside its registry.
 If the LLM hallucinates a tool name not in the list, OllamaProvider
 returns a structured error and the LLM reasons around it.
+
+PREFETCH_TOOLS are deterministic given the brand id alone — agents run
+them up front via `prefetch_calls()` (generate_with_tools(prefetch=...))
+instead of spending LLM turns asking for them. get_past_campaigns is left
+to the model: how much history to read (`limit`) is its call, and it keeps
+the Strategy Agent's loop meaningful. The Content Agent's tools are all
+prefetched, so its loop is skipped (see ReActEngine).
 """
+from typing import Sequence
+
+from langchain_core.tools import BaseTool
+
+from app.core.settings import settings
 from app.tools.research.web_search                  import web_search
-from app.tools.research.serper_competitor_lookup     import serper_competitor_lookup
+from app.tools.research.serper_competitor_lookup     import (
+    serper_competitor_batch_lookup,
+    serper_competitor_lookup,
+)
 from app.tools.strategy.get_brand_memory             import get_brand_memory
 from app.tools.strategy.get_past_campaigns           import get_past_campaigns
 from app.tools.content.get_brand_guidelines          import get_brand_guidelines
 from app.tools.content.get_brand_tone                import get_brand_tone
 
-RESEARCH_TOOLS = [web_search, serper_competitor_lookup]
+RESEARCH_TOOLS = [web_search, serper_competitor_lookup, serper_competitor_batch_lookup]
 STRATEGY_TOOLS = [get_brand_memory, get_past_campaigns, get_brand_guidelines]
 CONTENT_TOOLS  = [get_brand_guidelines, get_brand_tone]
 
+PREFETCH_TOOLS = frozenset({
+    get_brand_memory.name,
+    get_brand_guidelines.name,
+    get_brand_tone.name,
+})
+
+
+def prefetch_calls(tools: Sequence[BaseTool], brand_id: str) -> list[dict]:
+    """Tool calls for every prefetchable tool in `tools`, bound to `brand_id`."""
+    if not settings.react_prefetch or not brand_id:
+        return []
+    return [
+        {"name": t.name, "args": {"brand_id": brand_id}}
+        for t in tools
+        if t.name in PREFETCH_TOOLS
+    ]
+
+
 __all__ = [
     "RESEARCH_TOOLS",
     "STRATEGY_TOOLS",
     "CONTENT_TOOLS",
+    "PREFETCH_TOOLS",
+    "prefetch_calls",
 ]
\ No newline at end of file
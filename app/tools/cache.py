@@ -0,0 +1,119 @@
+# app/tools/cache.py
+"""
+Shared result cache for external-API tools (Tavily, Serper.dev).
+
+Campaigns for the same brand or industry repeat the same lookups
+("HubSpot", "marketing automation market size 2024") — each one costs an
+upstream request and API quota. ToolResultCache sits in front of the fetch:
+
+  - keyed on the tool name + normalized arguments (case/whitespace folded),
+    so "HubSpot" and " hubspot " share an entry
+  - one backend per tool with its own TTL (app.core.cache — memory, redis
+    to share across workers, or disk)
+  - single-flight: concurrent identical lookups inside this process (parallel
+    ReAct tool calls, concurrent campaign jobs) wait on the first caller's
+    request instead of issuing their own
+  - error payloads (JSON with an "error" key) are returned but never stored,
+    so a transient upstream failure is not pinned for a whole TTL
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from functools import lru_cache
+from typing import Any, Callable
+
+from app.core.cache import CacheBackend, build_cache_backend
+from app.core.settings import settings
+
+logger = logging.getLogger("tools.cache")
+
+
+def normalize_text(value: str) -> str:
+    """Case-fold and collapse whitespace so trivially different args share a key."""
+    return " ".join(value.split()).casefold()
+
+
+class _InFlight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: str | None = None
+        self.error: BaseException | None = None
+
+
+class ToolResultCache:
+    def __init__(self, tool_name: str, backend: CacheBackend | None) -> None:
+        self.tool_name = tool_name
+        self._backend = backend
+        self._inflight: dict[str, _InFlight] = {}
+        self._lock = threading.Lock()
+
+    def get_or_fetch(self, args: dict[str, Any], fetch: Callable[[], str]) -> str:
+        """
+        Return the cached JSON result for `args`, or run `fetch()` once —
+        concurrent callers with the same args share that single call.
+        """
+        key = self._key(args)
+
+        if self._backend is not None:
+            cached = self._backend.get(key)
+            if cached is not None:
+                logger.info(f"TOOL_CACHE | hit | tool={self.tool_name} | args={args}")
+                return cached
+
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _InFlight()
+                self._inflight[key] = flight
+
+        if not leader:
+            logger.info(f"TOOL_CACHE | coalesced | tool={self.tool_name} | args={args}")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        logger.info(f"TOOL_CACHE | miss | tool={self.tool_name} | args={args}")
+        try:
+            result = fetch()
+            flight.result = result
+            if self._backend is not None and _is_cacheable(result):
+                self._backend.set(key, result)
+            return result
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+    def _key(self, args: dict[str, Any]) -> str:
+        payload = json.dumps(args, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _is_cacheable(result: str) -> bool:
+    try:
+        payload = json.loads(result)
+    except (TypeError, ValueError):
+        return False
+    return not (isinstance(payload, dict) and payload.get("error"))
+
+
+@lru_cache(maxsize=None)
+def get_tool_cache(tool_name: str, ttl_seconds: int) -> ToolResultCache:
+    """Process-wide cache for one tool; backend from settings.tool_cache_backend."""
+    backend = build_cache_backend(
+        settings.tool_cache_backend,
+        namespace=f"tool:{tool_name}",
+        ttl_seconds=ttl_seconds,
+        max_entries=settings.tool_cache_max_entries,
+        redis_url=settings.redis_url,
+        path=settings.tool_cache_path,
+    )
+    return ToolResultCache(tool_name, backend)
@@ -2,17 +2,21 @@
 """Competitor intelligence tool for research agent using Serper.dev."""
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import httpx
 from langchain_core.tools import tool
 
 from app.core.settings import settings
+from app.tools.cache import get_tool_cache, normalize_text
 
 logger = logging.getLogger("tools.serper_competitor_lookup")
 
 SERPER_BASE_URL = "https://google.serper.dev"
 
+_MAX_BATCH_COMPANIES = 10  # one batch call should not fan out without bound
+
 # Module-level client — instantiated once, reused across calls
 # Avoids rebuilding headers and connection pool on every tool invocation
 _client: Optional[httpx.Client] = None
@@ -37,6 +41,12 @@ def _get_client() -> httpx.Client:
     return _client
 
 
+# Overview + news requests run side by side on the shared client (httpx.Client
+# is thread-safe). Kept separate from the batch pool so a batch that fills its
+# workers can never starve the per-company searches it is waiting on.
+_search_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="serper-search")
+
+
 def _search_overview(client: httpx.Client, company_name: str) -> dict:
     """
     General web search for company overview.
@@ -117,7 +127,8 @@ def serper_competitor_lookup(company_name: str) -> str:
     - Gauging competitor market presence via organic search results
 
     Do NOT use for broad market research — use web_search for that.
-    Call this tool separately for EACH competitor you want to profile.
+    Call this tool separately for EACH competitor you want to profile,
+    or use serper_competitor_batch_lookup to profile several at once.
     Aim to profile at least 3 competitors for a complete analysis.
 
     Args:
@@ -125,15 +136,71 @@ def serper_competitor_lookup(company_name: str) -> str:
                       Examples: "HubSpot", "Marketo", "Salesforce Marketing Cloud"
     """
     logger.info(f"serper_competitor_lookup | company={company_name!r}")
+    return _cached_lookup(company_name)
+
+
+@tool
+def serper_competitor_batch_lookup(company_names: list[str]) -> str:
+    """
+    Fetch structured competitor intelligence for SEVERAL companies in one
+    call. Returns the same profile as serper_competitor_lookup (overview,
+    organic positioning signals, recent news) for each company, looked up
+    in parallel.
+
+    Prefer this over repeated serper_competitor_lookup calls when you
+    already know which competitors to profile.
+
+    Args:
+        company_names: Company names as commonly known, up to 10.
+                       Example: ["HubSpot", "Marketo", "Mailchimp"]
+    """
+    # Dedupe on the cache key so "HubSpot" and "hubspot" cost one lookup
+    names: list[str] = []
+    seen: set[str] = set()
+    for name in company_names:
+        key = normalize_text(name)
+        if key and key not in seen:
+            seen.add(key)
+            names.append(name.strip())
+    names = names[:_MAX_BATCH_COMPANIES]
+
+    logger.info(f"serper_competitor_batch_lookup | companies={names!r}")
+
+    if not names:
+        return json.dumps({"competitors": []})
+
+    workers = max(1, min(settings.serper_batch_concurrency, len(names)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="serper-batch") as pool:
+        results = list(pool.map(_cached_lookup, names))
+
+    competitors = [json.loads(r) for r in results]
+    logger.info(
+        f"serper_competitor_batch_lookup | done | "
+        f"companies={len(names)} | "
+        f"errors={sum(1 for c in competitors if c.get('error'))}"
+    )
+    return json.dumps({"competitors": competitors}, ensure_ascii=False)
+
+
+def _cached_lookup(company_name: str) -> str:
+    cache = get_tool_cache("serper_competitor_lookup", settings.serper_cache_ttl_seconds)
+    return cache.get_or_fetch(
+        {"company_name": normalize_text(company_name)},
+        lambda: _lookup(company_name),
+    )
+
 
+def _lookup(company_name: str) -> str:
     try:
         client = _get_client()
 
-        # Two targeted searches per competitor:
+        # Two targeted searches per competitor, fired together:
         # 1. General search  → knowledge graph + organic positioning signals
         # 2. News search     → recent strategic moves and signals
-        overview = _search_overview(client, company_name)
-        news     = _search_news(client, company_name)
+        overview_future = _search_pool.submit(_search_overview, client, company_name)
+        news_future     = _search_pool.submit(_search_news, client, company_name)
+        overview = overview_future.result()
+        news     = news_future.result()
 
         result = {
             "company":     company_name,
@@ -8,6 +8,7 @@ from langchain_core.tools import tool
 from tavily import TavilyClient
 
 from app.core.settings import settings
+from app.tools.cache import get_tool_cache, normalize_text
 
 logger = logging.getLogger("tools.web_search")
 
@@ -78,6 +79,14 @@ def web_search(
     """
     logger.info(f"web_search | query={query!r} | topic={topic} | max_results={max_results}")
 
+    cache = get_tool_cache("web_search", settings.web_search_cache_ttl_seconds)
+    return cache.get_or_fetch(
+        {"query": normalize_text(query), "topic": topic, "max_results": int(max_results)},
+        lambda: _search(query, topic, max_results),
+    )
+
+
+def _search(query: str, topic: str, max_results: int) -> str:
     try:
         client = _get_client()
 
@@ -5,7 +5,7 @@ import logging
 
 from langchain_core.tools import tool
 
-from app.db.repositories.brand_repo import get_by_id
+from app.memory.brand_snapshot import load_brand
 
 logger = logging.getLogger("tools.get_brand_memory")
 
@@ -33,7 +33,7 @@ def get_brand_memory(brand_id: str) -> str:
     logger.info(f"get_brand_memory | brand_id={brand_id}")
 
     try:
-        brand = get_by_id(brand_id)
+        brand = load_brand(brand_id)
 
         if brand is None:
             logger.warning(f"get_brand_memory | not found | brand_id={brand_id}")
@@ -5,12 +5,25 @@ import logging
 
 from langchain_core.tools import tool
 
-from app.db.repositories.campaign_repo import list_by_brand_id
+from app.db.repositories.campaign_repo import list_recent
 
 logger = logging.getLogger("tools.get_past_campaigns")
 
 _MAX_LIMIT = 10  # hard ceiling — prevent context window abuse
 
+# Full campaign docs are 50-200KB — only these fields leave MongoDB
+_FIELDS = [
+    "goal",
+    "target_audience",
+    "budget",
+    "status",
+    "strategy.channels",
+    "strategy.summary",
+    "qa_report.passed",
+    "qa_report.issues",
+    "created_at",
+]
+
 
 @tool
 def get_past_campaigns(brand_id: str, limit: int = 5) -> str:
@@ -36,10 +49,10 @@ def get_past_campaigns(brand_id: str, limit: int = 5) -> str:
     logger.info(f"get_past_campaigns | brand_id={brand_id} | limit={limit}")
 
     # Enforce hard ceiling regardless of what LLM passes
-    limit = min(limit, _MAX_LIMIT)
+    limit = max(1, min(limit, _MAX_LIMIT))
 
     try:
-        campaigns = list_by_brand_id(brand_id)[:limit]
+        campaigns = list_recent(brand_id, limit, _FIELDS)
 
         if not campaigns:
             logger.info(f"get_past_campaigns | no history | brand_id={brand_id}")
@@ -54,8 +67,7 @@ def get_past_campaigns(brand_id: str, limit: int = 5) -> str:
                 ),
             })
 
-        # Return only strategically relevant fields
-        # Full campaign docs are 50-200KB — way too large for context window
+        # Older documents may still lack strategy / qa_report
         summaries = [
             {
                 "campaign_id":      c.get("id"),
@@ -63,10 +75,10 @@ def get_past_campaigns(brand_id: str, limit: int = 5) -> str:
                 "target_audience":  c.get("target_audience"),
                 "budget":           c.get("budget"),
                 "status":           c.get("status"),
-                "channels_used":    c.get("strategy", {}).get("channels", []),
-                "strategy_summary": c.get("strategy", {}).get("summary"),
-                "qa_passed":        c.get("qa_report", {}).get("passed"),
-                "qa_issues":        c.get("qa_report", {}).get("issues", []),
+                "channels_used":    (c.get("strategy") or {}).get("channels", []),
+                "strategy_summary": (c.get("strategy") or {}).get("summary"),
+                "qa_passed":        (c.get("qa_report") or {}).get("passed"),
+                "qa_issues":        (c.get("qa_report") or {}).get("issues", []),
                 "created_at":       c.get("created_at"),
             }
             for c in campaigns
@@ -1 +1,126 @@
 # app/validators/compliance_validator.py
+"""
+Literal content-restriction matching.
+
+Brand restrictions are written as instructions ("No before/after imagery",
+"Avoid 'guaranteed results'"). The leading negation is stripped and the
+remaining phrase becomes one branch of a single compiled, case-insensitive
+regex, so every asset is scanned once no matter how many restrictions the
+brand has. Only literal hits are reported — paraphrases are left to the LLM
+reviewer.
+
+Only exact-phrase restrictions hard-fail QA: a quoted phrase, or one
+introduced by "the word / term / phrase". An unquoted restriction ("Avoid
+medical claims", "No alcohol") only names the kind of content to keep out,
+and copy such as "no medical claims here" contains it without breaking it
+— so those hits, and any hit right after a negation, are soft findings for
+the LLM reviewer to judge. A hit followed by "-free" / "free" ("alcohol-free")
+states the opposite and is not reported at all.
+"""
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple
+
+_NEGATION = re.compile(
+    r"^\s*(?:no|never|avoid|without|don'?t|do\s+not|must\s+not|should\s+not)\b"
+    r"(?:\s+(?:use|using|mention|mentioning|say|saying|include|including|make|making|show|showing))?"
+    r"(?P<designator>\s+(?:the\s+)?(?:words?|terms?|phrases?|claims?\s+like))?\s*",
+    re.IGNORECASE,
+)
+_QUOTED = re.compile(r"[\"“”](?P<double>[^\"“”]+)[\"“”]|(?<!\w)['‘’](?P<single>[^'‘’]+)['‘’](?!\w)")
+# A negation shortly before a hit, in the same clause: "no medical claims".
+_NEGATED_CONTEXT = re.compile(
+    r"\b(?:no|not|never|without|avoid|zero|free\s+of|don'?t|doesn'?t|won'?t|isn'?t)\b"
+    r"(?:\W+\w+){0,2}\W*$",
+    re.IGNORECASE,
+)
+# "alcohol-free", "sugar free" — the copy advertises the absence.
+_FREE_SUFFIX = re.compile(r"\s*-?\s*free\b", re.IGNORECASE)
+_CLAUSE_END = re.compile(r"[.!?;\n]")
+_NEGATION_WINDOW_CHARS = 40
+_MIN_PHRASE_CHARS = 3
+
+
+def parse_restriction(restriction: str) -> Tuple[str, bool]:
+    """
+    (phrase, exact) for a restriction: the literal phrase it forbids, and
+    whether that phrase is exact (quoted, or designated as a word / term /
+    phrase) rather than a category of content.
+    """
+    quoted = _QUOTED.search(restriction)
+    if quoted:
+        return (quoted.group("double") or quoted.group("single")).strip(), True
+    negation = _NEGATION.match(restriction)
+    phrase = restriction[negation.end():] if negation else restriction
+    phrase = phrase.strip().rstrip(".!;:").strip().strip("\"'“”‘’").strip()
+    return phrase, bool(negation and negation.group("designator"))
+
+
+def _negated(text: str, start: int) -> bool:
+    """Whether the hit starting at `start` follows a negation in the same clause."""
+    before = text[max(0, start - _NEGATION_WINDOW_CHARS):start]
+    clause = _CLAUSE_END.split(before)[-1]
+    return bool(_NEGATED_CONTEXT.search(clause))
+
+
+class RestrictionMatcher:
+    def __init__(self, restrictions: Iterable[str]) -> None:
+        self._restrictions: List[str] = []
+        self._exact: List[bool] = []
+        branches = []
+        for restriction in restrictions:
+            phrase, exact = parse_restriction(restriction)
+            if len(phrase) < _MIN_PHRASE_CHARS:
+                continue
+            # Named group per restriction maps a hit back to the rule; words
+            # are whitespace-tolerant and anchored on word boundaries.
+            body = r"\s+".join(re.escape(w) for w in phrase.split())
+            branches.append(rf"(?P<r{len(self._restrictions)}>(?<!\w){body}(?!\w))")
+            self._restrictions.append(restriction)
+            self._exact.append(exact)
+        self._pattern = re.compile("|".join(branches), re.IGNORECASE) if branches else None
+
+    def find(self, text: str) -> Dict[str, Tuple[str, bool]]:
+        """
+        Restriction → (matched text, hard) for every restriction hit in
+        `text`. A hit is hard when the restriction is exact and the hit is
+        not negated; one hard hit outranks soft hits of the same restriction.
+        """
+        if self._pattern is None or not text:
+            return {}
+        hits: Dict[str, Tuple[str, bool]] = {}
+        for match in self._pattern.finditer(text):
+            if _FREE_SUFFIX.match(text, match.end()):
+                continue
+            row = int(match.lastgroup[1:])
+            restriction = self._restrictions[row]
+            hard = self._exact[row] and not _negated(text, match.start())
+            if restriction not in hits or (hard and not hits[restriction][1]):
+                hits[restriction] = (match.group(0), hard)
+        return hits
+
+
+@lru_cache(maxsize=256)
+def get_matcher(restrictions: tuple) -> RestrictionMatcher:
+    """Compiled matcher per restriction set — built once per brand, not per asset."""
+    return RestrictionMatcher(restrictions)
+
+
+def validate(asset: Dict[str, Any], restrictions: Iterable[str]) -> Tuple[List[str], List[str]]:
+    """(hard violations, soft findings for the LLM reviewer) for one asset."""
+    matcher = get_matcher(tuple(r for r in restrictions if isinstance(r, str)))
+    text = "\n".join(
+        str(asset.get(field) or "") for field in ("headline", "body", "call_to_action")
+    )
+    channel = asset.get("channel") or "?"
+    hard: List[str] = []
+    soft: List[str] = []
+    for restriction, (matched, is_hard) in matcher.find(text).items():
+        if is_hard:
+            hard.append(f"{channel} — content restriction violated: \"{restriction}\" (found \"{matched}\")")
+        else:
+            soft.append(
+                f"{channel} — possible content restriction issue: \"{restriction}\" "
+                f"(found \"{matched}\" — check whether the copy actually breaks it)"
+            )
+    return hard, soft
@@ -0,0 +1,64 @@
+# app/validators/rule_engine.py
+"""
+Deterministic pre-QA stage.
+
+Runs before the LLM reviewer and decides the CRITICAL checks that need no
+judgement:
+  - missing / empty call_to_action            (template_validator)
+  - literal hits on exact-phrase restrictions  (compliance_validator)
+  - asset channel not in strategy["channels"] (template_validator) — only
+    with `strict_channels`, i.e. content_mode=per_channel, where each
+    asset's channel is pinned to the strategy's name. When the model names
+    the channels itself ("Instagram Reels" for "Instagram") it is a note.
+
+Any hard violation fails QA outright — no LLM call. Soft findings
+(category-restriction or negated hits, channel mismatches,
+duplication_validator) are handed to the reviewer as context.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from app.validators import compliance_validator, duplication_validator, template_validator
+
+
+@dataclass
+class RuleFindings:
+    hard: List[str] = field(default_factory=list)
+    # Soft findings per asset index — fed into that asset's review prompt.
+    soft: Dict[int, List[str]] = field(default_factory=dict)
+
+    @property
+    def blocking(self) -> bool:
+        return bool(self.hard)
+
+    def notes(self) -> List[str]:
+        return [note for idx in sorted(self.soft) for note in self.soft[idx]]
+
+
+def run_rules(
+    assets: List[Dict[str, Any]],
+    restrictions: List[str],
+    channels: List[str],
+    *,
+    strict_channels: bool = False,
+) -> RuleFindings:
+    findings = RuleFindings()
+    for idx, asset in enumerate(assets):
+        findings.hard.extend(template_validator.validate(asset))
+        restriction_hard, restriction_soft = compliance_validator.validate(asset, restrictions)
+        findings.hard.extend(restriction_hard)
+        channel_issues = template_validator.channel_issues(asset, channels)
+        if strict_channels:
+            findings.hard.extend(channel_issues)
+            channel_issues = []
+
+        text = " ".join(
+            str(asset.get(f) or "") for f in ("headline", "body", "call_to_action")
+        )
+        soft = restriction_soft + channel_issues + [
+            f"{asset.get('channel') or '?'} — {issue}"
+            for issue in duplication_validator.validate(text)
+        ]
+        if soft:
+            findings.soft[idx] = soft
+    return findings
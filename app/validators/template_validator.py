@@ -1 +1,23 @@
 # app/validators/template_validator.py
+from typing import Any, Dict, Iterable, List
+
+
+def _fold(value: str) -> str:
+    return " ".join(value.split()).casefold()
+
+
+def validate(asset: Dict[str, Any]) -> List[str]:
+    """Structural checks: the asset has a CTA."""
+    channel = (asset.get("channel") or "").strip()
+    if not (asset.get("call_to_action") or "").strip():
+        return [f"{channel or '?'} — asset has no call to action."]
+    return []
+
+
+def channel_issues(asset: Dict[str, Any], channels: Iterable[str]) -> List[str]:
+    """The asset targets a channel the strategy did not plan."""
+    channel = (asset.get("channel") or "").strip()
+    planned = {_fold(c) for c in channels if c}
+    if planned and _fold(channel) not in planned:
+        return [f"{channel or '?'} — asset channel is not one of the strategy's planned channels."]
+    return []
@@ -1 +1,32 @@
 # app/workers/celery_app.py
+"""
+Celery application for background campaign runs.
+
+Start a worker from the project root (Redis from docker/docker-compose.yml):
+    celery -A app.workers.celery_app worker --loglevel=info
+"""
+from celery import Celery
+
+from app.core.logging import setup_logging
+from app.core.settings import settings
+
+setup_logging()
+
+celery_app = Celery(
+    "marketing_growth",
+    broker=settings.redis_url,
+    backend=settings.redis_url,
+    include=["app.workers.tasks"],
+)
+
+celery_app.conf.update(
+    task_serializer="json",
+    result_serializer="json",
+    accept_content=["json"],
+    # A worker that dies mid-run gets the job re-delivered instead of dropped.
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    # Campaign runs take minutes — never let one worker hoard queued jobs.
+    worker_prefetch_multiplier=1,
+    task_track_started=True,
+)
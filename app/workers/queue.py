@@ -0,0 +1,144 @@
+# app/workers/queue.py
+"""
+Campaign job queue backends, selected by settings.campaign_queue_backend.
+
+  celery     → Celery task on the Redis broker; runs in separate worker
+               processes (see app/workers/celery_app.py).
+  inprocess  → runs inside the API process: an asyncio task on the serving
+               event loop, or a thread pool when called without a running
+               loop. No Redis needed (local dev, tests) — queued jobs do not
+               survive a process restart. The default: docker-compose runs
+               no worker, so celery jobs would sit in `queued` until one is
+               started.
+
+Async callers use aenqueue / aenqueue_batch — the Celery publish is a
+blocking broker round trip and runs in the threadpool, off the event loop.
+
+Every graph run on the API's event loop — in-process jobs and the
+/stream endpoint's runs alike — holds a `job_slot()`, so at most
+CAMPAIGN_QUEUE_CONCURRENCY campaigns run there at once.
+"""
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.settings import settings
+
+logger = logging.getLogger("workers.queue")
+
+
+class CampaignQueue(ABC):
+    def __init__(self, concurrency: int) -> None:
+        self._concurrency = max(1, concurrency)
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def job_slot(self) -> asyncio.Semaphore:
+        """Slot for one graph run on this process's event loop (`async with`)."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+        return self._semaphore
+
+    @abstractmethod
+    def enqueue(self, brand_id: str, campaign_id: str, *, resume: bool = False) -> None:
+        """
+        Schedule the graph run for an already-persisted queued campaign.
+        `resume=True` continues the campaign's checkpointed thread.
+        """
+
+    @abstractmethod
+    def enqueue_batch(self, brand_id: str, campaign_ids: list[str]) -> None:
+        """
+        Schedule one job for a batch of already-persisted queued campaigns
+        of the same brand (shared brand load and research).
+        """
+
+    async def aenqueue(self, brand_id: str, campaign_id: str, *, resume: bool = False) -> None:
+        """Async `enqueue` — call from the serving event loop."""
+        self.enqueue(brand_id, campaign_id, resume=resume)
+
+    async def aenqueue_batch(self, brand_id: str, campaign_ids: list[str]) -> None:
+        """Async `enqueue_batch`."""
+        self.enqueue_batch(brand_id, campaign_ids)
+
+
+class CeleryCampaignQueue(CampaignQueue):
+    def enqueue(self, brand_id: str, campaign_id: str, *, resume: bool = False) -> None:
+        from app.workers.tasks import run_campaign
+
+        run_campaign.delay(brand_id, campaign_id, resume=resume)
+        logger.info(f"QUEUE | celery | enqueued | campaign_id={campaign_id} | resume={resume}")
+
+    def enqueue_batch(self, brand_id: str, campaign_ids: list[str]) -> None:
+        from app.workers.tasks import run_campaign_batch
+
+        run_campaign_batch.delay(brand_id, campaign_ids)
+        logger.info(f"QUEUE | celery | enqueued_batch | brand_id={brand_id} | campaigns={len(campaign_ids)}")
+
+    async def aenqueue(self, brand_id: str, campaign_id: str, *, resume: bool = False) -> None:
+        await run_in_threadpool(self.enqueue, brand_id, campaign_id, resume=resume)
+
+    async def aenqueue_batch(self, brand_id: str, campaign_ids: list[str]) -> None:
+        await run_in_threadpool(self.enqueue_batch, brand_id, campaign_ids)
+
+
+class InProcessCampaignQueue(CampaignQueue):
+    def __init__(self, concurrency: int) -> None:
+        super().__init__(concurrency)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self._concurrency, thread_name_prefix="campaign-job"
+        )
+        # Strong refs — the event loop only keeps weak refs to tasks.
+        self._tasks: set[asyncio.Task] = set()
+
+    def enqueue(self, brand_id: str, campaign_id: str, *, resume: bool = False) -> None:
+        from app.workers.tasks import run_campaign_job
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._pool.submit(run_campaign_job, brand_id, campaign_id, resume)
+            logger.info(f"QUEUE | inprocess | thread | campaign_id={campaign_id} | resume={resume}")
+            return
+
+        task = loop.create_task(self._run(brand_id, campaign_id, resume))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        logger.info(f"QUEUE | inprocess | task | campaign_id={campaign_id} | resume={resume}")
+
+    def enqueue_batch(self, brand_id: str, campaign_ids: list[str]) -> None:
+        from app.workers.tasks import arun_campaign_batch, run_campaign_batch_job
+
+        # A batch bounds its own graph concurrency (CAMPAIGN_BATCH_CONCURRENCY)
+        # and does not take a job slot.
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._pool.submit(run_campaign_batch_job, brand_id, campaign_ids)
+            logger.info(f"QUEUE | inprocess | thread | batch | campaigns={len(campaign_ids)}")
+            return
+
+        task = loop.create_task(arun_campaign_batch(brand_id, campaign_ids))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        logger.info(f"QUEUE | inprocess | task | batch | campaigns={len(campaign_ids)}")
+
+    async def _run(self, brand_id: str, campaign_id: str, resume: bool) -> None:
+        from app.workers.tasks import arun_campaign_job
+
+        async with self.job_slot():
+            await arun_campaign_job(brand_id, campaign_id, resume=resume)
+
+
+@lru_cache(maxsize=None)
+def get_campaign_queue() -> CampaignQueue:
+    backend = settings.campaign_queue_backend.strip().lower()
+    if backend == "celery":
+        # Workers run the queued jobs; the slots only bound /stream runs here.
+        return CeleryCampaignQueue(settings.campaign_queue_concurrency)
+    if backend == "inprocess":
+        return InProcessCampaignQueue(settings.campaign_queue_concurrency)
+    raise ValueError(f"Unsupported campaign queue backend: {backend!r}")
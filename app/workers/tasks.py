@@ -1 +1,433 @@
 # app/workers/tasks.py
+"""
+Campaign job runner.
+
+A queued campaign document (status="queued") is picked up here, the campaign
+graph is streamed node by node, and each finished node's output is written to
+the `campaigns` collection as soon as it lands. A crash mid-run keeps every
+node that already completed, and the status endpoint can report progress
+while the run is still in flight.
+
+Runs are checkpointed per campaign_id (app/graph/checkpointer.py). With
+`resume=True` a run that errored continues from its last completed node
+instead of starting over; without a usable checkpoint it starts fresh.
+
+Three entry points share the same bookkeeping:
+  run_campaign_job()     sync  — Celery workers
+  arun_campaign_job()    async — in-process backend on the API event loop
+  astream_campaign_job() async — same run, yielding per-node progress events
+                                 for the SSE endpoint
+
+Batches (POST .../campaigns/batch) run through run_campaign_batch_job() /
+arun_campaign_batch(): the brand is loaded once, research runs once per
+(goal, audience) cluster and is handed to every variant in it, graphs run
+with CAMPAIGN_BATCH_CONCURRENCY at a time, and all results are written back
+in one bulk write.
+"""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator
+
+from app.core.settings import settings
+from app.db.repositories.campaign_repo import (
+    aget_by_id as campaign_repo_aget_by_id,
+    alist_by_ids as campaign_repo_alist_by_ids,
+    aupdate as campaign_repo_aupdate,
+    aupdate_many as campaign_repo_aupdate_many,
+    get_by_id as campaign_repo_get_by_id,
+    list_by_ids as campaign_repo_list_by_ids,
+    update as campaign_repo_update,
+    update_many as campaign_repo_update_many,
+)
+from app.memory.research_memory import aresearch_with_reuse, research_with_reuse
+from app.graph.checkpointer import thread_config
+from app.graph.nodes.content_node import failed_channels
+from app.graph.registry import get_campaign_graph
+from app.services.brand_service import BrandService
+from app.services.campaign_service import campaign_status, initial_state
+from app.workers.celery_app import celery_app
+
+logger = logging.getLogger("workers.tasks")
+
+# Graph state keys persisted on the campaign document as nodes finish.
+_RESULT_FIELDS = ("research", "research_reused", "strategy", "content", "qa_report", "analytics")
+# Reducer (operator.add) state keys — every Send branch appends its own item.
+_APPENDED_FIELDS = ("channel_assets", "failed_channels")
+
+
+def _merge_output(result: dict[str, Any], output: dict | None) -> None:
+    """Fold a node's output into the accumulated state the way the graph reducers do."""
+    for key, value in (output or {}).items():
+        if key in _APPENDED_FIELDS:
+            result[key] = [*(result.get(key) or []), *(value or [])]
+        else:
+            result[key] = value
+
+
+def _mark_done(completed: list[str], node: str) -> None:
+    # Fan-out nodes (content_channel) finish once per Send branch.
+    if node not in completed:
+        completed.append(node)
+
+
+def _progress_fields(
+    node: str, output: dict | None, completed: list[str], result: dict[str, Any]
+) -> dict[str, Any]:
+    fields: dict[str, Any] = {"completed_nodes": list(completed)}
+    for key in _RESULT_FIELDS:
+        if output and key in output:
+            fields[key] = output[key]
+    if output and ("failed_channels" in output or "content" in output):
+        fields["failed_channels"] = failed_channels(result)
+    logger.info(f"CAMPAIGN_JOB | node_done | node={node} | completed={len(completed)}")
+    return fields
+
+
+def _changed_fields(result: dict[str, Any], output: dict | None) -> dict[str, Any]:
+    """Keys of a node's output that differ from the state accumulated so far."""
+    return {k: v for k, v in (output or {}).items() if result.get(k) != v}
+
+
+def _resume_values(snapshot) -> dict[str, Any] | None:
+    """Checkpointed state to resume from, or None when there is nothing left to run."""
+    if snapshot is None or not snapshot.next:
+        return None
+    return dict(snapshot.values)
+
+
+def _start_fields(resume_from: dict | None) -> dict[str, Any]:
+    fields: dict[str, Any] = {"status": "running"}
+    if resume_from is not None:
+        fields["error"] = None
+    return fields
+
+
+def _resumed_completed(campaign: dict, resume_from: dict | None) -> list[str]:
+    return list(campaign.get("completed_nodes") or []) if resume_from is not None else []
+
+
+def _error_fields(campaign_id: str, exc: Exception) -> dict[str, Any]:
+    logger.exception(f"CAMPAIGN_JOB | error | campaign_id={campaign_id} | error={exc}")
+    return {"status": "error", "error": str(exc)}
+
+
+def run_campaign_job(brand_id: str, campaign_id: str, resume: bool = False) -> str:
+    """Run (or resume) the graph for a queued campaign. Returns the final status."""
+    campaign = campaign_repo_get_by_id(brand_id=brand_id, campaign_id=campaign_id)
+    if campaign is None:
+        logger.warning(f"CAMPAIGN_JOB | missing | campaign_id={campaign_id}")
+        return "missing"
+
+    graph = get_campaign_graph()
+    config = thread_config(campaign_id)
+    resume_from = None
+    if resume and graph.checkpointer is not None:
+        resume_from = _resume_values(graph.get_state(config))
+
+    campaign_repo_update(campaign_id, _start_fields(resume_from))
+    completed = _resumed_completed(campaign, resume_from)
+    result: dict[str, Any] = dict(resume_from or {})
+    try:
+        if resume_from is not None:
+            logger.info(f"CAMPAIGN_JOB | resume | campaign_id={campaign_id} | completed={completed}")
+            state = None  # None input = continue the checkpointed thread
+        else:
+            brand_context = BrandService().get_by_id(brand_id).model_dump()
+            state = initial_state(
+                campaign_id,
+                brand_context,
+                goal=campaign["goal"],
+                target_audience=campaign["target_audience"],
+                budget=campaign["budget"],
+            )
+        for update in graph.stream(state, config, stream_mode="updates"):
+            for node, output in update.items():
+                _mark_done(completed, node)
+                _merge_output(result, output)
+                campaign_repo_update(campaign_id, _progress_fields(node, output, completed, result))
+    except Exception as exc:
+        campaign_repo_update(campaign_id, _error_fields(campaign_id, exc))
+        return "error"
+
+    # A finished run has nothing left to resume — drop its checkpoints.
+    if graph.checkpointer is not None:
+        graph.checkpointer.delete_thread(campaign_id)
+    status = campaign_status(result)
+    campaign_repo_update(campaign_id, {"status": status, "failed_channels": failed_channels(result)})
+    logger.info(f"CAMPAIGN_JOB | done | campaign_id={campaign_id} | status={status}")
+    return status
+
+
+async def arun_campaign_job(brand_id: str, campaign_id: str, resume: bool = False) -> str:
+    """Async `run_campaign_job` — streams the graph with astream."""
+    status = "missing"
+    async for event in astream_campaign_job(brand_id, campaign_id, resume=resume):
+        if event["event"] in ("done", "error"):
+            status = event["data"]["status"]
+    return status
+
+
+async def astream_campaign_job(
+    brand_id: str, campaign_id: str, resume: bool = False
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Run the graph for a queued campaign, yielding progress events:
+
+      campaign    {id, status="running"}
+      node_start  {node}
+      <custom>    emitted by nodes via get_stream_writer, e.g.
+                  content_asset {node, asset} per streamed ContentAsset
+      node_end    {node, update, completed_nodes}  — update = state keys the
+                                                     node changed
+      done        {id, status}                     — final status
+      error       {id, status, error}
+
+    Persistence matches run_campaign_job, so a client that stops reading
+    can still follow the run through the status endpoint.
+    """
+    campaign = await campaign_repo_aget_by_id(brand_id=brand_id, campaign_id=campaign_id)
+    if campaign is None:
+        logger.warning(f"CAMPAIGN_JOB | missing | campaign_id={campaign_id}")
+        yield {
+            "event": "error",
+            "data": {"id": campaign_id, "status": "missing", "error": "Campaign not found"},
+        }
+        return
+
+    graph = get_campaign_graph()
+    config = thread_config(campaign_id)
+    resume_from = None
+    if resume and graph.checkpointer is not None:
+        resume_from = _resume_values(await graph.aget_state(config))
+
+    await campaign_repo_aupdate(campaign_id, _start_fields(resume_from))
+    yield {"event": "campaign", "data": {"id": campaign_id, "status": "running"}}
+
+    completed = _resumed_completed(campaign, resume_from)
+    result: dict[str, Any] = dict(resume_from or {})
+    try:
+        if resume_from is not None:
+            logger.info(f"CAMPAIGN_JOB | resume | campaign_id={campaign_id} | completed={completed}")
+            state = None  # None input = continue the checkpointed thread
+        else:
+            brand = await BrandService().aget_by_id(brand_id)
+            state = initial_state(
+                campaign_id,
+                brand.model_dump(),
+                goal=campaign["goal"],
+                target_audience=campaign["target_audience"],
+                budget=campaign["budget"],
+            )
+            result.update(state)
+        # "tasks" mode emits each node twice: once when it is scheduled
+        # (payload has "input") and once when it finishes ("result").
+        # "custom" carries events nodes write themselves, forwarded as-is.
+        async for mode, task in graph.astream(state, config, stream_mode=["tasks", "custom"]):
+            if mode == "custom":
+                yield task
+                continue
+            node = task["name"]
+            if "input" in task:
+                yield {"event": "node_start", "data": {"node": node}}
+                continue
+            if task.get("error") is not None:
+                continue  # astream raises it next — handled below
+
+            output = task.get("result")
+            update = _changed_fields(result, output)
+            _mark_done(completed, node)
+            _merge_output(result, output)
+            await campaign_repo_aupdate(
+                campaign_id, _progress_fields(node, output, completed, result)
+            )
+            yield {
+                "event": "node_end",
+                "data": {"node": node, "update": update, "completed_nodes": list(completed)},
+            }
+    except Exception as exc:
+        await campaign_repo_aupdate(campaign_id, _error_fields(campaign_id, exc))
+        yield {
+            "event": "error",
+            "data": {"id": campaign_id, "status": "error", "error": str(exc)},
+        }
+        return
+
+    if graph.checkpointer is not None:
+        await graph.checkpointer.adelete_thread(campaign_id)
+    status = campaign_status(result)
+    failed = failed_channels(result)
+    await campaign_repo_aupdate(campaign_id, {"status": status, "failed_channels": failed})
+    logger.info(f"CAMPAIGN_JOB | done | campaign_id={campaign_id} | status={status}")
+    yield {"event": "done", "data": {"id": campaign_id, "status": status, "failed_channels": failed}}
+
+
+def _fold(value: str | None) -> str:
+    return " ".join((value or "").split()).casefold()
+
+
+def _cluster_key(campaign: dict) -> tuple[str, str]:
+    """Variants with the same goal and audience share one research run."""
+    return _fold(campaign.get("goal")), _fold(campaign.get("target_audience"))
+
+
+def _clusters(campaigns: list[dict]) -> dict[tuple[str, str], dict]:
+    """First campaign of each cluster — its goal / audience / budget seed the research."""
+    clusters: dict[tuple[str, str], dict] = {}
+    for campaign in campaigns:
+        clusters.setdefault(_cluster_key(campaign), campaign)
+    return clusters
+
+
+def _batch_state(
+    campaign: dict, brand_context: dict, shared: tuple[dict | None, bool]
+) -> dict:
+    state = initial_state(
+        campaign["id"],
+        brand_context,
+        goal=campaign["goal"],
+        target_audience=campaign["target_audience"],
+        budget=campaign["budget"],
+    )
+    state["research"], state["research_reused"] = shared
+    return state
+
+
+def _finished_fields(campaign_id: str, result: dict, completed: list[str]) -> dict[str, Any]:
+    fields: dict[str, Any] = {k: result.get(k) for k in _RESULT_FIELDS}
+    fields["completed_nodes"] = list(completed)
+    fields["failed_channels"] = failed_channels(result)
+    fields["status"] = campaign_status(result)
+    logger.info(f"CAMPAIGN_BATCH | done | campaign_id={campaign_id} | status={fields['status']}")
+    return fields
+
+
+def _log_research_error(key: tuple[str, str], exc: Exception) -> None:
+    # Not fatal: the variants' own research nodes run instead.
+    logger.warning(f"CAMPAIGN_BATCH | research_failed | cluster={key} | error={exc}")
+
+
+def run_campaign_batch_job(brand_id: str, campaign_ids: list[str]) -> dict[str, str]:
+    """Run a batch of queued campaigns for one brand. Returns status per campaign id."""
+    campaigns = campaign_repo_list_by_ids(campaign_ids)
+    if not campaigns:
+        return {}
+    brand_context = BrandService().get_by_id(brand_id).model_dump()
+    graph = get_campaign_graph()
+    clusters = _clusters(campaigns)
+    logger.info(
+        f"CAMPAIGN_BATCH | start | brand_id={brand_id} | campaigns={len(campaigns)} "
+        f"| research_clusters={len(clusters)}"
+    )
+    campaign_repo_update_many({c["id"]: {"status": "running"} for c in campaigns})
+
+    def research(key: tuple[str, str], seed: dict) -> tuple[dict | None, bool]:
+        try:
+            return research_with_reuse(
+                brand_context,
+                goal=seed["goal"],
+                target_audience=seed["target_audience"],
+                budget=seed["budget"],
+            )
+        except Exception as exc:
+            _log_research_error(key, exc)
+            return None, False
+
+    def run_one(campaign: dict, shared: tuple[dict | None, bool]) -> tuple[str, dict[str, Any]]:
+        campaign_id = campaign["id"]
+        completed: list[str] = []
+        result: dict[str, Any] = {}
+        try:
+            state = _batch_state(campaign, brand_context, shared)
+            for update in graph.stream(state, thread_config(campaign_id), stream_mode="updates"):
+                for node, output in update.items():
+                    _mark_done(completed, node)
+                    _merge_output(result, output)
+        except Exception as exc:
+            return campaign_id, {**_error_fields(campaign_id, exc), "completed_nodes": completed}
+        if graph.checkpointer is not None:
+            graph.checkpointer.delete_thread(campaign_id)
+        return campaign_id, _finished_fields(campaign_id, {**state, **result}, completed)
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, settings.campaign_batch_concurrency),
+        thread_name_prefix="campaign-batch",
+    ) as pool:
+        keys = list(clusters)
+        shared = dict(zip(keys, pool.map(research, keys, clusters.values())))
+        results = dict(pool.map(
+            lambda c: run_one(c, shared[_cluster_key(c)]),
+            campaigns,
+        ))
+
+    campaign_repo_update_many(results)
+    return {campaign_id: fields["status"] for campaign_id, fields in results.items()}
+
+
+async def arun_campaign_batch(brand_id: str, campaign_ids: list[str]) -> dict[str, str]:
+    """Async `run_campaign_batch_job` — graphs run as tasks behind a semaphore."""
+    campaigns = await campaign_repo_alist_by_ids(campaign_ids)
+    if not campaigns:
+        return {}
+    brand = await BrandService().aget_by_id(brand_id)
+    brand_context = brand.model_dump()
+    graph = get_campaign_graph()
+    clusters = _clusters(campaigns)
+    logger.info(
+        f"CAMPAIGN_BATCH | start | brand_id={brand_id} | campaigns={len(campaigns)} "
+        f"| research_clusters={len(clusters)}"
+    )
+    await campaign_repo_aupdate_many({c["id"]: {"status": "running"} for c in campaigns})
+    semaphore = asyncio.Semaphore(max(1, settings.campaign_batch_concurrency))
+
+    async def research(key: tuple[str, str], seed: dict) -> tuple[dict | None, bool]:
+        async with semaphore:
+            try:
+                return await aresearch_with_reuse(
+                    brand_context,
+                    goal=seed["goal"],
+                    target_audience=seed["target_audience"],
+                    budget=seed["budget"],
+                )
+            except Exception as exc:
+                _log_research_error(key, exc)
+                return None, False
+
+    async def run_one(campaign: dict, shared: tuple[dict | None, bool]) -> tuple[str, dict[str, Any]]:
+        campaign_id = campaign["id"]
+        completed: list[str] = []
+        result: dict[str, Any] = {}
+        async with semaphore:
+            try:
+                state = _batch_state(campaign, brand_context, shared)
+                async for update in graph.astream(
+                    state, thread_config(campaign_id), stream_mode="updates"
+                ):
+                    for node, output in update.items():
+                        _mark_done(completed, node)
+                        _merge_output(result, output)
+            except Exception as exc:
+                return campaign_id, {**_error_fields(campaign_id, exc), "completed_nodes": completed}
+        if graph.checkpointer is not None:
+            await graph.checkpointer.adelete_thread(campaign_id)
+        return campaign_id, _finished_fields(campaign_id, {**state, **result}, completed)
+
+    keys = list(clusters)
+    researched = await asyncio.gather(*(research(k, clusters[k]) for k in keys))
+    shared = dict(zip(keys, researched))
+    results = dict(await asyncio.gather(
+        *(run_one(c, shared[_cluster_key(c)]) for c in campaigns)
+    ))
+
+    await campaign_repo_aupdate_many(results)
+    return {campaign_id: fields["status"] for campaign_id, fields in results.items()}
+
+
+@celery_app.task(name="campaigns.run")
+def run_campaign(brand_id: str, campaign_id: str, resume: bool = False) -> str:
+    return run_campaign_job(brand_id, campaign_id, resume=resume)
+
+
+@celery_app.task(name="campaigns.run_batch")
+def run_campaign_batch(brand_id: str, campaign_ids: list[str]) -> dict[str, str]:
+    return run_campaign_batch_job(brand_id, campaign_ids)
@@ -0,0 +1,52 @@
+# benchmarks/bench_graph_compile.py
+"""
+Micro-benchmark: per-request campaign graph setup cost.
+
+  before → build_campaign_graph() on every request (StateGraph + 6 nodes + compile)
+  after  → get_campaign_graph() from the process-wide registry
+
+No LLM, database or network access — only graph construction is timed.
+
+Run from the project root:
+    python -m benchmarks.bench_graph_compile
+"""
+import statistics
+import time
+
+from app.graph.builder import build_campaign_graph
+from app.graph.registry import get_campaign_graph, invalidate_campaign_graph
+
+_ROUNDS = 200
+
+
+def _time_per_call(fn, rounds: int) -> list[float]:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _report(label: str, samples: list[float]) -> float:
+    mean_us = statistics.mean(samples) * 1e6
+    p95_us = sorted(samples)[int(len(samples) * 0.95) - 1] * 1e6
+    print(f"{label:<34} mean={mean_us:>10.1f} µs   p95={p95_us:>10.1f} µs")
+    return mean_us
+
+
+def main() -> None:
+    build_campaign_graph()  # warm imports
+
+    before = _report("before: build_campaign_graph()", _time_per_call(build_campaign_graph, _ROUNDS))
+
+    invalidate_campaign_graph()
+    cold = _report("after:  first get_campaign_graph()", _time_per_call(get_campaign_graph, 1))
+    after = _report("after:  get_campaign_graph()", _time_per_call(get_campaign_graph, _ROUNDS))
+
+    print(f"\nper-request saving: {before - after:,.1f} µs ({before / max(after, 1e-9):,.0f}x); "
+          f"one-off compile on first request: {cold:,.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
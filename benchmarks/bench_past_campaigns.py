@@ -0,0 +1,94 @@
+# benchmarks/bench_past_campaigns.py
+"""
+Benchmark: get_past_campaigns cost as a brand's history grows.
+
+  before → list_by_brand_id(brand_id)[:limit] (every full campaign document
+           is loaded and decoded, then sliced in Python)
+  after  → list_recent(brand_id, limit, fields) (sort, limit and projection
+           run in MongoDB; only `limit` small documents come back)
+
+Seeds a throwaway database "<MONGODB_DB_NAME>_bench" on MONGODB_URI with
+campaigns carrying ~50KB of research / strategy / content blobs, times both
+queries and records peak Python allocations (tracemalloc) at each history
+size, then drops the database. Needs a running MongoDB (docker-compose).
+
+Run from the project root:
+    python -m benchmarks.bench_past_campaigns [max_campaigns]
+"""
+import statistics
+import sys
+import time
+import tracemalloc
+import uuid
+
+from app.core.settings import settings
+
+settings.mongodb_db_name = f"{settings.mongodb_db_name}_bench"
+
+from app.db.indexes import ensure_indexes  # noqa: E402
+from app.db.mongodb import get_client, get_database  # noqa: E402
+from app.db.repositories.campaign_repo import list_by_brand_id, list_recent  # noqa: E402
+from app.tools.strategy.get_past_campaigns import _FIELDS  # noqa: E402
+
+_LIMIT = 5
+_ROUNDS = 5
+_BLOB = "lorem ipsum dolor sit amet " * 600  # ~16KB per result field
+
+
+def _campaign(brand_id: str, i: int) -> dict:
+    return {
+        "_id": str(uuid.uuid4()),
+        "brand_id": brand_id,
+        "status": "published",
+        "goal": f"Goal {i}",
+        "target_audience": "Gen Z",
+        "budget": 10000.0,
+        "research": {"insights": _BLOB},
+        "strategy": {"channels": ["TikTok", "Email"], "summary": f"Strategy {i}", "detail": _BLOB},
+        "content": {"assets": [{"body": _BLOB}]},
+        "qa_report": {"passed": True, "issues": []},
+        "analytics": {"total_impressions": 1000},
+        "created_at": f"2026-01-01T00:00:00.{i:06d}Z",
+        "updated_at": "",
+    }
+
+
+def _measure(fn) -> tuple[float, float]:
+    """(median ms, peak traced MB) over _ROUNDS calls."""
+    samples = []
+    peak = 0
+    for _ in range(_ROUNDS):
+        tracemalloc.start()
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return statistics.median(samples) * 1e3, peak / 1e6
+
+
+def main() -> None:
+    max_campaigns = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    sizes = [n for n in (10, 100, 1000, 5000, 20000) if n <= max_campaigns] or [max_campaigns]
+    db = get_database()
+    ensure_indexes(db)
+    brand_id = "bench-brand"
+    coll = db["campaigns"]
+    try:
+        seeded = 0
+        print(f"{'campaigns':>10} | {'before ms':>10} {'before MB':>10} | {'after ms':>9} {'after MB':>9}")
+        for size in sizes:
+            coll.insert_many([_campaign(brand_id, i) for i in range(seeded, size)])
+            seeded = size
+            before_ms, before_mb = _measure(lambda: list_by_brand_id(brand_id)[:_LIMIT])
+            after_ms, after_mb = _measure(lambda: list_recent(brand_id, _LIMIT, _FIELDS))
+            print(
+                f"{size:>10} | {before_ms:>10.1f} {before_mb:>10.1f} | "
+                f"{after_ms:>9.2f} {after_mb:>9.3f}"
+            )
+    finally:
+        get_client().drop_database(settings.mongodb_db_name)
+
+
+if __name__ == "__main__":
+    main()
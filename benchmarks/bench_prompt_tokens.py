@@ -0,0 +1,159 @@
+# benchmarks/bench_prompt_tokens.py
+"""
+Benchmark: user-prompt tokens per agent, before and after prompt compaction.
+
+  before → PROMPT_COMPACT=false (pretty-printed, unfiltered payloads)
+  after  → PROMPT_COMPACT=true  (compact JSON, empty fields dropped,
+           per-agent brand whitelists, long research summarized)
+
+Builds every agent's user prompt from one realistic campaign fixture and
+counts tokens with tiktoken (o200k_base; falls back to len/4 when tiktoken
+or its encoding file is unavailable). No LLM or database access.
+
+Run from the project root:
+    python -m benchmarks.bench_prompt_tokens
+"""
+from app.agents import analytics_agent, content_agent, qa_agent, research_agent, strategy_agent
+from app.core.settings import settings
+
+BRAND = {
+    "id": "5b1f0c9e-8a57-4a43-9d7e-2f3c1c7d9a10",
+    "name": "Lumen Fitness",
+    "description": "Connected home-fitness app with live and on-demand strength classes.",
+    "industry": "Health & Fitness Apps",
+    "tone": "energetic, encouraging, no-nonsense",
+    "usp": "Adaptive strength programs that adjust to your recovery data every day.",
+    "target_audience": "Busy professionals aged 25-40 who want efficient home workouts.",
+    "memory": {
+        "past_campaigns": [f"c0a8{i:04d}-0000-4000-8000-00000000{i:04d}" for i in range(12)],
+        "latest_insights": [
+            "Short-form video drove 3x the sign-ups of static ads last quarter.",
+            "Email re-engagement works best on Sunday evenings.",
+        ],
+        "brand_guidelines": {
+            "visual_style": "",
+            "preferred_channels": ["TikTok", "Instagram Reels", "Email"],
+            "content_restrictions": [
+                "No before/after body imagery",
+                "Never promise guaranteed weight loss",
+            ],
+        },
+    },
+    "created_at": "2026-01-12T09:30:00Z",
+    "updated_at": "2026-09-02T17:45:12Z",
+}
+
+RESEARCH = {
+    "target_audience": (
+        "Urban professionals aged 25-40 with demanding schedules who value efficiency. "
+        "They track sleep and recovery on wearables, distrust fad programs, and will pay "
+        "for coaching that visibly adapts to them. Motivated by measurable progress and "
+        "short sessions that fit before work or during lunch breaks."
+    ),
+    "market_size": "15600",
+    "growth_rate": "17.5",
+    "key_insights": [
+        (
+            f"Insight {i}: connected-fitness buyers increasingly compare programs on personalization. "
+            "Adaptive plans tied to wearable data are a clear differentiator in reviews. "
+            "Competitors mostly market content volume rather than individual adaptation."
+        )
+        for i in range(10)
+    ],
+    "competitors": [
+        {
+            "name": name,
+            "positioning": (
+                f"{name} positions itself around premium instructors and a large class library. "
+                "It leaves a gap for users who want programming that adapts to recovery and "
+                "schedule, and its pricing excludes budget-conscious strength trainees."
+            ),
+        }
+        for name in ("Peloton", "Apple Fitness+", "Tonal", "Future", "Centr", "Nike Training Club")
+    ],
+}
+
+STRATEGY = {
+    "summary": "Lead with adaptive programming proof on short-form video, convert through email.",
+    "objectives": ["Reach 2M target users", "Drive 40k app installs", "Convert 8% of installs to paid"],
+    "tactics": [
+        "Creator-led 15s TikTok demos of the adaptive plan",
+        "Reels series showing a week of recovery-adjusted workouts",
+        "Sunday-evening email sequence for trial users",
+    ],
+    "channels": ["TikTok", "Instagram Reels", "Email"],
+}
+
+CONTENT = {
+    "assets": [
+        {
+            "headline": f"{channel}: Your workout, adjusted to last night's sleep",
+            "body": (
+                "Lumen reads your recovery data and rebuilds today's strength session around it. "
+                "Twenty minutes, zero guesswork, real progress you can see week over week."
+            ),
+            "call_to_action": "Start your free 14-day plan",
+            "channel": channel,
+        }
+        for channel in STRATEGY["channels"]
+    ],
+}
+
+GOAL = "Grow paid subscriptions among busy professionals"
+AUDIENCE = "Busy professionals aged 25-40"
+BUDGET = 50000.0
+
+
+def _prompts() -> dict[str, str]:
+    asset = CONTENT["assets"][0]
+    restrictions = BRAND["memory"]["brand_guidelines"]["content_restrictions"]
+    return {
+        "research": research_agent._build_user_prompt(BRAND, GOAL, AUDIENCE, BUDGET),
+        "research (refresh)": research_agent._build_user_prompt(
+            BRAND, GOAL, AUDIENCE, BUDGET, prior=RESEARCH, prior_date="2026-10-01"
+        ),
+        "strategy": strategy_agent._build_user_prompt(RESEARCH, BRAND, GOAL, AUDIENCE, BUDGET),
+        "content": content_agent._build_user_prompt(STRATEGY, BRAND, GOAL, AUDIENCE, BUDGET),
+        "content (per channel)": content_agent._build_channel_prompt(
+            "TikTok", STRATEGY, BRAND, GOAL, AUDIENCE, BUDGET
+        ),
+        "qa": qa_agent._build_user_prompt(CONTENT, BRAND, STRATEGY, GOAL, AUDIENCE),
+        "qa (per asset)": qa_agent._build_asset_prompt(
+            asset, restrictions, BRAND["tone"], GOAL, BRAND["usp"]
+        ),
+        "analytics": analytics_agent._build_user_prompt(CONTENT, STRATEGY, GOAL, AUDIENCE, BUDGET),
+    }
+
+
+def _counter():
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding("o200k_base")  # downloaded on first use
+    except Exception as exc:
+        print(f"tiktoken unavailable ({type(exc).__name__}) — estimating tokens as len/4")
+        return "len/4 estimate", lambda text: len(text) // 4
+    return "tiktoken o200k_base", lambda text: len(encoding.encode(text))
+
+
+def main() -> None:
+    label, count = _counter()
+    compact = settings.prompt_compact
+
+    settings.prompt_compact = False
+    before = {name: count(p) for name, p in _prompts().items()}
+    settings.prompt_compact = True
+    after = {name: count(p) for name, p in _prompts().items()}
+    settings.prompt_compact = compact
+
+    print(f"user-prompt tokens ({label})\n")
+    print(f"{'prompt':<24}{'before':>8}{'after':>8}{'saved':>8}")
+    for name in before:
+        saved = 1 - after[name] / before[name]
+        print(f"{name:<24}{before[name]:>8}{after[name]:>8}{saved:>8.0%}")
+    total_before, total_after = sum(before.values()), sum(after.values())
+    print(f"{'total':<24}{total_before:>8}{total_after:>8}{1 - total_after / total_before:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+# tests/conftest.py
+import sys
+
+import mongomock
+import pytest
+
+from app.core.settings import settings
+from app.db import mongodb
+from app.schemas.analytics import AnalyticsReport
+from app.schemas.content import ContentAsset, ContentOutput
+from app.schemas.qa import QAReport
+from app.schemas.research import ResearchOutput
+from app.schemas.strategy import StrategyOutput
+
+
+class _AsyncCursor:
+    """Async iteration over a mongomock cursor (pymongo async driver surface)."""
+
+    def __init__(self, cursor) -> None:
+        self._cursor = cursor
+
+    def sort(self, *args, **kwargs):
+        self._cursor = self._cursor.sort(*args, **kwargs)
+        return self
+
+    def limit(self, n):
+        self._cursor = self._cursor.limit(n)
+        return self
+
+    def __aiter__(self):
+        self._it = iter(self._cursor)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def to_list(self, length=None):
+        return list(self._cursor)
+
+
+class _AsyncCollection:
+    def __init__(self, collection) -> None:
+        self._collection = collection
+
+    def find(self, *args, **kwargs):
+        return _AsyncCursor(self._collection.find(*args, **kwargs))
+
+    def __getattr__(self, name):
+        attr = getattr(self._collection, name)
+        if not callable(attr):
+            return attr
+
+        async def call(*args, **kwargs):
+            return attr(*args, **kwargs)
+
+        return call
+
+
+class _AsyncDatabase:
+    def __init__(self, db) -> None:
+        self._db = db
+
+    def __getitem__(self, name):
+        return _AsyncCollection(self._db[name])
+
+
+_COLLECTIONS = {
+    "brands": "brands",
+    "campaigns": "campaigns",
+    "research": "research_store",
+    "checkpoints": "graph_checkpoints",
+    "checkpoint_writes": "graph_checkpoint_writes",
+}
+
+
+@pytest.fixture
+def mongo(monkeypatch):
+    """
+    A fresh mongomock database behind every app.db.mongodb getter, including
+    the copies modules imported by name. Returns the (sync) database.
+    """
+    db = mongomock.MongoClient()["test"]
+    getters = {"get_database": lambda: db, "get_async_database": lambda: _AsyncDatabase(db)}
+    for short, name in _COLLECTIONS.items():
+        getters[f"get_{short}_collection"] = lambda name=name: db[name]
+        getters[f"get_async_{short}_collection"] = lambda name=name: _AsyncCollection(db[name])
+    for module_name, module in list(sys.modules.items()):
+        if module is None or not (module_name.startswith("app.") or module is mongodb):
+            continue
+        for getter, fake in getters.items():
+            if getter in vars(module):
+                monkeypatch.setattr(module, getter, fake)
+
+    from app.db.repositories import brand_repo
+
+    brand_repo._cache.clear()
+    yield db
+    brand_repo._cache.clear()
+
+
+CHANNELS = ["Email", "TikTok"]
+
+_OUTPUTS = {
+    ResearchOutput: lambda: ResearchOutput(
+        target_audience="Gen Z mobile gamers who play daily",
+        market_size="1000",
+        growth_rate="10",
+        key_insights=["a", "b", "c"],
+        competitors=[{"name": "A", "positioning": "a"}, {"name": "B", "positioning": "b"}],
+    ),
+    StrategyOutput: lambda: StrategyOutput(
+        summary="s", objectives=["a", "b"], tactics=["a", "b", "c"], channels=list(CHANNELS)
+    ),
+    ContentOutput: lambda: ContentOutput(
+        assets=[
+            {"headline": "h", "body": "b", "call_to_action": "Sign up", "channel": c}
+            for c in CHANNELS
+        ]
+    ),
+    ContentAsset: lambda: ContentAsset(
+        headline="h", body="b", call_to_action="Sign up", channel="Email"
+    ),
+    QAReport: lambda: QAReport(passed=True),
+    AnalyticsReport: lambda: AnalyticsReport(
+        total_impressions=10,
+        total_clicks=1,
+        overall_ctr=10.0,
+        conversion_rate=1.0,
+        channel_breakdown=[{"channel_name": "Email", "impressions": 10, "clicks": 1, "ctr": 10.0}],
+    ),
+}
+
+
+class FakeLLM:
+    """
+    Stands in for every agent's LLM: returns a fixed valid object per
+    response schema. `fail` maps a schema name to a predicate over the call
+    kwargs — a matching call raises, e.g. to fail one content channel.
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.fail: dict = {}
+
+    def _respond(self, kwargs):
+        schema = kwargs["response_schema"]
+        self.calls.append(schema.__name__)
+        predicate = self.fail.get(schema.__name__)
+        if predicate is not None and predicate(kwargs):
+            raise RuntimeError(f"{schema.__name__} unavailable")
+        return _OUTPUTS[schema]()
+
+    def generate(self, **kwargs):
+        return self._respond(kwargs)
+
+    def generate_with_tools(self, **kwargs):
+        return self._respond(kwargs)
+
+    async def agenerate(self, **kwargs):
+        return self._respond(kwargs)
+
+    async def agenerate_with_tools(self, **kwargs):
+        return self._respond(kwargs)
+
+    async def astream_generate_with_tools(self, **kwargs):
+        yield self._respond(kwargs)
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    from app.services.llm.llm_factory import LLMFactory
+
+    llm = FakeLLM()
+    monkeypatch.setattr(LLMFactory, "get_llm", staticmethod(lambda agent_type: llm))
+    monkeypatch.setattr(settings, "research_reuse_enabled", False)
+    monkeypatch.setattr(settings, "qa_cache_backend", "none")
+    from app.agents import qa_agent
+
+    qa_agent.get_verdict_cache.cache_clear()
+    yield llm
+    qa_agent.get_verdict_cache.cache_clear()
+
+
+@pytest.fixture
+def brand(mongo):
+    from app.db.repositories.brand_repo import create
+
+    return create(
+        {"id": "brand-1", "name": "Acme", "industry": "Games", "tone": "bold", "usp": "Fast"}
+    )
+
+
+@pytest.fixture
+def queued_campaign(brand):
+    from app.db.repositories import campaign_repo
+
+    return campaign_repo.create(
+        {
+            "campaign_id": "campaign-1",
+            "brand_id": brand["id"],
+            "status": "queued",
+            "goal": "Drive app installs",
+            "target_audience": "Gen Z gamers",
+            "budget": 1000.0,
+            "brand_context": brand,
+        }
+    )
+
+
+@pytest.fixture
+def campaign_graph(mongo, fake_llm, monkeypatch):
+    """The shared graph, compiled against a MongoCheckpointSaver on the mongomock database."""
+    from app.graph import registry
+    from app.graph.builder import build_campaign_graph
+    from app.graph.checkpointer import MongoCheckpointSaver
+
+    monkeypatch.setattr(settings, "content_mode", "per_channel")
+    monkeypatch.setattr(settings, "content_channel_max_attempts", 1)
+    graph = build_campaign_graph(checkpointer=MongoCheckpointSaver())
+    monkeypatch.setattr(registry, "_graph", graph)
+    monkeypatch.setattr(registry, "_fingerprint", registry._model_map_fingerprint())
+    return graph
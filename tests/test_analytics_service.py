@@ -0,0 +1,91 @@
+# tests/test_analytics_service.py
+import pytest
+
+from app.agents.analytics_agent import _split_shares
+from app.schemas.analytics import BudgetSplit
+from app.services import analytics_service
+from app.services.analytics_service import default_shares, forecast
+
+CHANNELS = ["Instagram Reels", "Email newsletter", "TikTok", "Google Search Ads"]
+
+
+def _split(*allocations: tuple[str, float]) -> BudgetSplit:
+    return BudgetSplit(
+        allocations=[{"channel_name": name, "budget_share": share} for name, share in allocations]
+    )
+
+
+@pytest.mark.parametrize("budget", [0.0, 137.5, 5000.0, 250000.0])
+def test_totals_are_sums_of_rows(budget):
+    report = forecast(CHANNELS, budget, "Drive app installs", simulations=200)
+
+    rows = report.channel_breakdown
+    assert [r.channel_name for r in rows] == CHANNELS
+    assert report.total_impressions == sum(r.impressions for r in rows)
+    assert report.total_clicks == sum(r.clicks for r in rows)
+    for row in rows:
+        assert row.clicks <= row.impressions
+        assert row.ctr == (round(row.clicks / row.impressions * 100, 2) if row.impressions else 0.0)
+    expected_ctr = report.total_clicks / report.total_impressions * 100 if report.total_impressions else 0.0
+    assert report.overall_ctr == round(expected_ctr, 2)
+
+
+def test_duplicate_and_blank_channels_are_dropped():
+    report = forecast(["Email", "", "Email", "TikTok"], 1000.0)
+    assert [r.channel_name for r in report.channel_breakdown] == ["Email", "TikTok"]
+
+
+def test_default_shares_fund_every_channel():
+    shares = default_shares(CHANNELS)
+    assert shares.sum() == pytest.approx(1.0)
+    assert (shares >= 0.5 / len(CHANNELS)).all()
+
+
+def test_split_shares_fold_names_and_zero_omitted_channels():
+    split = _split(("  email   NEWSLETTER ", 30.0), ("TikTok", 50.0))
+
+    assert _split_shares(split, CHANNELS) == [0.0, 30.0, 50.0, 0.0]
+
+    report = forecast(CHANNELS, 10000.0, shares=_split_shares(split, CHANNELS))
+    rows = {r.channel_name: r for r in report.channel_breakdown}
+    assert rows["Instagram Reels"].impressions == rows["Google Search Ads"].impressions == 0
+
+
+def test_split_shares_sum_duplicate_allocations():
+    split = _split(("TikTok", 20.0), ("tiktok", 20.0), ("Email newsletter", 40.0))
+    assert _split_shares(split, ["TikTok", "Email newsletter"]) == [40.0, 40.0]
+
+    # 40/40 normalises to the same forecast as an even 50/50 split
+    halves = forecast(["TikTok", "Email newsletter"], 8000.0, shares=[40.0, 40.0])
+    assert halves == forecast(["TikTok", "Email newsletter"], 8000.0, shares=[0.5, 0.5])
+
+
+def test_all_zero_split_falls_back_to_default_shares():
+    assert forecast(CHANNELS, 5000.0, shares=[0, 0, 0, 0]) == forecast(CHANNELS, 5000.0)
+
+
+def test_monte_carlo_is_deterministic_under_seed(monkeypatch):
+    first = forecast(CHANNELS, 20000.0, "Drive app installs", simulations=500)
+    again = forecast(CHANNELS, 20000.0, "Drive app installs", simulations=500)
+    assert first.confidence_intervals == again.confidence_intervals
+
+    intervals = first.confidence_intervals
+    assert intervals.simulations == 500
+    assert intervals.total_impressions.low <= first.total_impressions <= intervals.total_impressions.high
+    assert intervals.total_clicks.low <= intervals.total_clicks.high
+
+    monkeypatch.setattr(analytics_service, "MC_SEED", analytics_service.MC_SEED + 1)
+    reseeded = forecast(CHANNELS, 20000.0, "Drive app installs", simulations=500)
+    assert reseeded.confidence_intervals != intervals
+    # only the intervals are sampled; the point forecast is unchanged
+    assert reseeded.channel_breakdown == first.channel_breakdown
+
+
+def test_no_simulations_means_no_intervals():
+    assert forecast(CHANNELS, 1000.0).confidence_intervals is None
+
+
+@pytest.mark.parametrize("channels", [[], ["", ""]])
+def test_no_channels_raises(channels):
+    with pytest.raises(ValueError, match="no channels"):
+        forecast(channels, 1000.0)
@@ -0,0 +1,33 @@
+# tests/test_campaign_job.py
+import asyncio
+
+from app.db.repositories import campaign_repo
+from app.workers.tasks import arun_campaign_job, run_campaign_job
+
+
+def _fail_tiktok(fake_llm):
+    fake_llm.fail["ContentAsset"] = lambda kwargs: "CHANNEL: TikTok" in kwargs["user_prompt"]
+
+
+def _assert_tiktok_failed(campaign):
+    assert campaign["status"] == "completed"
+    assert [a["channel"] for a in campaign["content"]["assets"]] == ["Email"]
+    assert campaign["failed_channels"] == ["TikTok"]
+    assert campaign["completed_nodes"].count("content_channel") == 1
+    assert any(r.startswith("TikTok") for r in campaign["qa_report"]["recommendations"])
+
+
+def test_failed_channel_is_persisted_and_reported(campaign_graph, fake_llm, queued_campaign):
+    _fail_tiktok(fake_llm)
+
+    assert run_campaign_job("brand-1", "campaign-1") == "completed"
+
+    _assert_tiktok_failed(campaign_repo.get_by_id("brand-1", "campaign-1"))
+
+
+def test_async_failed_channel_is_persisted_and_reported(campaign_graph, fake_llm, queued_campaign):
+    _fail_tiktok(fake_llm)
+
+    assert asyncio.run(arun_campaign_job("brand-1", "campaign-1")) == "completed"
+
+    _assert_tiktok_failed(campaign_repo.get_by_id("brand-1", "campaign-1"))
@@ -0,0 +1,44 @@
+# tests/test_campaign_repo.py
+import json
+
+from app.db.repositories import campaign_repo
+from app.tools.strategy.get_past_campaigns import get_past_campaigns
+
+
+def _campaign(campaign_id: str, status: str, i: int, brand_id: str = "b1") -> dict:
+    finished = status in campaign_repo.FINISHED_STATUSES
+    return {
+        "_id": campaign_id,
+        "brand_id": brand_id,
+        "status": status,
+        "goal": f"Goal {i}",
+        "target_audience": "Gen Z",
+        "budget": 1000.0,
+        "strategy": {"channels": ["Email"], "summary": f"Strategy {i}"} if finished else None,
+        "qa_report": {"passed": status == "completed", "issues": []} if finished else None,
+        "created_at": f"2026-01-01T00:00:{i:02d}Z",
+    }
+
+
+def test_list_recent_skips_in_flight_campaigns(mongo):
+    mongo["campaigns"].insert_many(
+        [_campaign(f"done-{i}", "completed" if i % 2 else "failed", i) for i in range(5)]
+        # the run asking for history and its batch siblings are newer
+        + [_campaign(f"live-{i}", status, 10 + i) for i, status in enumerate(("queued", "running", "error"))]
+        + [_campaign("other-brand", "completed", 30, brand_id="b2")]
+    )
+
+    recent = campaign_repo.list_recent("b1", 3, ["status", "created_at"])
+
+    assert [c["id"] for c in recent] == ["done-4", "done-3", "done-2"]
+
+
+def test_get_past_campaigns_returns_finished_history_only(mongo):
+    mongo["campaigns"].insert_many(
+        [_campaign("done", "completed", 1), _campaign("current", "running", 2)]
+    )
+
+    result = json.loads(get_past_campaigns.invoke({"brand_id": "b1"}))
+
+    assert [c["campaign_id"] for c in result["campaigns"]] == ["done"]
+    assert result["campaigns"][0]["channels_used"] == ["Email"]
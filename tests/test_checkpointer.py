@@ -0,0 +1,83 @@
+# tests/test_checkpointer.py
+import asyncio
+
+from langgraph.checkpoint.base import create_checkpoint, empty_checkpoint
+
+from app.graph.checkpointer import MongoCheckpointSaver, thread_config
+
+
+def _checkpoint(step: int, **values):
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = values
+    return create_checkpoint(checkpoint, None, step)
+
+
+def _put(saver, config, step: int, **values):
+    return saver.put(config, _checkpoint(step, **values), {"source": "loop", "step": step}, {})
+
+
+def test_put_get_list_round_trip(mongo):
+    saver = MongoCheckpointSaver()
+    first = _put(saver, thread_config("t1"), 0, research={"market_size": "1000"})
+    second = _put(saver, first, 1, strategy={"channels": ["Email"]})
+    _put(saver, thread_config("t2"), 0)
+
+    latest = saver.get_tuple(thread_config("t1"))
+    assert latest.config == second
+    assert latest.parent_config == first
+    assert latest.checkpoint["channel_values"] == {"strategy": {"channels": ["Email"]}}
+    assert latest.metadata["step"] == 1
+
+    assert saver.get_tuple(first).checkpoint["channel_values"] == {"research": {"market_size": "1000"}}
+    assert [t.config for t in saver.list(thread_config("t1"))] == [second, first]
+    assert [t.config for t in saver.list(thread_config("t1"), before=second)] == [first]
+    assert [t.config for t in saver.list(thread_config("t1"), filter={"step": 0})] == [first]
+    assert len(list(saver.list(thread_config("t1"), limit=1))) == 1
+
+
+def test_put_writes_are_pending_on_their_checkpoint(mongo):
+    saver = MongoCheckpointSaver()
+    config = _put(saver, thread_config("t1"), 0)
+    saver.put_writes(config, [("content", {"assets": []}), ("failed_channels", ["TikTok"])], "task-b")
+    saver.put_writes(config, [("research", {"market_size": "1000"})], "task-a")
+    # A retried task's regular writes keep the first attempt's value.
+    saver.put_writes(config, [("research", {"market_size": "2000"})], "task-a")
+
+    assert saver.get_tuple(config).pending_writes == [
+        ("task-a", "research", {"market_size": "1000"}),
+        ("task-b", "content", {"assets": []}),
+        ("task-b", "failed_channels", ["TikTok"]),
+    ]
+
+
+def test_delete_thread_removes_checkpoints_and_writes(mongo):
+    saver = MongoCheckpointSaver()
+    config = _put(saver, thread_config("t1"), 0)
+    saver.put_writes(config, [("research", {})], "task-a")
+    kept = _put(saver, thread_config("t2"), 0)
+
+    saver.delete_thread("t1")
+
+    assert saver.get_tuple(thread_config("t1")) is None
+    assert mongo["graph_checkpoint_writes"].count_documents({"thread_id": "t1"}) == 0
+    assert saver.get_tuple(thread_config("t2")).config == kept
+
+
+def test_async_round_trip_matches_sync(mongo):
+    saver = MongoCheckpointSaver()
+
+    async def scenario():
+        config = await saver.aput(thread_config("t1"), _checkpoint(0, goal="g"), {"step": 0}, {})
+        await saver.aput_writes(config, [("research", {"market_size": "1000"})], "task-a")
+        latest = await saver.aget_tuple(thread_config("t1"))
+        listed = [t.config async for t in saver.alist(thread_config("t1"))]
+        await saver.adelete_thread("t1")
+        return config, latest, listed, await saver.aget_tuple(thread_config("t1"))
+
+    config, latest, listed, deleted = asyncio.run(scenario())
+
+    assert latest.config == config
+    assert latest.checkpoint["channel_values"] == {"goal": "g"}
+    assert latest.pending_writes == [("task-a", "research", {"market_size": "1000"})]
+    assert listed == [config]
+    assert deleted is None
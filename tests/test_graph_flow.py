@@ -1 +1,74 @@
 # tests/test_graph_flow.py
+import pytest
+from langgraph.checkpoint.memory import InMemorySaver
+
+from app.core.settings import settings
+from app.graph import builder
+from app.graph.nodes import content_channel_node, content_node, strategy_node
+from app.schemas.content import ContentAsset
+from app.schemas.strategy import StrategyOutput
+
+CHANNELS = ["Email", "TikTok"]
+
+
+class _StrategyAgent:
+    def run(self, **kwargs):
+        return StrategyOutput(
+            summary="s", objectives=["a", "b"], tactics=["a", "b", "c"], channels=CHANNELS
+        )
+
+
+class _ContentAgent:
+    broken = True
+    calls: list[str] = []
+
+    def run_channel(self, channel, **kwargs):
+        type(self).calls.append(channel)
+        if type(self).broken:
+            raise RuntimeError("model unavailable")
+        return ContentAsset(headline="h", body="b", call_to_action="Sign up", channel=channel)
+
+
+def _passthrough(state):
+    return {}
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    monkeypatch.setattr(settings, "content_mode", "per_channel")
+    monkeypatch.setattr(settings, "content_channel_max_attempts", 1)
+    monkeypatch.setattr(strategy_node, "StrategyAgent", _StrategyAgent)
+    monkeypatch.setattr(content_channel_node, "ContentAgent", _ContentAgent)
+    monkeypatch.setattr(content_node, "ContentAgent", _ContentAgent)
+    monkeypatch.setattr(_ContentAgent, "broken", True)
+    monkeypatch.setattr(_ContentAgent, "calls", [])
+    # Only the content fan-out / merge is under test
+    for name in ("qa_node", "analytics_node", "qa_gate_node", "publish_node"):
+        monkeypatch.setattr(builder, name, _passthrough)
+    return builder.build_campaign_graph(checkpointer=InMemorySaver())
+
+
+def test_resume_after_every_channel_failed_regenerates_content(graph):
+    cfg = {"configurable": {"thread_id": "campaign-1"}}
+    initial = {
+        "campaign_id": "campaign-1",
+        "brand_context": {"id": "brand-1", "name": "Acme"},
+        "goal": "Drive installs",
+        "target_audience": "Gen Z",
+        "budget": 1000.0,
+        "research": {"target_audience": "Gen Z"},  # preloaded — research node skips
+        "channel_assets": [],
+        "failed_channels": [],
+    }
+
+    with pytest.raises(RuntimeError, match="every channel"):
+        graph.invoke(initial, cfg)
+    assert graph.get_state(cfg).next == ("content",)
+
+    _ContentAgent.broken = False
+    _ContentAgent.calls.clear()
+    graph.invoke(None, cfg)
+
+    assert sorted(_ContentAgent.calls) == sorted(CHANNELS)
+    content = graph.get_state(cfg).values["content"]
+    assert [a["channel"] for a in content["assets"]] == CHANNELS
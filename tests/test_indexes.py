@@ -0,0 +1,112 @@
+# tests/test_indexes.py
+import pytest
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+
+from app.core.settings import settings
+from app.db.indexes import (
+    INDEX_SPECS,
+    QUERY_PLAN_CHECKS,
+    check_query_plans,
+    ensure_indexes,
+    plan_problems,
+)
+from app.db.repositories import campaign_repo
+
+# Trimmed explain() output recorded from MongoDB 7 (classic engine layout).
+IXSCAN_PLAN = {
+    "queryPlanner": {
+        "winningPlan": {
+            "stage": "FETCH",
+            "inputStage": {
+                "stage": "IXSCAN",
+                "indexName": "brand_id_created_at_id",
+                "direction": "forward",
+            },
+        }
+    }
+}
+COLLSCAN_SORT_PLAN = {
+    "queryPlanner": {
+        "winningPlan": {
+            "stage": "SORT",
+            "sortPattern": {"created_at": -1, "_id": -1},
+            "inputStage": {"stage": "COLLSCAN", "direction": "forward"},
+        }
+    }
+}
+# SBE layout nests the classic tree under queryPlan.
+SBE_PLAN = {"queryPlanner": {"winningPlan": {"queryPlan": IXSCAN_PLAN["queryPlanner"]["winningPlan"]}}}
+
+
+def test_plan_problems_accepts_index_scan():
+    assert plan_problems(IXSCAN_PLAN, "brand_id_created_at_id") == []
+    assert plan_problems(SBE_PLAN, "brand_id_created_at_id") == []
+
+
+def test_plan_problems_flags_collscan_sort_and_wrong_index():
+    problems = plan_problems(COLLSCAN_SORT_PLAN, "brand_id_created_at_id")
+    assert "collection scan" in problems
+    assert "in-memory sort" in problems
+    assert plan_problems(IXSCAN_PLAN, "status") == [
+        "expected index 'status', plan used ['brand_id_created_at_id']"
+    ]
+
+
+class _RecordingCollection:
+    """Captures the filter and sort the repository sends to MongoDB."""
+
+    def __init__(self) -> None:
+        self.queries: list[tuple[dict, list | None]] = []
+
+    def find(self, query, projection=None):
+        self.queries.append((query, None))
+        return self
+
+    def sort(self, sort):
+        self.queries[-1] = (self.queries[-1][0], list(sort))
+        return self
+
+    def limit(self, n):
+        return self
+
+    def __iter__(self):
+        return iter([])
+
+
+def test_plan_checks_cover_the_campaign_list_queries(monkeypatch):
+    spy = _RecordingCollection()
+    monkeypatch.setattr(campaign_repo, "get_campaigns_collection", lambda: spy)
+    cursor = campaign_repo.encode_cursor({"created_at": "2026-01-01T00:00:00Z", "_id": "plan-check"})
+
+    campaign_repo.list_page("plan-check", 10)
+    campaign_repo.list_page("plan-check", 10, cursor)
+    campaign_repo.list_recent("plan-check", 5, ["goal"])
+
+    checked = [
+        (query, sort) for collection, query, sort, _ in QUERY_PLAN_CHECKS if collection == "campaigns"
+    ]
+    assert len(spy.queries) == 3
+    for query in spy.queries:
+        assert query in checked
+
+
+@pytest.fixture
+def mongo_db():
+    client = MongoClient(settings.mongodb_uri, serverSelectionTimeoutMS=1000)
+    try:
+        client.admin.command("ping")
+    except PyMongoError as exc:
+        client.close()
+        pytest.skip(f"no MongoDB at {settings.mongodb_uri} ({type(exc).__name__})")
+    name = f"{settings.mongodb_db_name}_test_indexes"
+    yield client[name]
+    client.drop_database(name)
+    client.close()
+
+
+def test_hot_queries_use_their_indexes(mongo_db):
+    created = ensure_indexes(mongo_db)
+    for collection, specs in INDEX_SPECS.items():
+        assert set(created[collection]) == {spec.document["name"] for spec in specs}
+    assert check_query_plans(mongo_db) == []
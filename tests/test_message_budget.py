@@ -0,0 +1,83 @@
+# tests/test_message_budget.py
+import json
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from app.services.llm.message_budget import MessageBudget, TokenCounter
+
+
+def _budget(history_tokens: int = 0, observation_tokens: int = 0) -> MessageBudget:
+    # provider=None → the characters-per-token estimate, no tokenizer download
+    return MessageBudget(TokenCounter(None), history_tokens, observation_tokens)
+
+
+def _call(call_id: str, name: str = "web_search") -> dict:
+    return {"name": name, "args": {"query": "q"}, "id": call_id}
+
+
+def test_admit_compacts_json_and_back_references_duplicates():
+    budget = _budget()
+
+    first, first_new = budget.admit(_call("call_0"), '{"results": [1, 2, 3]}')
+    # Same result with different whitespace is still a duplicate.
+    second, second_new = budget.admit(_call("call_1", "get_brand_tone"), '{ "results": [1,2,3] }')
+    other, other_new = budget.admit(_call("call_2"), "plain text result")
+
+    assert (first, first_new) == ('{"results":[1,2,3]}', True)
+    assert second_new is False
+    assert json.loads(second) == {"note": "Identical to the result of tool call call_0 above."}
+    assert (other, other_new) == ("plain text result", True)
+
+
+def _history(*step_results: list[str]) -> list:
+    messages = [SystemMessage(content="system"), HumanMessage(content="user")]
+    for step, results in enumerate(step_results):
+        ids = [f"s{step}_{i}" for i in range(len(results))]
+        messages.append(
+            AIMessage(content="", tool_calls=[{"name": "web_search", "args": {}, "id": i} for i in ids])
+        )
+        messages.extend(ToolMessage(content=r, tool_call_id=i) for r, i in zip(results, ids))
+    return messages
+
+
+def test_fit_history_truncates_older_tool_messages_first():
+    old, latest = "o" * 4000, "n" * 4000
+    messages = _history([old, old], [latest])
+
+    _budget(history_tokens=1500).fit_history(messages)
+
+    tools = [m for m in messages if isinstance(m, ToolMessage)]
+    assert [m.tool_call_id for m in tools] == ["s0_0", "s0_1", "s1_0"]
+    assert all("[truncated 3600 chars]" in m.content for m in tools[:2])
+    # the latest step's result is what the model reads next — kept whole
+    assert tools[2].content == latest
+
+
+def test_fit_history_stops_once_within_budget():
+    messages = _history(["a" * 4000], ["b" * 4000], ["c" * 400])
+
+    _budget(history_tokens=1500).fit_history(messages)
+
+    tools = [m for m in messages if isinstance(m, ToolMessage)]
+    assert "truncated" in tools[0].content
+    assert tools[1].content == "b" * 4000
+
+
+def test_fit_history_under_budget_or_unlimited_is_untouched():
+    messages = _history(["a" * 4000], ["b" * 4000])
+    snapshot = list(messages)
+
+    _budget(history_tokens=0).fit_history(messages)
+    _budget(history_tokens=100_000).fit_history(messages)
+
+    assert messages == snapshot
+
+
+def test_fit_observations_keeps_the_last_one_whole():
+    observations = ["x" * 4000, "y" * 4000, "z" * 4000]
+
+    fitted = _budget(observation_tokens=1200).fit_observations(observations)
+
+    assert all("truncated" in o for o in fitted[:2])
+    assert fitted[2] == observations[2]
+    assert observations[0] == "x" * 4000  # the caller's list is not modified
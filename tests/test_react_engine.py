@@ -0,0 +1,159 @@
+# tests/test_react_engine.py
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.tools import tool
+
+from app.core.settings import settings
+from app.services.llm.react_engine import ReActEngine
+from app.tools import CONTENT_TOOLS, STRATEGY_TOOLS, prefetch_calls
+
+
+class FakeBoundLLM:
+    """A tool-bound chat model that replays scripted AIMessages and records each turn's history."""
+
+    def __init__(self, *turns: AIMessage) -> None:
+        self.turns = list(turns)
+        self.histories: list[list] = []
+
+    def invoke(self, messages):
+        self.histories.append(list(messages))
+        return self.turns.pop(0) if self.turns else AIMessage(content="done")
+
+    async def ainvoke(self, messages):
+        return self.invoke(messages)
+
+
+def _calls(*calls: tuple[str, dict]) -> AIMessage:
+    return AIMessage(
+        content="",
+        tool_calls=[{"name": name, "args": args, "id": f"call_{i}"} for i, (name, args) in enumerate(calls)],
+    )
+
+
+def _tool_messages(messages) -> list[ToolMessage]:
+    return [m for m in messages if isinstance(m, ToolMessage)]
+
+
+# Both calls must be in flight at once to pass the barrier; a sequential
+# dispatch times out and the call comes back as a JSON error.
+_barrier = threading.Barrier(2, timeout=5)
+
+
+@tool
+def slow_lookup(query: str) -> str:
+    """Look something up slowly."""
+    _barrier.wait()
+    time.sleep(0.05)
+    return json.dumps({"query": query, "source": "slow"})
+
+
+@tool
+def fast_lookup(query: str) -> str:
+    """Look something up quickly."""
+    _barrier.wait()
+    return json.dumps({"query": query, "source": "fast"})
+
+
+@tool
+def broken_lookup(query: str) -> str:
+    """Always fails."""
+    raise RuntimeError(f"upstream down for {query}")
+
+
+@pytest.fixture(autouse=True)
+def _reset_barrier():
+    _barrier.reset()
+
+
+def test_parallel_dispatch_keeps_call_order():
+    llm = FakeBoundLLM(_calls(("slow_lookup", {"query": "a"}), ("fast_lookup", {"query": "b"})))
+    engine = ReActEngine(llm, [slow_lookup, fast_lookup], max_concurrency=2)
+
+    summary = engine.run("system", "user")
+
+    results = _tool_messages(llm.histories[-1])
+    assert [m.tool_call_id for m in results] == ["call_0", "call_1"]
+    assert [json.loads(m.content)["source"] for m in results] == ["slow", "fast"]
+    assert summary.index("[slow_lookup]") < summary.index("[fast_lookup]")
+
+
+def test_async_dispatch_keeps_call_order():
+    llm = FakeBoundLLM(_calls(("slow_lookup", {"query": "a"}), ("fast_lookup", {"query": "b"})))
+    engine = ReActEngine(llm, [slow_lookup, fast_lookup], max_concurrency=2)
+
+    asyncio.run(engine.arun("system", "user"))
+
+    results = _tool_messages(llm.histories[-1])
+    assert [json.loads(m.content)["source"] for m in results] == ["slow", "fast"]
+
+
+def test_tool_exceptions_and_unknown_tools_become_json_errors():
+    llm = FakeBoundLLM(_calls(("broken_lookup", {"query": "x"}), ("missing_tool", {})))
+    engine = ReActEngine(llm, [broken_lookup], max_concurrency=2)
+
+    engine.run("system", "user")
+
+    broken, missing = (json.loads(m.content) for m in _tool_messages(llm.histories[-1]))
+    assert broken == {"error": "upstream down for x"}
+    assert missing["error"].startswith("Unknown tool 'missing_tool'")
+    # the loop carried on to the next LLM turn
+    assert len(llm.histories) == 2
+
+
+@tool
+def brand_tone(brand_id: str) -> str:
+    """Brand tone."""
+    return json.dumps({"brand_id": brand_id, "tone": "bold"})
+
+
+@tool
+def past_campaigns(brand_id: str, limit: int = 5) -> str:
+    """Past campaigns."""
+    return json.dumps({"brand_id": brand_id, "campaigns": [], "limit": limit})
+
+
+def _prefetch(*names: str) -> list[dict]:
+    return [{"name": name, "args": {"brand_id": "b1"}} for name in names]
+
+
+def test_prefetch_covering_every_tool_skips_the_loop():
+    llm = FakeBoundLLM()
+    engine = ReActEngine(llm, [brand_tone])
+
+    summary = engine.run("system", "user", prefetch=_prefetch("brand_tone"))
+
+    assert llm.histories == []  # no LLM turn at all
+    assert '[brand_tone] → {"brand_id":"b1","tone":"bold"}' in summary
+    assert asyncio.run(engine.arun("system", "user", prefetch=_prefetch("brand_tone"))) == summary
+
+
+def test_partial_prefetch_seeds_history_and_runs_the_loop():
+    llm = FakeBoundLLM(_calls(("past_campaigns", {"brand_id": "b1", "limit": 2})))
+    engine = ReActEngine(llm, [brand_tone, past_campaigns])
+
+    summary = engine.run("system", "user", prefetch=_prefetch("brand_tone"))
+
+    seed, tone = llm.histories[0][2:]
+    assert [(c["name"], c["args"], c["id"]) for c in seed.tool_calls] == [
+        ("brand_tone", {"brand_id": "b1"}, "prefetch_0")
+    ]
+    assert tone.tool_call_id == "prefetch_0"
+    assert len(llm.histories) == 2
+    assert '"limit":2' in summary
+
+
+def test_strategy_keeps_get_past_campaigns_for_the_model(monkeypatch):
+    monkeypatch.setattr(settings, "react_prefetch", True)
+    strategy = {c["name"] for c in prefetch_calls(STRATEGY_TOOLS, "b1")}
+    content = {c["name"] for c in prefetch_calls(CONTENT_TOOLS, "b1")}
+
+    assert strategy == {"get_brand_memory", "get_brand_guidelines"}
+    assert content == {t.name for t in CONTENT_TOOLS}
+
+    monkeypatch.setattr(settings, "react_prefetch", False)
+    assert prefetch_calls(CONTENT_TOOLS, "b1") == []
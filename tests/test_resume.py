@@ -0,0 +1,97 @@
+# tests/test_resume.py
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.db.repositories import campaign_repo
+from app.main import app
+from app.services import campaign_service
+from app.workers.tasks import arun_campaign_job, run_campaign_job
+
+
+def _fail_content(fake_llm):
+    fake_llm.fail["ContentAsset"] = lambda kwargs: True
+
+
+def _assert_resumed_after_strategy(fake_llm, campaign_graph):
+    # research and strategy were read back from the checkpoint, not re-run
+    assert "ResearchOutput" not in fake_llm.calls
+    assert "StrategyOutput" not in fake_llm.calls
+    assert "ContentAsset" in fake_llm.calls
+    campaign = campaign_repo.get_by_id("brand-1", "campaign-1")
+    assert campaign["status"] == "completed"
+    assert [a["channel"] for a in campaign["content"]["assets"]] == ["Email", "TikTok"]
+    assert campaign["failed_channels"] == []
+    # the finished thread is dropped
+    assert campaign_graph.checkpointer.get_tuple({"configurable": {"thread_id": "campaign-1"}}) is None
+
+
+def test_resume_after_error_skips_completed_nodes(campaign_graph, fake_llm, queued_campaign):
+    _fail_content(fake_llm)
+    assert run_campaign_job("brand-1", "campaign-1") == "error"
+    campaign = campaign_repo.get_by_id("brand-1", "campaign-1")
+    assert campaign["status"] == "error"
+    assert {"research", "strategy"} <= set(campaign["completed_nodes"])
+
+    fake_llm.fail.clear()
+    fake_llm.calls.clear()
+    assert run_campaign_job("brand-1", "campaign-1", resume=True) == "completed"
+
+    _assert_resumed_after_strategy(fake_llm, campaign_graph)
+
+
+def test_async_resume_after_error_skips_completed_nodes(campaign_graph, fake_llm, queued_campaign):
+    _fail_content(fake_llm)
+    assert asyncio.run(arun_campaign_job("brand-1", "campaign-1")) == "error"
+
+    fake_llm.fail.clear()
+    fake_llm.calls.clear()
+    assert asyncio.run(arun_campaign_job("brand-1", "campaign-1", resume=True)) == "completed"
+
+    _assert_resumed_after_strategy(fake_llm, campaign_graph)
+
+
+class _RecordingQueue:
+    def __init__(self) -> None:
+        self.enqueued: list[tuple] = []
+
+    async def aenqueue(self, brand_id, campaign_id, *, resume=False):
+        self.enqueued.append((brand_id, campaign_id, resume))
+
+
+@pytest.fixture
+def queue(monkeypatch):
+    queue = _RecordingQueue()
+    monkeypatch.setattr(campaign_service, "get_campaign_queue", lambda: queue)
+    return queue
+
+
+def _resume(campaign_id: str = "campaign-1"):
+    return TestClient(app).post(f"/brands/brand-1/campaigns/{campaign_id}/resume")
+
+
+def test_resume_route_requeues_errored_campaign(queued_campaign, queue):
+    campaign_repo.update("campaign-1", {"status": "error", "error": "boom"})
+
+    response = _resume()
+
+    assert response.status_code == 202
+    assert response.json()["status"] == "queued"
+    assert queue.enqueued == [("brand-1", "campaign-1", True)]
+    campaign = campaign_repo.get_by_id("brand-1", "campaign-1")
+    assert campaign["status"] == "queued" and campaign["error"] is None
+
+
+@pytest.mark.parametrize("status", ["queued", "running", "completed", "failed"])
+def test_resume_route_rejects_non_error_status(queued_campaign, queue, status):
+    campaign_repo.update("campaign-1", {"status": status})
+
+    response = _resume()
+
+    assert response.status_code == 409
+    assert queue.enqueued == []
+
+
+def test_resume_route_unknown_campaign(mongo, queue):
+    assert _resume("missing").status_code == 404
@@ -0,0 +1,65 @@
+# tests/test_semantic_research_cache.py
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.settings import settings
+from app.memory.semantic_research_cache import SemanticResearchIndex, threshold_for
+from app.services.embeddings import HashingEmbedder, SentenceTransformerEmbedder
+
+BRAND = {"id": "brand-1", "name": "Acme", "industry": "Mobile Games"}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _index(embedder) -> SemanticResearchIndex:
+    return SemanticResearchIndex(embedder, threshold=threshold_for(embedder), max_entries=10)
+
+
+def _hit(index, stored: tuple[str, str], query: tuple[str, str]) -> bool:
+    index.add("stored", BRAND, *stored, research={"goal": stored[0]}, researched_at=_now())
+    return index.search(BRAND, *query, max_age_hours=1) is not None
+
+
+@pytest.fixture(scope="module")
+def sentence_embedder():
+    try:
+        return SentenceTransformerEmbedder(settings.embedding_model, local_files_only=True)
+    except Exception as exc:
+        pytest.skip(f"sentence-transformers model not available locally ({exc})")
+
+
+@pytest.mark.parametrize(
+    "stored, query",
+    [
+        (("Increase brand awareness", "Gen Z"), ("boost brand awareness", "Gen Z")),
+        (("Drive app installs", "Gen Z gamers"), ("drive installs of the app", "Gen Z gamers")),
+    ],
+)
+def test_hashing_reuses_reworded_goal(stored, query):
+    assert _hit(_index(HashingEmbedder()), stored, query)
+
+
+@pytest.mark.parametrize(
+    "stored, query",
+    [
+        (("increase brand awareness", "Millennial parents"), ("increase retention", "Millennial parents")),
+        (("reduce churn", "small businesses"), ("reduce cost per lead", "small businesses")),
+        (("Drive app installs", "Gen Z gamers"), ("Drive app installs", "retirees")),
+    ],
+)
+def test_hashing_rejects_different_goal_or_audience(stored, query):
+    assert not _hit(_index(HashingEmbedder()), stored, query)
+
+
+def test_sentence_transformers_reuses_synonymous_goal(sentence_embedder):
+    # Hashing only sees shared words, so installs ≈ downloads needs a real model.
+    stored = ("grow app installs among Gen Z", "Gen Z")
+    assert _hit(_index(sentence_embedder), stored, ("drive Gen Z downloads", "Gen Z"))
+
+
+def test_sentence_transformers_rejects_different_goal(sentence_embedder):
+    stored = ("increase brand awareness", "Millennial parents")
+    assert not _hit(_index(sentence_embedder), stored, ("increase retention", "Millennial parents"))
@@ -0,0 +1,39 @@
+# tests/test_stream_campaign.py
+import asyncio
+
+from app.db.repositories import campaign_repo
+from app.schemas.campaign import CampaignCreate
+from app.services import campaign_service
+from app.services.campaign_service import CampaignService
+from app.workers.queue import InProcessCampaignQueue
+
+
+def test_stream_waits_for_a_campaign_queue_slot(campaign_graph, fake_llm, brand, monkeypatch):
+    queue = InProcessCampaignQueue(concurrency=1)
+    monkeypatch.setattr(campaign_service, "get_campaign_queue", lambda: queue)
+    payload = CampaignCreate(
+        brand_id="brand-1", goal="Drive app installs", target_audience="Gen Z", budget=1000.0
+    )
+
+    async def scenario():
+        slot = queue.job_slot()
+        await slot.acquire()  # a queued job holds the only slot
+        events = CampaignService().astream_campaign(payload)
+
+        first = await anext(events)
+        campaign_id = first["data"]["id"]
+        await asyncio.sleep(0.05)
+        waiting = await campaign_repo.aget_by_id("brand-1", campaign_id)
+        calls_while_waiting = list(fake_llm.calls)
+
+        slot.release()
+        rest = [event async for event in events]
+        return first, waiting, calls_while_waiting, rest
+
+    first, waiting, calls_while_waiting, rest = asyncio.run(scenario())
+
+    assert first == {"event": "campaign", "data": {"id": first["data"]["id"], "status": "queued"}}
+    assert waiting["status"] == "queued"
+    assert calls_while_waiting == []
+    assert rest[0]["event"] == "campaign" and rest[0]["data"]["status"] == "running"
+    assert rest[-1]["event"] == "done" and rest[-1]["data"]["status"] == "completed"
@@ -1 +1,73 @@
 # tests/test_validators.py
+import pytest
+
+from app.validators.compliance_validator import parse_restriction, validate
+from app.validators.rule_engine import run_rules
+
+
+def _asset(body: str) -> dict:
+    return {"headline": "h", "body": body, "call_to_action": "Sign up", "channel": "Email"}
+
+
+@pytest.mark.parametrize(
+    "restriction, expected",
+    [
+        ("Avoid 'guaranteed results'", ("guaranteed results", True)),
+        ('Never say "cure"', ("cure", True)),
+        ("Don't use the words risk free", ("risk free", True)),
+        ("No alcohol", ("alcohol", False)),
+        ("Avoid medical claims", ("medical claims", False)),
+        ("No before/after body imagery", ("before/after body imagery", False)),
+    ],
+)
+def test_parse_restriction(restriction, expected):
+    assert parse_restriction(restriction) == expected
+
+
+def test_exact_phrase_hit_is_hard():
+    hard, soft = validate(_asset("Guaranteed results in 30 days"), ["Avoid 'guaranteed results'"])
+    assert len(hard) == 1 and "guaranteed results" in hard[0]
+    assert soft == []
+
+
+def test_negated_exact_phrase_hit_is_soft():
+    hard, soft = validate(
+        _asset("We never promise guaranteed results."), ["Avoid 'guaranteed results'"]
+    )
+    assert hard == []
+    assert len(soft) == 1
+
+
+@pytest.mark.parametrize("body", ["No medical claims here.", "Our medical claims are backed."])
+def test_category_restriction_hit_is_soft(body):
+    hard, soft = validate(_asset(body), ["Avoid medical claims"])
+    assert hard == []
+    assert len(soft) == 1
+
+
+def test_bare_single_word_hit_is_soft():
+    hard, soft = validate(_asset("Pairs perfectly with alcohol."), ["No alcohol"])
+    assert hard == []
+    assert len(soft) == 1
+
+
+@pytest.mark.parametrize("body", ["Totally alcohol-free!", "Alcohol free cocktails for summer"])
+def test_free_suffix_hit_is_ignored(body):
+    assert validate(_asset(body), ["No alcohol", "Never use the word alcohol"]) == ([], [])
+
+
+def test_channel_mismatch_is_a_note_unless_strict():
+    asset = {**_asset("Watch the reel"), "channel": "Instagram Reels"}
+
+    lenient = run_rules([asset], [], ["Instagram"])
+    assert not lenient.blocking
+    assert "planned channels" in lenient.notes()[0]
+
+    strict = run_rules([asset], [], ["Instagram"], strict_channels=True)
+    assert strict.blocking
+
+
+def test_category_hit_goes_to_reviewer_not_blocking():
+    findings = run_rules([_asset("no medical claims here")], ["Avoid medical claims"], ["Email"])
+    assert not findings.blocking
+    assert "Avoid medical claims" in findings.notes()[0]